@@ -1,4 +1,5 @@
 """Query parser for AI search using OLLAMA LLM."""
+import asyncio
 import json
 import re
 from typing import Dict, Optional
@@ -438,9 +439,6 @@ class AISearchQueryParser:
         
         if OLLAMA_CLIENT_AVAILABLE:
             try:
-                import asyncio
-                loop = asyncio.get_event_loop()
-                
                 def _generate():
                     client = ollama.Client(
                         host=self.ollama_host.replace("http://", "").replace("https://", "")
@@ -455,7 +453,7 @@ class AISearchQueryParser:
                     )
                     return {"response": response.get("response", "")}
                 
-                result = await loop.run_in_executor(None, _generate)
+                result = await asyncio.to_thread(_generate)
                 logger.debug("Successfully used OLLAMA Python client for query parsing")
             except Exception as e:
                 logger.warning(f"OLLAMA Python client failed, falling back to HTTP API: {e}")
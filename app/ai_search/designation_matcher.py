@@ -1,4 +1,5 @@
 """Service for matching candidate designations with query designations using OLLAMA LLM."""
+import asyncio
 import json
 import re
 from typing import Optional, Tuple
@@ -136,9 +137,6 @@ class DesignationMatcher:
             result = None
             if OLLAMA_CLIENT_AVAILABLE:
                 try:
-                    import asyncio
-                    loop = asyncio.get_event_loop()
-                    
                     def _generate():
                         client = ollama.Client(
                             host=self.ollama_host.replace("http://", "").replace("https://", "")
@@ -157,7 +155,7 @@ class DesignationMatcher:
                         raw = response.get("response", "") if isinstance(response, dict) else str(response)
                         return {"response": raw}
                     
-                    result = await loop.run_in_executor(None, _generate)
+                    result = await asyncio.to_thread(_generate)
                     logger.debug("Successfully used OLLAMA Python client for designation matching")
                 except Exception as e:
                     logger.warning(f"OLLAMA Python client failed, falling back to HTTP API: {e}")
@@ -28,6 +28,14 @@ class Settings(BaseSettings):
     pinecone_index_name: str = Field("ats", alias="PINECONE_INDEX_NAME")
     pinecone_cloud: str = Field("aws", alias="PINECONE_CLOUD")
     pinecone_region: str = Field("us-east-1", alias="PINECONE_REGION")
+    pinecone_upsert_batch_size: int = Field(100, alias="PINECONE_UPSERT_BATCH_SIZE")
+    pinecone_upsert_concurrency: int = Field(8, alias="PINECONE_UPSERT_CONCURRENCY")  # Batches in flight per insert
+    pinecone_pool_threads: int = Field(30, alias="PINECONE_POOL_THREADS")
+    pinecone_pool_maxsize: int = Field(30, alias="PINECONE_POOL_MAXSIZE")
+    pinecone_use_grpc: bool = Field(False, alias="PINECONE_USE_GRPC")  # Requires pinecone-client[grpc]
+    pinecone_max_concurrency: int = Field(32, alias="PINECONE_MAX_CONCURRENCY")  # Threads for blocking SDK calls
+    pinecone_namespace_cache_ttl: float = Field(30.0, alias="PINECONE_NAMESPACE_CACHE_TTL")  # Seconds
+    index_concurrency: int = Field(8, alias="INDEX_CONCURRENCY")  # Resumes indexed in parallel
     
     # OLLAMA Configuration
     ollama_host: str = Field("http://localhost:11434", alias="OLLAMA_HOST")
@@ -35,10 +43,27 @@ class Settings(BaseSettings):
     
     # Memory Optimization Settings
     embedding_batch_size: int = Field(5, alias="EMBEDDING_BATCH_SIZE")
+    embedding_bulk_batch_size: int = Field(64, alias="EMBEDDING_BULK_BATCH_SIZE")  # Chunks per /api/embed request
     max_file_size_mb: int = Field(10, alias="MAX_FILE_SIZE_MB")
+    pdf_spill_threshold_mb: int = Field(50, alias="PDF_SPILL_THRESHOLD_MB")  # Larger PDFs are parsed from a temp file
+    pdf_max_pages: int = Field(200, alias="PDF_MAX_PAGES")  # Pages beyond this are not extracted or OCRed
+    ocr_page_timeout_seconds: float = Field(60.0, alias="OCR_PAGE_TIMEOUT_SECONDS")  # Per-page OCR budget
     max_resume_text_length: int = Field(50000, alias="MAX_RESUME_TEXT_LENGTH")
+    ocr_process_workers: int = Field(0, alias="OCR_PROCESS_WORKERS")  # Page-parallel OCR processes; 0 = half the CPUs
+    ocr_dpi: int = Field(150, alias="OCR_DPI")  # First-pass render resolution for scanned PDF pages
+    ocr_escalation_dpi: int = Field(300, alias="OCR_ESCALATION_DPI")  # Re-render resolution for low-confidence pages
+    ocr_min_confidence: float = Field(70.0, alias="OCR_MIN_CONFIDENCE")  # Mean Tesseract word confidence (0-100)
     job_cache_max_size: int = Field(100, alias="JOB_CACHE_MAX_SIZE")
+    embedding_cache_max_size: int = Field(2048, alias="EMBEDDING_CACHE_MAX_SIZE")
+    extraction_cache_max_size: int = Field(512, alias="EXTRACTION_CACHE_MAX_SIZE")
     enable_memory_cleanup: bool = Field(True, alias="ENABLE_MEMORY_CLEANUP")
+    gc_cleanup_every_n_batches: int = Field(4, alias="GC_CLEANUP_EVERY_N_BATCHES")
+    category_cache_max_size: int = Field(1024, alias="CATEGORY_CACHE_MAX_SIZE")
+    category_cache_ttl_seconds: float = Field(7 * 24 * 3600, alias="CATEGORY_CACHE_TTL_SECONDS")
+    category_cache_dir: Optional[str] = Field(None, alias="CATEGORY_CACHE_DIR")  # e.g. .cache/category; unset = memory only
+    query_cache_max_size: int = Field(1024, alias="QUERY_CACHE_MAX_SIZE")
+    query_cache_threshold: float = Field(0.97, alias="QUERY_CACHE_THRESHOLD")  # Min cosine similarity for a hit
+    query_cache_ttl_seconds: float = Field(300, alias="QUERY_CACHE_TTL_SECONDS")  # Bounds staleness in workers that didn't index
     
     # Monitoring
     sentry_dsn: Optional[str] = Field(None, alias="SENTRY_DSN")
@@ -1,5 +1,6 @@
 """FastAPI application bootstrap."""
 import asyncio
+import gc
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,6 +14,7 @@ from app.config import settings
 from app.api.routes import router
 from app.database.connection import init_db, close_db
 from app.services.vector_db_service import get_vector_db_service
+from app.services.pinecone_automation import shutdown_executor as shutdown_pinecone_executor
 from app.utils.logging import setup_logging, get_logger
 
 # Initialize logging
@@ -51,6 +53,11 @@ async def lifespan(app: FastAPI):
         # Store vector_db in app state for dependency injection
         app.state.vector_db = vector_db
         
+        # Move startup objects (settings, clients, models) to the permanent generation
+        # so later collections stop rescanning them
+        if settings.enable_memory_cleanup:
+            gc.freeze()
+        
         logger.info("Application startup complete")
     
     except Exception as e:
@@ -62,6 +69,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down ATS Backend application")
     await close_db()
+    shutdown_pinecone_executor()
     logger.info("Application shutdown complete")
 
 
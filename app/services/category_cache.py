@@ -0,0 +1,105 @@
+"""Content-addressable cache for LLM category extraction results."""
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import orjson
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CategoryCache:
+    """
+    In-memory LRU cache of extracted categories with TTL, optionally mirrored to disk.
+    
+    Entries are keyed by a SHA-256 of (mastercategory, resume text), so re-uploads and
+    retries of the same resume skip the LLM call. When a cache directory is configured,
+    each entry is also written as <key>.json so hits survive restarts.
+    """
+    
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        cache_dir: Optional[str] = None
+    ):
+        self.max_size = max_size or settings.category_cache_max_size
+        self.ttl_seconds = ttl_seconds or settings.category_cache_ttl_seconds
+        cache_dir = cache_dir or settings.category_cache_dir
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # key -> (expires_at epoch seconds, category); plain dict in LRU order
+        self._cache: Dict[str, Tuple[float, str]] = {}
+    
+    @staticmethod
+    def make_key(mastercategory: str, resume_text: str) -> str:
+        """Build a cache key from the mastercategory and resume text."""
+        return hashlib.sha256(f"{mastercategory}|{resume_text}".encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """Retrieve a cached category, or None if missing or expired."""
+        entry = self._cache.pop(key, None)
+        if entry is None and self.cache_dir:
+            entry = self._read_disk(key)
+        
+        if entry is None:
+            return None
+        
+        expires_at, category = entry
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        
+        # Re-insert at the end (most recently used)
+        self._remember(key, entry)
+        return category
+    
+    def set(self, key: str, category: str) -> None:
+        """Store a category for the TTL."""
+        entry = (time.time() + self.ttl_seconds, category)
+        self._cache.pop(key, None)
+        self._remember(key, entry)
+        
+        if self.cache_dir:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._path(key).write_bytes(orjson.dumps({"category": category, "expiresAt": entry[0]}))
+            except OSError as e:
+                logger.warning(f"Failed to write category cache entry: {e}", extra={"error": str(e)})
+    
+    def delete(self, key: str) -> None:
+        """Remove a cached category from memory and disk."""
+        self._cache.pop(key, None)
+        if self.cache_dir:
+            try:
+                self._path(key).unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def _remember(self, key: str, entry: Tuple[float, str]) -> None:
+        while len(self._cache) >= self.max_size:
+            # Remove least recently used (first item)
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = entry
+    
+    def _read_disk(self, key: str) -> Optional[Tuple[float, str]]:
+        try:
+            data = orjson.loads(self._path(key).read_bytes())
+            return float(data["expiresAt"]), data["category"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable category cache entry {key}: {e}")
+            return None
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Global category cache instance (PineconeAutomation is created per request)
+category_cache = CategoryCache()
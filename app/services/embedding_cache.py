@@ -0,0 +1,79 @@
+"""In-memory LRU cache for text embeddings keyed by content hash."""
+import hashlib
+from typing import Dict, Optional
+import numpy as np
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import blake3 (SIMD-parallel hashing) for cache keys
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    logger.debug("blake3 not available. Embedding cache keys will use hashlib.blake2b.")
+
+
+class EmbeddingCache:
+    """Simple in-memory cache for normalized embeddings with LRU eviction."""
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or settings.embedding_cache_max_size
+        # Plain dict preserves insertion order: first key is least recently used
+        self._cache: Dict[str, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Build a cache key from the model name and a 128-bit digest of the text."""
+        data = text.encode("utf-8")
+        if BLAKE3_AVAILABLE:
+            digest = blake3(data).hexdigest(length=16)
+        else:
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return f"{model}:{digest}"
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Retrieve embedding from cache (moves to end for LRU)."""
+        embedding = self._cache.pop(key, None)
+        if embedding is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Re-insert at the end (most recently used)
+            self._cache[key] = embedding
+        return embedding
+    
+    def put(self, key: str, embedding: np.ndarray) -> None:
+        """Store embedding in cache with LRU eviction if cache is full."""
+        if self._cache.pop(key, None) is None and len(self._cache) >= self.max_size:
+            # Remove least recently used (first item)
+            evicted_key = next(iter(self._cache))
+            del self._cache[evicted_key]
+            logger.debug(
+                f"Embedding cache full, evicted: {evicted_key}",
+                extra={"evicted_key": evicted_key, "cache_size": len(self._cache)}
+            )
+        
+        # Cached arrays are handed out without copying; freeze them so callers can't mutate shared state
+        embedding.flags.writeable = False
+        self._cache[key] = embedding
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+    
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        self._cache.clear()
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Global embedding cache instance (shared across EmbeddingService instances)
+embedding_cache = EmbeddingCache()
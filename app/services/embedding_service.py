@@ -1,16 +1,25 @@
 """Service for generating embeddings using OLLAMA."""
 import asyncio
 import gc
-from typing import List, Optional
+import time
+from itertools import islice
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
 import httpx
 from httpx import Timeout
 import numpy as np
+import orjson
 
 from app.config import settings
+from app.services.embedding_cache import embedding_cache
+from app.services.embedding_kernels import get_l2_normalizer, l2_normalize_rows
+from app.utils.http_json import post_json
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# How long a /api/tags listing is reused when resolving the embedding model
+MODEL_TAGS_TTL_SECONDS = 60.0
+
 
 class EmbeddingService:
     """Service for generating embeddings using OLLAMA API."""
@@ -21,67 +30,101 @@ class EmbeddingService:
         self.fallback_model = "mxbai-embed-large"
         self.model = None
         self.embedding_dimension = settings.embedding_dimension
+        self._init_lock = asyncio.Lock()
+        self._tag_cache: Optional[Tuple[float, Set[str]]] = None
+        self._normalize_rows = l2_normalize_rows
+        # None = unknown, False = OLLAMA has no batched /api/embed endpoint (older versions)
+        self._batch_supported: Optional[bool] = None
     
     async def _initialize_model(self) -> str:
         """Check which embedding model is available and set it."""
         if self.model:
             return self.model
         
-        # Try primary model first
-        if await self._check_model_available(self.primary_model):
-            self.model = self.primary_model
-            logger.info(f"Using embedding model: {self.primary_model}")
+        # Serialize concurrent initializers so only one /api/tags request is made
+        async with self._init_lock:
+            if self.model:
+                return self.model
+            
+            # Try primary model first
+            if await self._check_model_available(self.primary_model):
+                model = self.primary_model
+                logger.info(f"Using embedding model: {self.primary_model}")
+            # Fallback to secondary model
+            elif await self._check_model_available(self.fallback_model):
+                model = self.fallback_model
+                logger.warning(f"Primary model unavailable, using fallback: {self.fallback_model}")
+            else:
+                raise RuntimeError(f"Neither {self.primary_model} nor {self.fallback_model} is available")
+            
+            # Dimension is fixed from here on; compile a kernel specialized for it
+            # before publishing the model so fast-path callers never see a half-initialized service
+            self._normalize_rows = get_l2_normalizer(self.embedding_dimension)
+            self.model = model
             return self.model
+    
+    async def _get_model_names(self) -> Set[str]:
+        """Fetch installed model names from /api/tags, reusing a recent result."""
+        now = time.monotonic()
+        if self._tag_cache and now - self._tag_cache[0] < MODEL_TAGS_TTL_SECONDS:
+            return self._tag_cache[1]
         
-        # Fallback to secondary model
-        if await self._check_model_available(self.fallback_model):
-            self.model = self.fallback_model
-            logger.warning(f"Primary model unavailable, using fallback: {self.fallback_model}")
-            return self.model
+        async with httpx.AsyncClient(timeout=Timeout(10.0)) as client:
+            response = await client.get(f"{self.ollama_host}/api/tags")
+            response.raise_for_status()
+            models = orjson.loads(response.content).get("models", [])
         
-        raise RuntimeError(f"Neither {self.primary_model} nor {self.fallback_model} is available")
+        names = {m.get("name", "") for m in models}
+        self._tag_cache = (now, names)
+        return names
     
     async def _check_model_available(self, model_name: str) -> bool:
         """Check if a model is available via OLLAMA."""
         try:
-            async with httpx.AsyncClient(timeout=Timeout(10.0)) as client:
-                response = await client.get(f"{self.ollama_host}/api/tags")
-                response.raise_for_status()
-                models = response.json().get("models", [])
-                available = any(m.get("name", "").startswith(model_name) for m in models)
-                return available
+            names = await self._get_model_names()
+            # Exact match first; tags like "nomic-embed-text:latest" need the prefix check
+            return model_name in names or any(name.startswith(model_name) for name in names)
         except Exception as e:
             logger.warning(f"Failed to check model availability: {e}", extra={"model": model_name})
             return False
     
-    async def generate_embedding(self, text: str, retries: int = 3) -> List[float]:
-        """Generate embedding for a single text with retry logic."""
+    async def generate_embedding(self, text: str, retries: int = 3) -> np.ndarray:
+        """
+        Generate embedding for a single text with retry logic.
+        Returns a normalized, read-only float32 ndarray (shared with the embedding cache).
+        """
         await self._initialize_model()
         
+        # Overlapping chunks and boilerplate text repeat often; skip the OLLAMA call on a hit
+        cache_key = embedding_cache.make_key(self.model, text)
+        cached = embedding_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        embedding_array = await self._embed_one(text, retries)
+        embedding_cache.put(cache_key, embedding_array)
+        return embedding_array
+    
+    async def _embed_one(self, text: str, retries: int = 3) -> np.ndarray:
+        """Embed one text with /api/embeddings, bypassing the cache (callers look up and store)."""
         for attempt in range(retries):
             try:
                 async with httpx.AsyncClient(timeout=Timeout(600.0)) as client:
-                    response = await client.post(
+                    result = await post_json(
+                        client,
                         f"{self.ollama_host}/api/embeddings",
-                        json={
+                        {
                             "model": self.model,
                             "prompt": text,
                         }
                     )
-                    response.raise_for_status()
-                    result = response.json()
-                    embedding = result.get("embedding", [])
+                    embedding = result.get("embedding")
                     
                     if not embedding:
                         raise ValueError("Empty embedding returned")
                     
-                    # Normalize embedding
-                    embedding_array = np.array(embedding)
-                    norm = np.linalg.norm(embedding_array)
-                    if norm > 0:
-                        embedding_array = embedding_array / norm
-                    
-                    return embedding_array.tolist()
+                    # Normalize embedding (parsed floats go straight into a float32 array)
+                    return self._normalize_rows(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
                     
             except Exception as e:
                 if attempt < retries - 1:
@@ -97,50 +140,145 @@ class EmbeddingService:
         
         raise RuntimeError("Failed to generate embedding")
     
-    def chunk_text(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None) -> List[str]:
-        """Split text into overlapping chunks."""
+    async def _embed_batch(self, texts: List[str], retries: int = 3) -> Optional[np.ndarray]:
+        """
+        Embed texts with one /api/embed request.
+        
+        Returns:
+            Normalized (len(texts), D) float32 matrix, or None if the endpoint is unavailable
+        """
+        for attempt in range(retries):
+            try:
+                async with httpx.AsyncClient(timeout=Timeout(600.0)) as client:
+                    result = await post_json(
+                        client,
+                        f"{self.ollama_host}/api/embed",
+                        {
+                            "model": self.model,
+                            "input": texts,
+                        }
+                    )
+                embeddings = result.get("embeddings")
+                if not embeddings or len(embeddings) != len(texts):
+                    raise ValueError("Embedding count does not match input count")
+                
+                self._batch_supported = True
+                return self._normalize_rows(np.asarray(embeddings, dtype=np.float32))
+            
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    logger.warning("OLLAMA /api/embed not found, embedding texts one at a time")
+                    self._batch_supported = False
+                    return None
+                error = e
+            except Exception as e:
+                error = e
+            
+            if attempt < retries - 1:
+                wait_time = 2 ** attempt  # Exponential backoff
+                logger.warning(
+                    f"Batch embedding failed, retrying in {wait_time}s: {error}",
+                    extra={"attempt": attempt + 1, "batch_size": len(texts), "error": str(error)}
+                )
+                await asyncio.sleep(wait_time)
+        
+        logger.error(f"Failed to generate batch embeddings after {retries} attempts: {error}")
+        raise RuntimeError(f"Failed to generate batch embeddings: {error}")
+    
+    async def generate_embeddings(self, texts: List[str], retries: int = 3) -> List[np.ndarray]:
+        """
+        Generate embeddings for many texts, one OLLAMA request for all cache misses.
+        Falls back to per-text requests when the OLLAMA server has no /api/embed.
+        """
+        await self._initialize_model()
+        
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        keys = [embedding_cache.make_key(self.model, text) for text in texts]
+        misses = []
+        for i, key in enumerate(keys):
+            cached = embedding_cache.get(key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                misses.append(i)
+        
+        if misses and self._batch_supported is not False:
+            matrix = await self._embed_batch([texts[i] for i in misses], retries)
+            if matrix is not None:
+                for i, row in zip(misses, matrix):
+                    embedding_cache.put(keys[i], row)
+                    embeddings[i] = row
+                misses = []
+        
+        # Already looked up above, so go straight to OLLAMA (keeps cache hit/miss counts exact)
+        for i in misses:
+            embeddings[i] = await self._embed_one(texts[i], retries)
+            embedding_cache.put(keys[i], embeddings[i])
+        
+        return embeddings
+    
+    def iter_chunks(
+        self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily yield overlapping chunks as (start_offset, chunk) tuples.
+        Offsets are computed arithmetically so only one chunk is materialized at a time.
+        """
         if chunk_size is None:
             chunk_size = settings.chunk_size
         if chunk_overlap is None:
             chunk_overlap = settings.chunk_overlap
         
-        if len(text) <= chunk_size:
-            return [text]
-        
-        chunks = []
-        start = 0
+        text_length = len(text)
+        if text_length <= chunk_size:
+            yield 0, text
+            return
         
-        while start < len(text):
+        # Move start by chunk_size - overlap for next chunk
+        step = chunk_size - chunk_overlap
+        for start in range(0, text_length, step):
             end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            
-            if end >= len(text):
+            yield start, text[start:end]
+            if end >= text_length:
                 break
-            
-            # Move start by chunk_size - overlap for next chunk
-            start += chunk_size - chunk_overlap
+    
+    def count_chunks(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None) -> int:
+        """Number of chunks iter_chunks will yield, without materializing them."""
+        if chunk_size is None:
+            chunk_size = settings.chunk_size
+        if chunk_overlap is None:
+            chunk_overlap = settings.chunk_overlap
         
-        return chunks
+        text_length = len(text)
+        if text_length <= chunk_size:
+            return 1
+        step = chunk_size - chunk_overlap
+        return -(-(text_length - chunk_size) // step) + 1
+    
+    def chunk_text(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None) -> List[str]:
+        """Split text into overlapping chunks."""
+        return [chunk for _, chunk in self.iter_chunks(text, chunk_size, chunk_overlap)]
     
     async def generate_chunk_embeddings(self, text: str, metadata: Optional[dict] = None) -> List[dict]:
         """
         Generate embeddings for text chunks in memory-efficient batches.
         Returns list of dicts with 'embedding', 'text', and 'metadata'.
         """
-        chunks = self.chunk_text(text)
+        chunk_count = self.count_chunks(text)
         batch_size = settings.embedding_batch_size
         logger.info(
-            f"Generating embeddings for {len(chunks)} chunks (batch size: {batch_size})",
-            extra={"chunk_count": len(chunks), "text_length": len(text), "batch_size": batch_size}
+            f"Generating embeddings for {chunk_count} chunks (batch size: {batch_size})",
+            extra={"chunk_count": chunk_count, "text_length": len(text), "batch_size": batch_size}
         )
         
         embeddings = []
+        chunk_iter = (chunk for _, chunk in self.iter_chunks(text))
         
-        # Process chunks in batches to reduce memory usage
-        for batch_start in range(0, len(chunks), batch_size):
-            batch_end = min(batch_start + batch_size, len(chunks))
-            batch_chunks = chunks[batch_start:batch_end]
+        # Process chunks in batches to reduce memory usage; the full chunk list is never resident
+        for batch_start in range(0, chunk_count, batch_size):
+            batch_chunks = list(islice(chunk_iter, batch_size))
+            if not batch_chunks:
+                break
             
             batch_embeddings = []
             for idx, chunk in enumerate(batch_chunks):
@@ -162,12 +300,71 @@ class EmbeddingService:
             
             embeddings.extend(batch_embeddings)
             
-            # Memory cleanup after each batch
-            if settings.enable_memory_cleanup:
-                del batch_chunks
-                del batch_embeddings
-                gc.collect()
+            # Young-generation collection every N batches; a full collection would rescan
+            # every long-lived object (caches, app state) on each batch
+            batch_number = batch_start // batch_size + 1
+            if settings.enable_memory_cleanup and batch_number % settings.gc_cleanup_every_n_batches == 0:
+                gc.collect(0)
         
         return embeddings
-
-
+    
+    async def generate_chunk_embeddings_bulk(
+        self,
+        items: List[Tuple[Hashable, str, Optional[dict]]],
+        batch_size: Optional[int] = None
+    ) -> Dict[Hashable, List[dict]]:
+        """
+        Chunk and embed several documents together.
+        
+        Chunks from all documents are flattened and embedded in batches of `batch_size`
+        (one OLLAMA request per batch instead of one per chunk), then regrouped by document.
+        
+        Args:
+            items: (key, text, metadata) per document, e.g. (resume_id, resume_text, metadata)
+            batch_size: Chunks per embedding request (defaults to settings.embedding_bulk_batch_size)
+        
+        Returns:
+            key -> list of dicts with 'embedding', 'text', 'chunk_index' and 'metadata'
+            (same shape as generate_chunk_embeddings). A document with any chunk in a failed
+            batch is left out entirely, so callers never index a partial document.
+        """
+        if batch_size is None:
+            batch_size = settings.embedding_bulk_batch_size
+        
+        results: Dict[Hashable, List[dict]] = {key: [] for key, _, _ in items}
+        failed_keys = set()
+        flat = (
+            (key, chunk_idx, chunk, metadata)
+            for key, text, metadata in items
+            for chunk_idx, (_, chunk) in enumerate(self.iter_chunks(text))
+        )
+        
+        while True:
+            batch = list(islice(flat, batch_size))
+            if not batch:
+                break
+            
+            try:
+                embeddings = await self.generate_embeddings([chunk for _, _, chunk, _ in batch])
+            except Exception as e:
+                batch_keys = {key for key, _, _, _ in batch}
+                logger.error(
+                    f"Failed to generate embeddings for a batch of {len(batch)} chunks "
+                    f"({len(batch_keys)} documents): {e}",
+                    extra={"batch_size": len(batch), "keys": list(batch_keys), "error": str(e)}
+                )
+                # Every document spanned by the batch is incomplete; continue with other batches
+                failed_keys.update(batch_keys)
+                continue
+            
+            for (key, chunk_idx, chunk, metadata), embedding in zip(batch, embeddings):
+                results[key].append({
+                    "embedding": embedding,
+                    "text": chunk,
+                    "chunk_index": chunk_idx,
+                    "metadata": metadata or {},
+                })
+        
+        for key in failed_keys:
+            del results[key]
+        return results
@@ -0,0 +1,55 @@
+"""Content-addressable cache for text extracted from uploaded resume files."""
+import hashlib
+import os
+from typing import Dict, Optional
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractionCache:
+    """
+    In-memory LRU cache of extracted text keyed by a SHA-256 of the file bytes.
+
+    Re-submitted and forwarded duplicates of the same file skip PDF parsing and OCR.
+    The extension is part of the key because it selects the extraction pipeline.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or settings.extraction_cache_max_size
+        # Plain dict preserves insertion order: first key is least recently used
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def make_key(file_content: bytes, filename: str) -> str:
+        """Build a cache key from the file content hash and the file extension."""
+        ext = os.path.splitext(filename.lower())[1]
+        return f"{hashlib.sha256(file_content).hexdigest()}{ext}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Retrieve extracted text from cache (moves to end for LRU)."""
+        text = self._cache.pop(key, None)
+        if text is not None:
+            # Re-insert at the end (most recently used)
+            self._cache[key] = text
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store extracted text with LRU eviction if cache is full."""
+        if self._cache.pop(key, None) is None and len(self._cache) >= self.max_size:
+            # Remove least recently used (first item)
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = text
+
+    def clear(self) -> None:
+        """Remove all cached text."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Global extraction cache instance (ResumeParser is created per request)
+extraction_cache = ExtractionCache()
@@ -1,7 +1,11 @@
 """Service for converting file formats, particularly .doc to .docx using pandoc."""
+import atexit
 import os
+import socket
 import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -36,8 +40,171 @@ else:
     print(f"[DEBUG] {debug_msg}")  # Print to console for visibility
     logger.debug(debug_msg)
 
+# Prefer a RAM-backed tmpfs for conversion scratch files so the LibreOffice
+# round-trip (write input, convert, read output) never touches the disk
+RAM_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
 
-def doc_to_docx_with_libreoffice(doc_path: str, output_path: Optional[str] = None) -> Optional[str]:
+# Check for unoserver (persistent LibreOffice daemon + unoconvert client)
+UNOSERVER_AVAILABLE = shutil.which("unoserver") is not None and shutil.which("unoconvert") is not None
+if not UNOSERVER_AVAILABLE:
+    logger.debug("unoserver not found. LibreOffice will be cold-started for every conversion.")
+
+
+class LibreOfficePool:
+    """
+    Persistent LibreOffice headless daemon driven through unoserver.
+    
+    The daemon is launched on first use and reused for every conversion, so the
+    LibreOffice startup cost (process init, font cache, UNO bootstrap) is paid once
+    instead of per document. A dead or unresponsive daemon is restarted on demand.
+    
+    The ports are fixed, so API worker processes share one daemon: whichever worker
+    finds the port closed starts it, and the others attach to the daemon already listening.
+    """
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 2003,
+        uno_port: int = 2002,
+        startup_timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.uno_port = uno_port
+        self.startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _port_open(self) -> bool:
+        """Check whether the daemon's XML-RPC port accepts connections."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=1.0):
+                return True
+        except OSError:
+            return False
+    
+    def is_healthy(self) -> bool:
+        """Return True if a daemon (ours or another worker's) is accepting connections."""
+        return self._port_open()
+    
+    def _start(self) -> None:
+        """Launch the daemon and wait until it accepts connections. Caller must hold the lock."""
+        self._stop()
+        if self._port_open():
+            logger.info(f"Attaching to the LibreOffice daemon already listening on {self.host}:{self.port}")
+            return
+        logger.info(
+            f"Starting LibreOffice daemon via unoserver on {self.host}:{self.port}",
+            extra={"host": self.host, "port": self.port, "uno_port": self.uno_port}
+        )
+        self._process = subprocess.Popen(
+            [
+                "unoserver",
+                "--interface", self.host,
+                "--port", str(self.port),
+                "--uno-port", str(self.uno_port),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        
+        deadline = time.monotonic() + self.startup_timeout
+        exit_code = None
+        while time.monotonic() < deadline:
+            if self._port_open():
+                if self._process is None:
+                    # Another worker won the race to bind the port; use its daemon
+                    logger.info(f"unoserver exited with code {exit_code}; attached to another worker's daemon")
+                else:
+                    logger.info("LibreOffice daemon is ready")
+                return
+            if self._process is not None and self._process.poll() is not None:
+                # Usually a concurrent start by another worker holding the port; keep
+                # waiting for that daemon until the deadline instead of failing now
+                exit_code = self._process.returncode
+                self._process = None
+            time.sleep(0.25)
+        
+        self._stop()
+        if exit_code is not None:
+            raise RuntimeError(f"unoserver exited during startup with code {exit_code}")
+        raise RuntimeError(f"unoserver did not become ready within {self.startup_timeout}s")
+    
+    def _stop(self) -> None:
+        """Terminate the daemon if running. Caller must hold the lock."""
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+    
+    def _ensure_running(self) -> None:
+        """Start or restart the daemon if it is not healthy."""
+        with self._lock:
+            if not self.is_healthy():
+                if self._process is not None:
+                    logger.warning("LibreOffice daemon is not healthy, restarting")
+                self._start()
+    
+    def _run_unoconvert(self, content: bytes, to: str, timeout: float) -> bytes:
+        result = subprocess.run(
+            [
+                "unoconvert",
+                "--host", self.host,
+                "--port", str(self.port),
+                "--convert-to", to,
+                "-", "-",
+            ],
+            input=content,
+            capture_output=True,
+            check=True,
+            timeout=timeout
+        )
+        return result.stdout
+    
+    def convert(self, content: bytes, to: str = "docx", timeout: float = 60) -> bytes:
+        """
+        Convert document bytes through the persistent daemon.
+        
+        Args:
+            content: Binary content of the input document
+            to: Target format (e.g. "docx")
+            timeout: Per-conversion timeout in seconds
+        
+        Returns:
+            Binary content of the converted document
+        
+        Raises:
+            RuntimeError: If the daemon cannot be started or conversion fails
+        """
+        self._ensure_running()
+        try:
+            return self._run_unoconvert(content, to, timeout)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            # A crashed/hung daemon is the usual cause; restart once and retry
+            if self.is_healthy():
+                raise RuntimeError(f"unoconvert failed: {e}")
+            logger.warning(f"LibreOffice daemon failed during conversion, restarting: {e}")
+            self._ensure_running()
+            return self._run_unoconvert(content, to, timeout)
+    
+    def shutdown(self) -> None:
+        """Stop the daemon if this process started it (an attached daemon is left running)."""
+        with self._lock:
+            self._stop()
+
+
+# Global LibreOffice daemon (started lazily on first conversion)
+libre_pool = LibreOfficePool()
+atexit.register(libre_pool.shutdown)
+
+
+def doc_to_docx_with_libreoffice(doc_path: str, output_path: Optional[str] = None, use_daemon: bool = True) -> Optional[str]:
     """
     Convert .doc file to .docx using LibreOffice headless mode.
     This is the recommended method for .doc to .docx conversion.
@@ -45,6 +212,7 @@ def doc_to_docx_with_libreoffice(doc_path: str, output_path: Optional[str] = Non
     Args:
         doc_path: Path to the input .doc file
         output_path: Optional path for the output .docx file. If None, uses same name with .docx extension.
+        use_daemon: Try the LibreOffice daemon before soffice (False if the caller already tried it)
     
     Returns:
         Path to the converted .docx file, or None if conversion failed
@@ -72,6 +240,21 @@ def doc_to_docx_with_libreoffice(doc_path: str, output_path: Optional[str] = Non
     try:
         logger.info(f"Converting .doc to .docx using LibreOffice: {doc_path} -> {output_dir}/{output_filename}")
         
+        # Prefer the persistent daemon; fall back to a one-shot soffice process
+        if use_daemon and UNOSERVER_AVAILABLE:
+            try:
+                with open(doc_path, 'rb') as f:
+                    docx_content = libre_pool.convert(f.read(), to='docx')
+                if docx_content:
+                    expected_output = os.path.join(output_dir, output_filename)
+                    with open(expected_output, 'wb') as f:
+                        f.write(docx_content)
+                    logger.info(f"Successfully converted .doc to .docx using LibreOffice daemon: {expected_output}")
+                    return expected_output
+                logger.warning(f"LibreOffice daemon returned empty output for {doc_path}, retrying with soffice")
+            except Exception as pool_error:
+                logger.warning(f"LibreOffice daemon conversion failed for {doc_path}, retrying with soffice: {pool_error}")
+        
         # LibreOffice command: soffice --headless --convert-to docx --outdir <dir> <file>
         result = subprocess.run(
             [libreoffice_cmd, '--headless', '--convert-to', 'docx', '--outdir', output_dir, doc_path],
@@ -173,8 +356,17 @@ def convert_doc_to_docx_in_memory(doc_content: bytes) -> Optional[bytes]:
     """
     import shutil
     
-    # Create temporary files
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.doc') as temp_doc:
+    # Persistent daemon converts stdin -> stdout, no temp files needed
+    if UNOSERVER_AVAILABLE:
+        try:
+            docx_content = libre_pool.convert(doc_content, to='docx')
+            if docx_content:
+                return docx_content
+        except Exception as pool_error:
+            logger.debug(f"LibreOffice daemon conversion failed, falling back to one-shot soffice: {pool_error}")
+    
+    # Create temporary files (on tmpfs when available)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.doc', dir=RAM_TEMP_DIR) as temp_doc:
         temp_doc.write(doc_content)
         temp_doc_path = temp_doc.name
     
@@ -184,7 +376,7 @@ def convert_doc_to_docx_in_memory(doc_content: bytes) -> Optional[bytes]:
         if libreoffice_cmd:
             try:
                 temp_dir = os.path.dirname(temp_doc_path)
-                result_path = doc_to_docx_with_libreoffice(temp_doc_path)
+                result_path = doc_to_docx_with_libreoffice(temp_doc_path, use_daemon=False)
                 if result_path and os.path.exists(result_path):
                     with open(result_path, 'rb') as f:
                         docx_content = f.read()
@@ -245,38 +437,20 @@ def doc_to_text_with_pandoc(doc_path: str) -> Optional[str]:
         logger.error(f"Input file does not exist: {doc_path}")
         return None
     
-    # Define the output path for the converted text file
-    base_name = os.path.splitext(doc_path)[0]
-    output_path = f"{base_name}.txt"
-    
     try:
-        logger.info(f"Converting .doc to text using pandoc: {doc_path} -> {output_path}")
+        logger.info(f"Converting .doc to text using pandoc: {doc_path} -> stdout")
         
-        # Command: pandoc -s input.doc -t plain -o output.txt
+        # Command: pandoc -s input.doc -t plain (output captured from stdout, no temp file)
         result = subprocess.run(
-            ['pandoc', '-s', doc_path, '-t', 'plain', '-o', output_path],
+            ['pandoc', '-s', doc_path, '-t', 'plain'],
             check=True,  # Raise an exception for non-zero exit codes
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            capture_output=True,
             timeout=60  # 60 second timeout
         )
         
-        if os.path.exists(output_path):
-            # Read the content from the newly created text file
-            with open(output_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Clean up the generated text file
-            try:
-                os.unlink(output_path)
-            except Exception:
-                pass
-            
-            logger.info(f"Successfully converted .doc to text using pandoc")
-            return content
-        else:
-            logger.error(f"Conversion completed but output file is missing: {output_path}")
-            return None
+        content = result.stdout.decode('utf-8', errors='ignore')
+        logger.info(f"Successfully converted .doc to text using pandoc")
+        return content
             
     except subprocess.TimeoutExpired:
         logger.error(f"Pandoc conversion timed out for {doc_path}")
@@ -1,6 +1,7 @@
 """In-memory cache for job embeddings with size limits."""
-from typing import Dict, Optional
-from collections import OrderedDict
+from typing import Dict, List, Optional, Union
+import numpy as np
+
 from app.config import settings
 from app.utils.logging import get_logger
 
@@ -12,29 +13,33 @@ class JobCache:
     
     def __init__(self, max_size: Optional[int] = None):
         self.max_size = max_size or settings.job_cache_max_size
-        # Use OrderedDict for LRU eviction
-        self._cache: OrderedDict[str, Dict] = OrderedDict()
+        # Plain dict preserves insertion order: first key is least recently used.
+        # Recency is refreshed by pop + re-insert (cheaper per entry than OrderedDict)
+        self._cache: Dict[str, Dict] = {}
     
-    def store_job(self, job_id: str, embedding: list, metadata: dict) -> None:
-        """Store job embedding in cache with LRU eviction if cache is full."""
-        # Remove oldest entry if cache is full
-        if len(self._cache) >= self.max_size and job_id not in self._cache:
-            # Remove least recently used (first item)
-            oldest_id, _ = self._cache.popitem(last=False)
-            logger.debug(
-                f"Cache full, evicted job: {oldest_id}",
-                extra={"evicted_job_id": oldest_id, "cache_size": len(self._cache)}
-            )
-        
-        # Store new entry (moves to end if already exists)
-        if job_id in self._cache:
-            # Move to end (most recently used)
-            self._cache.move_to_end(job_id)
+    def store_job(self, job_id: str, embedding: Union[np.ndarray, List[float]], metadata: dict) -> None:
+        """
+        Store job embedding in cache with LRU eviction if cache is full.
+        The embedding is kept as a float32 ndarray (~3 KB for 768 dims vs ~22 KB as a list).
+        """
+        embedding = np.asarray(embedding, dtype=np.float32)
         
+        # Re-insert at the end (most recently used) if already cached
+        self._cache.pop(job_id, None)
         self._cache[job_id] = {
             "embedding": embedding,
             "metadata": metadata
         }
+        
+        # Remove least recently used (first items) if cache is over capacity
+        while len(self._cache) > self.max_size:
+            oldest_id = next(iter(self._cache))
+            del self._cache[oldest_id]
+            logger.debug(
+                f"Cache full, evicted job: {oldest_id}",
+                extra={"evicted_job_id": oldest_id, "cache_size": len(self._cache)}
+            )
+        
         logger.info(
             f"Stored job in cache: {job_id}",
             extra={"job_id": job_id, "cache_size": len(self._cache), "max_size": self.max_size}
@@ -42,11 +47,11 @@ class JobCache:
     
     def get_job(self, job_id: str) -> Optional[Dict]:
         """Retrieve job from cache (moves to end for LRU)."""
-        if job_id in self._cache:
-            # Move to end (most recently used)
-            self._cache.move_to_end(job_id)
-            return self._cache[job_id]
-        return None
+        entry = self._cache.pop(job_id, None)
+        if entry is not None:
+            # Re-insert at the end (most recently used)
+            self._cache[job_id] = entry
+        return entry
     
     def delete_job(self, job_id: str) -> None:
         """Remove job from cache."""
@@ -1,11 +1,14 @@
 """Service for parsing job descriptions and creating embeddings."""
-import json
-import re
-from typing import Dict, Optional
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Union
 import httpx
+import orjson
 from httpx import Timeout
 
 from app.config import settings
+from app.utils.http_json import post_json
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +30,76 @@ Rules:
 - `summary_for_embedding` should be ~40-70 words, combining title, top skills, and responsibilities — this is what will be embedded.
 """
 
+# Static prompt fragments; parse_job joins them with the job text in one allocation
+_PROMPT_HEAD = JOB_PROMPT + "\n\nTitle: "
+_PROMPT_MID = "\nDescription: "
+_PROMPT_TAIL = "\n\nOutput:"
+
+# Retry / health-check tuning for OLLAMA calls
+OLLAMA_HEALTH_TTL_SECONDS = 30.0
+OLLAMA_MAX_RETRIES = 3
+OLLAMA_BACKOFF_BASE_SECONDS = 1.0
+OLLAMA_BACKOFF_CAP_SECONDS = 8.0
+OLLAMA_BACKOFF_JITTER_SECONDS = 0.5
+OLLAMA_BREAKER_FAILURE_THRESHOLD = 5
+OLLAMA_BREAKER_OPEN_SECONDS = 30.0
+
+
+class OllamaCircuitBreaker:
+    """
+    Tracks OLLAMA health across JobParser instances.
+    
+    - Remembers a successful call for a TTL so the /api/tags preflight can be skipped
+    - Opens after N consecutive failures and short-circuits calls until the cooldown ends
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = OLLAMA_BREAKER_FAILURE_THRESHOLD,
+        open_seconds: float = OLLAMA_BREAKER_OPEN_SECONDS,
+        healthy_ttl: float = OLLAMA_HEALTH_TTL_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.healthy_ttl = healthy_ttl
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._healthy_until = 0.0
+    
+    def is_open(self) -> bool:
+        """Return True if calls should be short-circuited."""
+        return time.monotonic() < self._open_until
+    
+    def is_known_healthy(self) -> bool:
+        """Return True if OLLAMA responded successfully within the health TTL."""
+        return time.monotonic() < self._healthy_until
+    
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._healthy_until = time.monotonic() + self.healthy_ttl
+    
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        self._healthy_until = 0.0
+        if self._consecutive_failures >= self.failure_threshold:
+            self._open_until = time.monotonic() + self.open_seconds
+            logger.warning(
+                f"OLLAMA circuit breaker opened for {self.open_seconds}s after "
+                f"{self._consecutive_failures} consecutive failures",
+                extra={"consecutive_failures": self._consecutive_failures}
+            )
+
+
+# Shared across JobParser instances (one is created per request)
+ollama_breaker = OllamaCircuitBreaker()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Transport errors and 5xx responses are worth retrying; 4xx and parse errors are not."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
 
 class JobParser:
     """Service for parsing job descriptions using OLLAMA LLM."""
@@ -44,93 +117,140 @@ class JobParser:
         except Exception:
             return False
     
-    async def parse_job(self, title: str, description: str, job_id: Optional[str] = None) -> Dict:
-        """Parse job description and return structured data with embedding summary."""
+    async def _generate(self, client: httpx.AsyncClient, prompt: str) -> Dict:
+        """Call OLLAMA once, falling back from /api/generate to /api/chat on 404."""
+        # Try /api/generate first (older OLLAMA versions)
         try:
-            # Check OLLAMA connection first
-            if not await self._check_ollama_connection():
+            return await post_json(
+                client,
+                f"{self.ollama_host}/api/generate",
+                {
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.1,
+                        "top_p": 0.9,
+                    }
+                }
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            # Try /api/chat endpoint (newer OLLAMA versions)
+            logger.warning("OLLAMA /api/generate not found, trying /api/chat endpoint")
+            result = await post_json(
+                client,
+                f"{self.ollama_host}/api/chat",
+                {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.1,
+                        "top_p": 0.9,
+                    }
+                }
+            )
+            # Extract response from chat format
+            if "message" in result and "content" in result["message"]:
+                return {"response": result["message"]["content"]}
+            raise ValueError("Unexpected response format from OLLAMA chat API")
+    
+    async def _generate_with_retries(self, client: httpx.AsyncClient, prompt: str, retries: int) -> Dict:
+        """Call OLLAMA with capped exponential backoff + jitter, feeding the circuit breaker."""
+        for attempt in range(retries):
+            try:
+                result = await self._generate(client, prompt)
+                ollama_breaker.record_success()
+                return result
+            except httpx.HTTPError as e:
+                retryable = _is_retryable(e)
+                if retryable:
+                    ollama_breaker.record_failure()
+                if attempt >= retries - 1 or not retryable or ollama_breaker.is_open():
+                    if isinstance(e, httpx.ConnectError):
+                        raise RuntimeError(
+                            f"Cannot connect to OLLAMA at {self.ollama_host}. "
+                            "Please ensure OLLAMA is running. Start it with: ollama serve"
+                        )
+                    raise
+                # Capped exponential backoff with jitter
+                wait_time = min(
+                    OLLAMA_BACKOFF_CAP_SECONDS,
+                    OLLAMA_BACKOFF_BASE_SECONDS * 2 ** attempt
+                ) + random.uniform(0, OLLAMA_BACKOFF_JITTER_SECONDS)
+                logger.warning(
+                    f"OLLAMA job parse failed, retrying in {wait_time:.2f}s: {e}",
+                    extra={"attempt": attempt + 1, "error": str(e)}
+                )
+                await asyncio.sleep(wait_time)
+        
+        raise RuntimeError("Failed to parse job with LLM")
+    
+    async def parse_job(
+        self,
+        title: str,
+        description: str,
+        job_id: Optional[str] = None,
+        retries: int = OLLAMA_MAX_RETRIES,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict:
+        """
+        Parse job description and return structured data with embedding summary.
+        Pass `client` to reuse a shared AsyncClient (see parse_jobs).
+        """
+        try:
+            if ollama_breaker.is_open():
                 raise RuntimeError(
-                    f"OLLAMA is not accessible at {self.ollama_host}. "
-                    "Please ensure OLLAMA is running. Start it with: ollama serve"
+                    f"OLLAMA at {self.ollama_host} is failing repeatedly; "
+                    "skipping request until the circuit breaker cools down"
                 )
             
-            # Prepare prompt
-            prompt = f"{JOB_PROMPT}\n\nTitle: {title}\nDescription: {description}\n\nOutput:"
-            
-            # Call OLLAMA API - create fresh client for each request
-            async with httpx.AsyncClient(timeout=Timeout(600.0)) as client:
-                # Try /api/generate first (older OLLAMA versions)
-                try:
-                    response = await client.post(
-                        f"{self.ollama_host}/api/generate",
-                        json={
-                            "model": self.model,
-                            "prompt": prompt,
-                            "stream": False,
-                            "options": {
-                                "temperature": 0.1,
-                                "top_p": 0.9,
-                            }
-                        }
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        # Try /api/chat endpoint (newer OLLAMA versions)
-                        logger.warning("OLLAMA /api/generate not found, trying /api/chat endpoint")
-                        response = await client.post(
-                            f"{self.ollama_host}/api/chat",
-                            json={
-                                "model": self.model,
-                                "messages": [
-                                    {"role": "user", "content": prompt}
-                                ],
-                                "stream": False,
-                                "options": {
-                                    "temperature": 0.1,
-                                    "top_p": 0.9,
-                                }
-                            }
-                        )
-                        response.raise_for_status()
-                        result = response.json()
-                        # Extract response from chat format
-                        if "message" in result and "content" in result["message"]:
-                            result = {"response": result["message"]["content"]}
-                        else:
-                            raise ValueError("Unexpected response format from OLLAMA chat API")
-                    else:
-                        raise
-                except httpx.ConnectError:
+            # Check OLLAMA connection only if it hasn't answered recently
+            if not ollama_breaker.is_known_healthy():
+                if not await self._check_ollama_connection():
+                    ollama_breaker.record_failure()
                     raise RuntimeError(
-                        f"Cannot connect to OLLAMA at {self.ollama_host}. "
+                        f"OLLAMA is not accessible at {self.ollama_host}. "
                         "Please ensure OLLAMA is running. Start it with: ollama serve"
                     )
-                
-                # Extract JSON from response
-                raw_output = result.get("response", "")
-                parsed_data = self._extract_json(raw_output)
-                
-                # Override job_id if provided
-                if job_id:
-                    parsed_data["job_id"] = job_id
-                
-                # Ensure job_id exists
-                if not parsed_data.get("job_id"):
-                    import uuid
-                    parsed_data["job_id"] = f"job_{uuid.uuid4().hex[:12]}"
-                
-                # Ensure summary_for_embedding exists
-                if not parsed_data.get("summary_for_embedding"):
-                    parsed_data["summary_for_embedding"] = f"{title}. {description[:200]}"
-                
-                logger.info(
-                    f"Parsed job: {parsed_data.get('job_id')}",
-                    extra={"job_id": parsed_data.get("job_id"), "title": title}
-                )
-                
-                return parsed_data
+            
+            # Prepare prompt
+            prompt = "".join((_PROMPT_HEAD, title, _PROMPT_MID, description, _PROMPT_TAIL))
+            
+            if client is not None:
+                result = await self._generate_with_retries(client, prompt, retries)
+            else:
+                # Call OLLAMA API - create fresh client for each request
+                async with httpx.AsyncClient(timeout=Timeout(600.0)) as own_client:
+                    result = await self._generate_with_retries(own_client, prompt, retries)
+            
+            # Extract JSON from response
+            raw_output = result.get("response", "")
+            parsed_data = self._extract_json(raw_output)
+            
+            # Override job_id if provided
+            if job_id:
+                parsed_data["job_id"] = job_id
+            
+            # Ensure job_id exists
+            if not parsed_data.get("job_id"):
+                import uuid
+                parsed_data["job_id"] = f"job_{uuid.uuid4().hex[:12]}"
+            
+            # Ensure summary_for_embedding exists
+            if not parsed_data.get("summary_for_embedding"):
+                parsed_data["summary_for_embedding"] = f"{title}. {description[:200]}"
+            
+            logger.info(
+                f"Parsed job: {parsed_data.get('job_id')}",
+                extra={"job_id": parsed_data.get("job_id"), "title": title}
+            )
+            
+            return parsed_data
                 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error calling OLLAMA: {e}", extra={"error": str(e)})
@@ -139,20 +259,95 @@ class JobParser:
             logger.error(f"Error parsing job: {e}", extra={"error": str(e)})
             raise
     
+    async def parse_jobs(
+        self,
+        jobs: List[Dict[str, Any]],
+        concurrency: int = 4
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Parse many jobs concurrently over one shared AsyncClient.
+        
+        Args:
+            jobs: List of dicts with parse_job keyword arguments ("title", "description", optional "job_id")
+            concurrency: Maximum number of in-flight OLLAMA requests
+        
+        Returns:
+            Results in input order; a failed job yields its exception instead of a dict
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with httpx.AsyncClient(
+            timeout=Timeout(600.0),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        ) as client:
+            async def _parse_one(job: Dict[str, Any]) -> Dict:
+                async with semaphore:
+                    return await self.parse_job(**job, client=client)
+            
+            results = await asyncio.gather(*(_parse_one(job) for job in jobs), return_exceptions=True)
+        
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(
+            f"Parsed {len(jobs) - failed}/{len(jobs)} jobs (concurrency: {concurrency})",
+            extra={"job_count": len(jobs), "failed_count": failed, "concurrency": concurrency}
+        )
+        return results
+    
+    @staticmethod
+    def _find_json_object(text: str) -> Optional[str]:
+        """
+        Return the first balanced {...} object in text.
+        Single O(n) scan tracking brace depth and string/escape state, so braces
+        inside string values and trailing prose do not confuse it.
+        """
+        start = text.find("{")
+        if start == -1:
+            return None
+        
+        depth = 0
+        in_string = False
+        escaped = False
+        for pos in range(start, len(text)):
+            ch = text[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start:pos + 1]
+        return None
+    
     def _extract_json(self, text: str) -> Dict:
         """Extract JSON object from LLM response."""
         # Try to find JSON in the response
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
+        json_candidate = self._find_json_object(text)
+        if json_candidate:
+            try:
+                return orjson.loads(json_candidate)
+            except orjson.JSONDecodeError:
+                pass
+        
+        # Fall back to the outermost braces (first "{" to last "}")
+        start, end = text.find("{"), text.rfind("}")
+        if start != -1 and end > start:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(text[start:end + 1])
+            except orjson.JSONDecodeError:
                 pass
         
         # Try parsing the whole text
         try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
+            return orjson.loads(text.strip())
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse JSON from LLM response", extra={"response": text[:500]})
             # Return default structure
             import uuid
@@ -0,0 +1,118 @@
+"""Numeric kernels for OCR image preprocessing (grayscale conversion + Otsu binarization)."""
+import numpy as np
+
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import Numba for JIT-compiled kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("Numba not available. OCR binarization will use OpenCV/NumPy.")
+
+# OpenCV's fixed-point BT.601 luma weights (scaled by 2**14), so gray levels match cv2.cvtColor exactly
+_R_WEIGHT = 4899
+_G_WEIGHT = 9617
+_B_WEIGHT = 1868
+_LUMA_SHIFT = 14
+_FLT_EPSILON = 1.1920928955078125e-07
+
+
+def _otsu_threshold(hist):
+    """Otsu threshold of a 256-bin histogram, computed the way cv2.threshold(THRESH_OTSU) does."""
+    total = 0
+    mu = 0.0
+    for i in range(256):
+        total += hist[i]
+        mu += i * float(hist[i])
+    if total == 0:
+        return 0
+    scale = 1.0 / total
+    mu *= scale
+
+    q1 = 0.0
+    mu1 = 0.0
+    max_sigma = 0.0
+    max_val = 0
+    for i in range(256):
+        p_i = hist[i] * scale
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1.0 - q1
+        if min(q1, q2) < _FLT_EPSILON or max(q1, q2) > 1.0 - _FLT_EPSILON:
+            continue
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) * (mu1 - mu2)
+        if sigma > max_sigma:
+            max_sigma = sigma
+            max_val = i
+    return max_val
+
+
+if NUMBA_AVAILABLE:
+    _otsu_threshold_jit = njit(cache=True)(_otsu_threshold)
+
+    # Kernels are single-threaded: they run in OCR pool workers and concurrently from request
+    # threads, where a per-call thread team would oversubscribe the CPU, and the images are small
+
+    # Pass 1 reads the RGB image once, writing gray levels and the histogram
+    @njit(cache=True)
+    def _gray_and_histogram_jit(rgb):
+        height, width = rgb.shape[0], rgb.shape[1]
+        gray = np.empty((height, width), np.uint8)
+        hist = np.zeros(256, np.int64)
+        for y in range(height):
+            for x in range(width):
+                v = (
+                    np.int64(rgb[y, x, 0]) * _R_WEIGHT
+                    + np.int64(rgb[y, x, 1]) * _G_WEIGHT
+                    + np.int64(rgb[y, x, 2]) * _B_WEIGHT
+                    + (1 << (_LUMA_SHIFT - 1))
+                ) >> _LUMA_SHIFT
+                gray[y, x] = v
+                hist[v] += 1
+        return gray, hist
+
+    # Pass 2 binarizes in place (THRESH_BINARY: 255 above the threshold, 0 otherwise)
+    @njit(cache=True)
+    def _threshold_inplace_jit(gray, thresh):
+        height, width = gray.shape
+        for y in range(height):
+            for x in range(width):
+                gray[y, x] = 255 if gray[y, x] > thresh else 0
+
+
+def gray_otsu_binarize(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an RGB image to grayscale and binarize it with Otsu's threshold.
+
+    Equivalent to cv2.cvtColor(RGB2GRAY) followed by cv2.threshold(THRESH_BINARY |
+    THRESH_OTSU). With Numba this is one pass over the color image plus one in-place
+    pass over the gray image, with no intermediate BGR copy.
+
+    Args:
+        rgb: (H, W, 3) uint8 image in RGB order
+
+    Returns:
+        (H, W) uint8 image containing only 0 and 255
+    """
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    if rgb.ndim != 3 or rgb.shape[2] != 3:
+        raise ValueError(f"Expected an (H, W, 3) RGB image, got shape {rgb.shape}")
+
+    if NUMBA_AVAILABLE:
+        gray, hist = _gray_and_histogram_jit(rgb)
+        _threshold_inplace_jit(gray, _otsu_threshold_jit(hist))
+        return gray
+
+    channels = rgb.astype(np.int64)
+    gray = (
+        (channels[..., 0] * _R_WEIGHT + channels[..., 1] * _G_WEIGHT + channels[..., 2] * _B_WEIGHT
+         + (1 << (_LUMA_SHIFT - 1))) >> _LUMA_SHIFT
+    ).astype(np.uint8)
+    thresh = _otsu_threshold(np.bincount(gray.ravel(), minlength=256))
+    return np.where(gray > thresh, 255, 0).astype(np.uint8)
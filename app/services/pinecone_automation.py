@@ -1,16 +1,36 @@
 """Pinecone automation service for managing indexes and namespaces for ATS resume embedding system."""
 import asyncio
+import hashlib
 import re
+import string
+import threading
 import time
-from typing import Optional, List, Dict, Any
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable, Iterator, Tuple, Union
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
 
 from app.config import settings
+from app.services.category_cache import category_cache
+from app.services.proximity_cache import query_cache
+from app.utils.http_json import as_float_list
 from app.utils.logging import get_logger
 from app.category.category_extractor import CategoryExtractor, IT_CATEGORY_PROMPT, NON_IT_CATEGORY_PROMPT
 
 logger = get_logger(__name__)
 
+# Try to import the gRPC client (pinecone-client[grpc]) for higher-throughput upserts
+try:
+    from pinecone.grpc import PineconeGRPC
+    PINECONE_GRPC_AVAILABLE = True
+except ImportError:
+    PINECONE_GRPC_AVAILABLE = False
+    logger.debug("Pinecone gRPC client not available. Using REST client.")
+
 # Pinecone API key - will use from settings (.env file) or fallback to hardcoded value
 # Priority: settings.pinecone_api_key > hardcoded value
 PINECONE_API_KEY_FALLBACK = "pcsk_6FByML_NApKAxacNuHFJ4QLaQretqWVT8R1Tk8yqXDHXYTjg1TJGwedDxwqtCCBo7prWxY"
@@ -22,6 +42,204 @@ NON_IT_INDEX_NAME = "non-it"
 # Default namespace for invalid/empty categories
 UNCATEGORIZED_NAMESPACE = "uncategorized"
 
+# Namespace normalization patterns (non-ASCII fallback)
+_NS_NONALNUM = re.compile(r'[^a-z0-9_]+')
+_NS_MULTIUNDER = re.compile(r'_+')
+_NS_VALID = re.compile(r'^[a-z0-9_]+$')
+
+# ASCII translate table: everything outside [a-z0-9_] becomes "_" (input is lowercased first)
+_NS_ALLOWED = frozenset(string.ascii_lowercase + string.digits + "_")
+_NS_TABLE = {code: "_" for code in range(128) if chr(code) not in _NS_ALLOWED}
+
+# Prefix of placeholder vector ids written when namespaces are pre-created
+_INIT_PREFIX = "_namespace_init_"
+
+# Max concurrent placeholder deletes (stays under Pinecone's per-index rate limits)
+PLACEHOLDER_DELETE_CONCURRENCY = 16
+
+# Pinecone accepts at most this many ids per delete request
+DELETE_BATCH_SIZE = 1000
+
+# (api key, index name, gRPC?) -> open Index handle. Each handle owns a thread pool and
+# connection pool, so they are shared across the per-request PineconeAutomation instances.
+_index_handles: Dict[Tuple[str, str, bool], Any] = {}
+_index_handles_lock = threading.Lock()
+
+# Dedicated pool for blocking SDK calls, sized to PINECONE_MAX_CONCURRENCY so Pinecone
+# traffic is neither capped by nor competing with the default executor
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Index name -> (time.monotonic() of fetch, namespaces). Module-level because
+# PineconeAutomation is instantiated per request. Stored as a tuple so callers that
+# edit the returned list in place can't change the cached entry.
+_namespace_cache: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the Pinecone thread pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.pinecone_max_concurrency,
+                thread_name_prefix="pinecone"
+            )
+        return _executor
+
+
+async def _run_blocking(func, *args, **kwargs) -> Any:
+    """Run a blocking SDK call on the Pinecone thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    """Shut down the Pinecone thread pool (called on application shutdown)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _wait_result(result: Any) -> Any:
+    """Block on an async_req upsert: REST returns an ApplyResult (.get), gRPC a future (.result)."""
+    if hasattr(result, "result"):
+        return result.result()
+    return result.get()
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most size items."""
+    it = iter(items)
+    chunk = list(islice(it, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, size))
+
+
+def _filter_key(filter_dict: Optional[Dict[str, Any]]) -> str:
+    """Stable short identifier for a metadata filter (used in cache keys and log extras)."""
+    if not filter_dict:
+        return ""
+    data = orjson.dumps(filter_dict, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _extract_categories_from_prompt(prompt_text: str) -> Tuple[str, ...]:
+    """
+    Extract category names from category_extractor.py prompt text.
+    
+    Args:
+        prompt_text: The IT_CATEGORY_PROMPT or NON_IT_CATEGORY_PROMPT string
+        
+    Returns:
+        Tuple of category names (cached; the prompts are module constants)
+    """
+    categories = []
+    lines = prompt_text.split('\n')
+    in_category_section = False
+    
+    for line in lines:
+        line = line.strip()
+        
+        # Start capturing after "SAMPLE IT CATEGORIES:" or "SAMPLE NON-IT CATEGORIES:"
+        if "SAMPLE" in line and "CATEGORIES:" in line:
+            in_category_section = True
+            continue
+        
+        # Stop capturing when we hit the next section
+        if in_category_section and line and not line[0].isdigit() and "ASSESSMENT" in line:
+            break
+        
+        # Extract category from numbered lines (e.g., "1. Full Stack Development (Java)")
+        if in_category_section and line and line[0].isdigit():
+            # Remove number prefix (e.g., "1. " or "10. ")
+            _, sep, category = line.partition('. ')
+            if not sep:
+                continue
+            category = category.lstrip()
+            if category:
+                categories.append(category)
+    
+    return tuple(categories)
+
+
+@lru_cache(maxsize=None)
+def _placeholder_vector(dimension: int) -> List[float]:
+    """
+    Values for namespace placeholder vectors.
+    
+    Shared across calls and PineconeAutomation instances; callers must not mutate it.
+    It stays a list because the Pinecone client validates vector values as a list.
+    """
+    return [0.0001] * dimension
+
+
+@lru_cache(maxsize=512)
+def _normalize_namespace_cached(category: str) -> str:
+    """
+    Normalize category string to valid Pinecone namespace format.
+    
+    Namespace normalization rules (as per requirements):
+    - Convert to lowercase
+    - Replace spaces, slashes, dots, parentheses with underscores
+    - Remove all characters except [a-z0-9_]
+    - Collapse multiple underscores into one
+    
+    Example:
+    "Full Stack Development (Java)" → "full_stack_development_java"
+    
+    Args:
+        category: Category string from category_extractor.py output
+        
+    Returns:
+        Normalized namespace string
+    """
+    if not category or not category.strip():
+        return UNCATEGORIZED_NAMESPACE
+    
+    # Convert to lowercase
+    normalized = category.lower().strip()
+    
+    if normalized.isascii():
+        # Fast path: one C-level translate maps every char outside [a-z0-9_] to "_";
+        # dropping empty parts then collapses runs and trims leading/trailing underscores
+        normalized = "_".join(part for part in normalized.translate(_NS_TABLE).split("_") if part)
+        return normalized or UNCATEGORIZED_NAMESPACE
+    
+    # Slow path for non-ASCII input.
+    # Replace spaces, slashes, dots, parentheses, and all other special chars with underscores
+    # This handles: spaces, slashes (/), dots (.), parentheses (()), and any other non-alphanumeric chars
+    normalized = _NS_NONALNUM.sub('_', normalized)
+    
+    # Collapse multiple consecutive underscores into one
+    normalized = _NS_MULTIUNDER.sub('_', normalized)
+    
+    # Remove leading/trailing underscores
+    normalized = normalized.strip('_')
+    
+    # Ensure it's not empty after normalization
+    if not normalized:
+        return UNCATEGORIZED_NAMESPACE
+    
+    # Final validation: must contain only [a-z0-9_]
+    if not _NS_VALID.match(normalized):
+        return UNCATEGORIZED_NAMESPACE
+    
+    return normalized
+
+
+# The prompts are constants, so the category lists are parsed once at import
+_IT_CATEGORIES: Tuple[str, ...] = _extract_categories_from_prompt(IT_CATEGORY_PROMPT)
+_NON_IT_CATEGORIES: Tuple[str, ...] = _extract_categories_from_prompt(NON_IT_CATEGORY_PROMPT)
+
+# Namespaces pre-created for each index, for O(1) membership checks on insert
+_IT_NS_SET: FrozenSet[str] = frozenset(_normalize_namespace_cached(c) for c in _IT_CATEGORIES)
+_NON_IT_NS_SET: FrozenSet[str] = frozenset(_normalize_namespace_cached(c) for c in _NON_IT_CATEGORIES)
+
 
 class PineconeAutomation:
     """
@@ -49,98 +267,62 @@ class PineconeAutomation:
         else:
             self.api_key = PINECONE_API_KEY_FALLBACK
         self.pc: Optional[Pinecone] = None
-        self.it_index = None
-        self.non_it_index = None
+        # Index handles by name, taken from the process-wide pool on first use (see _get_index)
+        self._indexes: Dict[str, Any] = {}
         self.dimension = settings.embedding_dimension
         self.category_extractor = CategoryExtractor()
     
-    def _extract_categories_from_prompt(self, prompt_text: str) -> List[str]:
-        """
-        Extract category names from category_extractor.py prompt text.
-        
-        Args:
-            prompt_text: The IT_CATEGORY_PROMPT or NON_IT_CATEGORY_PROMPT string
-            
-        Returns:
-            List of category names
-        """
-        categories = []
-        lines = prompt_text.split('\n')
-        in_category_section = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Start capturing after "SAMPLE IT CATEGORIES:" or "SAMPLE NON-IT CATEGORIES:"
-            if "SAMPLE" in line and "CATEGORIES:" in line:
-                in_category_section = True
-                continue
-            
-            # Stop capturing when we hit the next section
-            if in_category_section and line and not line[0].isdigit() and "ASSESSMENT" in line:
-                break
-            
-            # Extract category from numbered lines (e.g., "1. Full Stack Development (Java)")
-            if in_category_section and line and line[0].isdigit():
-                # Remove number prefix (e.g., "1. " or "10. ")
-                category = re.sub(r'^\d+\.\s*', '', line)
-                if category:
-                    categories.append(category)
-        
-        return categories
+    def _extract_categories_from_prompt(self, prompt_text: str) -> Tuple[str, ...]:
+        """Extract category names from category_extractor.py prompt text."""
+        return _extract_categories_from_prompt(prompt_text)
     
-    def _get_all_it_categories(self) -> List[str]:
+    def _get_all_it_categories(self) -> Tuple[str, ...]:
         """Get all IT categories from category_extractor.py."""
-        return self._extract_categories_from_prompt(IT_CATEGORY_PROMPT)
+        return _IT_CATEGORIES
     
-    def _get_all_non_it_categories(self) -> List[str]:
+    def _get_all_non_it_categories(self) -> Tuple[str, ...]:
         """Get all Non-IT categories from category_extractor.py."""
-        return self._extract_categories_from_prompt(NON_IT_CATEGORY_PROMPT)
+        return _NON_IT_CATEGORIES
     
     def _normalize_namespace(self, category: str) -> str:
+        """Normalize category string to valid Pinecone namespace format (memoized)."""
+        return _normalize_namespace_cached(category)
+    
+    def _open_index(self, name: str):
         """
-        Normalize category string to valid Pinecone namespace format.
-        
-        Namespace normalization rules (as per requirements):
-        - Convert to lowercase
-        - Replace spaces, slashes, dots, parentheses with underscores
-        - Remove all characters except [a-z0-9_]
-        - Collapse multiple underscores into one
+        Open an Index handle sized for parallel requests.
         
-        Example:
-        "Full Stack Development (Java)" → "full_stack_development_java"
-        
-        Args:
-            category: Category string from category_extractor.py output
-            
-        Returns:
-            Normalized namespace string
+        pool_threads backs async_req=True upserts; connection_pool_maxsize keeps that many
+        requests on warm connections instead of churning TCP/TLS sessions.
         """
-        if not category or not category.strip():
-            return UNCATEGORIZED_NAMESPACE
-        
-        # Convert to lowercase
-        normalized = category.lower().strip()
-        
-        # Replace spaces, slashes, dots, parentheses, and all other special chars with underscores
-        # This handles: spaces, slashes (/), dots (.), parentheses (()), and any other non-alphanumeric chars
-        normalized = re.sub(r'[^a-z0-9_]+', '_', normalized)
-        
-        # Collapse multiple consecutive underscores into one
-        normalized = re.sub(r'_+', '_', normalized)
-        
-        # Remove leading/trailing underscores
-        normalized = normalized.strip('_')
-        
-        # Ensure it's not empty after normalization
-        if not normalized:
-            return UNCATEGORIZED_NAMESPACE
-        
-        # Final validation: must contain only [a-z0-9_]
-        if not re.match(r'^[a-z0-9_]+$', normalized):
-            return UNCATEGORIZED_NAMESPACE
+        if PINECONE_GRPC_AVAILABLE and isinstance(self.pc, PineconeGRPC):
+            # gRPC channels multiplex requests; there is no urllib3 pool to size
+            return self.pc.Index(name)
+        return self.pc.Index(
+            name,
+            pool_threads=settings.pinecone_pool_threads,
+            connection_pool_maxsize=settings.pinecone_pool_maxsize
+        )
+    
+    async def _get_index(self, name: str):
+        """
+        Return the Index handle for name, initializing the client and opening it on first use.
         
-        return normalized
+        Handles are pooled process-wide (see _index_handles), so only the first instance to
+        touch an index pays for opening it and its connection pool.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            if not self.pc:
+                await self.initialize_pinecone()
+            use_grpc = PINECONE_GRPC_AVAILABLE and isinstance(self.pc, PineconeGRPC)
+            handle_key = (self.api_key, name, use_grpc)
+            with _index_handles_lock:
+                index = _index_handles.get(handle_key)
+                if index is None:
+                    index = _index_handles[handle_key] = self._open_index(name)
+            self._indexes[name] = index
+        return index
     
     def _determine_index_name(self, mastercategory: str) -> str:
         """
@@ -172,8 +354,18 @@ class PineconeAutomation:
             RuntimeError: If Pinecone initialization fails
         """
         try:
-            self.pc = Pinecone(api_key=self.api_key)
-            logger.info("Pinecone client initialized successfully")
+            # pinecone-client 3.x has no asyncio client (PineconeAsyncio ships with the 6.x
+            # "pinecone" package), so data-plane calls stay on the sync client: upserts fan out
+            # via async_req on the index thread pools, other calls go through the executor
+            if settings.pinecone_use_grpc and PINECONE_GRPC_AVAILABLE:
+                # HTTP/2 multiplexed, binary framing; same Index API as the REST client
+                self.pc = PineconeGRPC(api_key=self.api_key)
+                logger.info("Pinecone gRPC client initialized successfully")
+            else:
+                if settings.pinecone_use_grpc:
+                    logger.warning("PINECONE_USE_GRPC is set but pinecone-client[grpc] is not installed; using REST client")
+                self.pc = Pinecone(api_key=self.api_key)
+                logger.info("Pinecone client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Pinecone client: {e}", extra={"error": str(e)})
             raise RuntimeError(f"Pinecone initialization failed: {e}")
@@ -227,14 +419,15 @@ class PineconeAutomation:
             else:
                 logger.info(f"Index '{NON_IT_INDEX_NAME}' already exists, skipping creation")
             
-            # Wait for indexes to be ready
+            # Wait for indexes to be ready, polling with exponential backoff
             max_wait_time = 300  # 5 minutes
-            wait_interval = 2  # 2 seconds
-            elapsed_time = 0
+            wait_interval = 2.0  # seconds, grows 1.5x per poll up to 10s
+            elapsed_time = 0.0
+            next_log_time = 0.0
             
-            while elapsed_time < max_wait_time:
-                current_indexes = [idx.name for idx in self.pc.list_indexes()]
-                
+            # Reuse the listing we already have; it only needs refreshing if an index was missing
+            current_indexes = existing_indexes
+            while True:
                 it_ready = IT_INDEX_NAME in current_indexes
                 non_it_ready = NON_IT_INDEX_NAME in current_indexes
                 
@@ -242,24 +435,30 @@ class PineconeAutomation:
                     logger.info("Both indexes are ready")
                     break
                 
-                if elapsed_time % 10 == 0:  # Log every 10 seconds
+                if elapsed_time >= max_wait_time:
+                    break
+                
+                if elapsed_time >= next_log_time:  # Log every 10 seconds
                     logger.info(
                         f"Waiting for indexes to be ready... "
                         f"IT: {it_ready}, Non-IT: {non_it_ready}"
                     )
+                    next_log_time += 10
                 
                 await asyncio.sleep(wait_interval)
                 elapsed_time += wait_interval
+                wait_interval = min(wait_interval * 1.5, 10.0)
+                current_indexes = [idx.name for idx in self.pc.list_indexes()]
             
-            if IT_INDEX_NAME not in [idx.name for idx in self.pc.list_indexes()]:
+            if IT_INDEX_NAME not in current_indexes:
                 raise RuntimeError(f"Index '{IT_INDEX_NAME}' was not created within timeout period")
             
-            if NON_IT_INDEX_NAME not in [idx.name for idx in self.pc.list_indexes()]:
+            if NON_IT_INDEX_NAME not in current_indexes:
                 raise RuntimeError(f"Index '{NON_IT_INDEX_NAME}' was not created within timeout period")
             
             # Initialize index connections
-            self.it_index = self.pc.Index(IT_INDEX_NAME)
-            self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
+            await self._get_index(IT_INDEX_NAME)
+            await self._get_index(NON_IT_INDEX_NAME)
             
             logger.info(f"Successfully initialized indexes: {IT_INDEX_NAME}, {NON_IT_INDEX_NAME}")
             
@@ -278,113 +477,82 @@ class PineconeAutomation:
         even before actual resume data is inserted.
         """
         try:
-            if not self.it_index:
-                self.it_index = self.pc.Index(IT_INDEX_NAME)
-            if not self.non_it_index:
-                self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
-            
-            # Create a minimal valid embedding vector (all zeros with one small value)
-            # Pinecone requires at least one non-zero value
-            placeholder_vector = [0.0001] * self.dimension
-            
-            created_count = 0
-            loop = asyncio.get_event_loop()
+            # Bind loop invariants to locals once (avoids per-iteration attribute lookups)
+            it_idx = await self._get_index(IT_INDEX_NAME)
+            non_it_idx = await self._get_index(NON_IT_INDEX_NAME)
+            normalize = _normalize_namespace_cached
+            
+            # Minimal valid embedding vector (Pinecone requires at least one non-zero value),
+            # built once per dimension and shared by every placeholder upsert
+            placeholder_vector = _placeholder_vector(self.dimension)
+            
+            def _placeholder(ns: str, cat: str, mastercat: str) -> Dict[str, Any]:
+                return {
+                    "id": f"{_INIT_PREFIX}{ns}",
+                    "values": placeholder_vector,
+                    "metadata": {
+                        "type": "namespace_placeholder",
+                        "category": cat,
+                        "namespace": ns,
+                        "mastercategory": mastercat
+                    }
+                }
             
-            # Create IT namespaces
+            # Collect (namespace, placeholder vector) pairs per index. Each placeholder lives in
+            # its own namespace, so they can't share an upsert call; they are sent in parallel instead
             it_categories = self._get_all_it_categories()
-            print(f"🔨 Creating {len(it_categories)} IT namespaces...")
-            logger.info(f"Creating {len(it_categories)} IT namespaces")
-            
-            for category in it_categories:
-                namespace = self._normalize_namespace(category)
-                placeholder_id = f"_namespace_init_{namespace}"
-                
-                try:
-                    def _upsert_it(ns=namespace, pid=placeholder_id, cat=category):
-                        return self.it_index.upsert(
-                            vectors=[{
-                                "id": pid,
-                                "values": placeholder_vector,
-                                "metadata": {
-                                    "type": "namespace_placeholder",
-                                    "category": cat,
-                                    "namespace": ns,
-                                    "mastercategory": "IT"
-                                }
-                            }],
-                            namespace=ns
-                        )
-                    await loop.run_in_executor(None, _upsert_it)
-                    created_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to create IT namespace '{namespace}': {e}",
-                        extra={"namespace": namespace, "category": category, "error": str(e)}
-                    )
-            
-            # Create Non-IT namespaces
             non_it_categories = self._get_all_non_it_categories()
-            print(f"🔨 Creating {len(non_it_categories)} Non-IT namespaces...")
+            logger.info(f"Creating {len(it_categories)} IT namespaces")
             logger.info(f"Creating {len(non_it_categories)} Non-IT namespaces")
             
-            for category in non_it_categories:
-                namespace = self._normalize_namespace(category)
-                placeholder_id = f"_namespace_init_{namespace}"
-                
-                try:
-                    def _upsert_non_it(ns=namespace, pid=placeholder_id, cat=category):
-                        return self.non_it_index.upsert(
-                            vectors=[{
-                                "id": pid,
-                                "values": placeholder_vector,
-                                "metadata": {
-                                    "type": "namespace_placeholder",
-                                    "category": cat,
-                                    "namespace": ns,
-                                    "mastercategory": "NON_IT"
-                                }
-                            }],
-                            namespace=ns
+            it_items = []
+            for c in it_categories:
+                ns = normalize(c)
+                it_items.append((ns, _placeholder(ns, c, "IT")))
+            it_items.append((UNCATEGORIZED_NAMESPACE, _placeholder(UNCATEGORIZED_NAMESPACE, "Uncategorized", "IT")))
+            
+            non_it_items = []
+            for c in non_it_categories:
+                ns = normalize(c)
+                non_it_items.append((ns, _placeholder(ns, c, "NON_IT")))
+            non_it_items.append((UNCATEGORIZED_NAMESPACE, _placeholder(UNCATEGORIZED_NAMESPACE, "Uncategorized", "NON_IT")))
+            
+            # Dispatch every upsert on the indexes' own thread pools (async_req=True returns
+            # immediately), then wait for all of them off the event loop
+            pending = []
+            for index_name, target_index, items in (
+                (IT_INDEX_NAME, it_idx, it_items),
+                (NON_IT_INDEX_NAME, non_it_idx, non_it_items),
+            ):
+                upsert = target_index.upsert
+                for ns, vector in items:
+                    try:
+                        pending.append((index_name, vector, upsert(vectors=[vector], namespace=ns, async_req=True)))
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to create namespace '{ns}' in {index_name}: {e}",
+                            extra={"namespace": ns, "index": index_name, "category": vector["metadata"]["category"], "error": str(e)}
                         )
-                    await loop.run_in_executor(None, _upsert_non_it)
-                    created_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to create Non-IT namespace '{namespace}': {e}",
-                        extra={"namespace": namespace, "category": category, "error": str(e)}
-                    )
             
-            # Create uncategorized namespace in both indexes
-            for index_name, target_index in [(IT_INDEX_NAME, self.it_index), (NON_IT_INDEX_NAME, self.non_it_index)]:
-                placeholder_id = f"_namespace_init_{UNCATEGORIZED_NAMESPACE}"
-                try:
-                    mc = "IT" if index_name == IT_INDEX_NAME else "NON_IT"
-                    def _upsert_uncategorized(idx=target_index, pid=placeholder_id, mastercat=mc):
-                        return idx.upsert(
-                            vectors=[{
-                                "id": pid,
-                                "values": placeholder_vector,
-                                "metadata": {
-                                    "type": "namespace_placeholder",
-                                    "category": "Uncategorized",
-                                    "namespace": UNCATEGORIZED_NAMESPACE,
-                                    "mastercategory": mastercat
-                                }
-                            }],
-                            namespace=UNCATEGORIZED_NAMESPACE
+            def _wait_all() -> int:
+                succeeded = 0
+                for index_name, vector, result in pending:
+                    try:
+                        _wait_result(result)
+                        succeeded += 1
+                    except Exception as e:
+                        ns = vector["metadata"]["namespace"]
+                        logger.warning(
+                            f"Failed to create namespace '{ns}' in {index_name}: {e}",
+                            extra={"namespace": ns, "index": index_name, "category": vector["metadata"]["category"], "error": str(e)}
                         )
-                    await loop.run_in_executor(None, _upsert_uncategorized)
-                    created_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to create 'uncategorized' namespace in {index_name}: {e}",
-                        extra={"namespace": UNCATEGORIZED_NAMESPACE, "index": index_name, "error": str(e)}
-                    )
+                return succeeded
+            
+            created_count = await _run_blocking(_wait_all)
             
             total_namespaces = len(it_categories) + len(non_it_categories) + 2  # +2 for uncategorized in both indexes
-            print(f"✅ Created {created_count}/{total_namespaces} namespaces")
             logger.info(
-                f"✅ Created {created_count} namespaces (IT: {len(it_categories)}, Non-IT: {len(non_it_categories)}, Uncategorized: 2)",
+                f"✅ Created {created_count}/{total_namespaces} namespaces (IT: {len(it_categories)}, Non-IT: {len(non_it_categories)}, Uncategorized: 2)",
                 extra={"created_count": created_count, "it_count": len(it_categories), "non_it_count": len(non_it_categories)}
             )
             
@@ -394,7 +562,6 @@ class PineconeAutomation:
                 extra={"error": str(e)}
             )
             # Don't raise - namespace creation failure shouldn't block index creation
-            print(f"⚠️ Warning: Some namespaces may not have been created: {e}")
     
     async def delete_placeholder_vectors(self) -> None:
         """
@@ -404,76 +571,43 @@ class PineconeAutomation:
         Namespaces will remain and will be populated when actual resume data is inserted.
         """
         try:
-            if not self.pc:
-                await self.initialize_pinecone()
-            
-            if not self.it_index:
-                self.it_index = self.pc.Index(IT_INDEX_NAME)
-            if not self.non_it_index:
-                self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
+            it_idx = await self._get_index(IT_INDEX_NAME)
+            non_it_idx = await self._get_index(NON_IT_INDEX_NAME)
             
             # Get all categories to find placeholder IDs
             it_categories = self._get_all_it_categories()
             non_it_categories = self._get_all_non_it_categories()
             
-            deleted_count = 0
-            loop = asyncio.get_event_loop()
-            
-            # Delete IT placeholder vectors
-            for category in it_categories:
-                namespace = self._normalize_namespace(category)
-                placeholder_id = f"_placeholder_{namespace}"
-                try:
-                    await loop.run_in_executor(
-                        None,
-                        lambda ns=namespace, pid=placeholder_id: self.it_index.delete(
-                            ids=[pid],
-                            namespace=ns
+            sem = asyncio.Semaphore(PLACEHOLDER_DELETE_CONCURRENCY)
+            normalize = _normalize_namespace_cached
+            
+            # (index name, index handle, namespace) for every placeholder, including uncategorized
+            targets = [(IT_INDEX_NAME, it_idx, normalize(c)) for c in it_categories]
+            targets += [(NON_IT_INDEX_NAME, non_it_idx, normalize(c)) for c in non_it_categories]
+            targets += [
+                (IT_INDEX_NAME, it_idx, UNCATEGORIZED_NAMESPACE),
+                (NON_IT_INDEX_NAME, non_it_idx, UNCATEGORIZED_NAMESPACE),
+            ]
+            
+            async def _delete(index_name: str, target_index, ns: str) -> bool:
+                # Same ID scheme as _create_all_namespaces
+                placeholder_id = f"{_INIT_PREFIX}{ns}"
+                async with sem:
+                    try:
+                        await _run_blocking(target_index.delete, ids=[placeholder_id], namespace=ns)
+                        return True
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to delete placeholder '{placeholder_id}' from {index_name}: {e}",
+                            extra={"namespace": ns, "index": index_name, "placeholder_id": placeholder_id, "error": str(e)}
                         )
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete IT placeholder '{placeholder_id}': {e}",
-                        extra={"namespace": namespace, "placeholder_id": placeholder_id, "error": str(e)}
-                    )
-            
-            # Delete Non-IT placeholder vectors
-            for category in non_it_categories:
-                namespace = self._normalize_namespace(category)
-                placeholder_id = f"_placeholder_{namespace}"
-                try:
-                    await loop.run_in_executor(
-                        None,
-                        lambda ns=namespace, pid=placeholder_id: self.non_it_index.delete(
-                            ids=[pid],
-                            namespace=ns
-                        )
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete Non-IT placeholder '{placeholder_id}': {e}",
-                        extra={"namespace": namespace, "placeholder_id": placeholder_id, "error": str(e)}
-                    )
+                        return False
             
-            # Delete uncategorized placeholder from both indexes
-            placeholder_id = f"_placeholder_{UNCATEGORIZED_NAMESPACE}"
-            for index_name, target_index in [(IT_INDEX_NAME, self.it_index), (NON_IT_INDEX_NAME, self.non_it_index)]:
-                try:
-                    await loop.run_in_executor(
-                        None,
-                        lambda idx=target_index, pid=placeholder_id: idx.delete(
-                            ids=[pid],
-                            namespace=UNCATEGORIZED_NAMESPACE
-                        )
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete '{placeholder_id}' from {index_name}: {e}",
-                        extra={"namespace": UNCATEGORIZED_NAMESPACE, "index": index_name, "error": str(e)}
-                    )
+            results = await asyncio.gather(
+                *(_delete(index_name, target_index, ns) for index_name, target_index, ns in targets),
+                return_exceptions=True
+            )
+            deleted_count = sum(1 for r in results if r is True)
             
             logger.info(
                 f"✅ Deleted {deleted_count} placeholder vectors from Pinecone indexes",
@@ -509,6 +643,20 @@ class PineconeAutomation:
             Category string from category_extractor.py or None if extraction fails
         """
         try:
+            # Identical resume text (re-uploads, retries) maps to the same category; skip the LLM call
+            cache_key = category_cache.make_key(mastercategory, resume_text)
+            category = category_cache.get(cache_key)
+            if category:
+                logger.info(
+                    f"Category cache hit: {category}",
+                    extra={
+                        "category": category,
+                        "mastercategory": mastercategory,
+                        "file_name": filename,
+                    }
+                )
+                return category
+            
             category = await self.category_extractor.extract_category(
                 resume_text=resume_text,
                 mastercategory=mastercategory,
@@ -516,6 +664,7 @@ class PineconeAutomation:
             )
             
             if category:
+                category_cache.set(cache_key, category)
                 logger.info(
                     f"Category extracted: {category}",
                     extra={
@@ -575,16 +724,7 @@ class PineconeAutomation:
         try:
             # Determine target index
             index_name = self._determine_index_name(mastercategory)
-            target_index = self.it_index if index_name == IT_INDEX_NAME else self.non_it_index
-            
-            if not target_index:
-                # Initialize index connection if not already done
-                if index_name == IT_INDEX_NAME:
-                    self.it_index = self.pc.Index(IT_INDEX_NAME)
-                    target_index = self.it_index
-                else:
-                    self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
-                    target_index = self.non_it_index
+            target_index = await self._get_index(index_name)
             
             # Use category from database if provided, otherwise extract from category_extractor.py
             if not category:
@@ -611,17 +751,8 @@ class PineconeAutomation:
             
             # Verify namespace exists in pre-created list (log warning if not, but still use it)
             if category:
-                # Get all valid categories for this mastercategory
-                if mastercategory.upper() == "IT":
-                    valid_categories = self._get_all_it_categories()
-                else:
-                    valid_categories = self._get_all_non_it_categories()
-                
-                # Check if the category matches any pre-created category
-                category_matches = any(
-                    self._normalize_namespace(valid_cat) == namespace 
-                    for valid_cat in valid_categories
-                )
+                # Check if the category matches any pre-created namespace for this mastercategory
+                category_matches = namespace in (_IT_NS_SET if mastercategory.upper() == "IT" else _NON_IT_NS_SET)
                 
                 if not category_matches:
                     # Category from DB doesn't match pre-created namespaces
@@ -637,7 +768,6 @@ class PineconeAutomation:
                     )
                     # Note: Pinecone will create the namespace automatically when we insert vectors
             
-            print(f"🔍 [PINECONE DEBUG] Inserting {len(vectors)} vectors into index '{index_name}', namespace '{namespace}'")
             logger.info(
                 f"Inserting vectors into index '{index_name}', namespace '{namespace}'",
                 extra={
@@ -650,47 +780,60 @@ class PineconeAutomation:
                 }
             )
             
-            # Format vectors for Pinecone
-            pinecone_vectors = []
-            for vec_data in vectors:
-                vector_id = vec_data.get("id")
-                embedding = vec_data.get("embedding")
-                metadata = vec_data.get("metadata", {})
-                
-                if not vector_id or not embedding:
-                    logger.warning(f"Skipping vector with missing id or embedding")
-                    continue
-                
-                # Add category and mastercategory to metadata
-                metadata["category"] = category or "uncategorized"
-                metadata["mastercategory"] = mastercategory
-                metadata["namespace"] = namespace
-                
-                pinecone_vectors.append({
-                    "id": str(vector_id),
-                    "values": embedding,
-                    "metadata": metadata
-                })
+            # Format vectors for Pinecone; metadata is copied so caller-owned dicts aren't mutated
+            category_value = category or "uncategorized"
+            pinecone_vectors = [
+                {
+                    "id": str(vec_data["id"]),
+                    "values": as_float_list(vec_data["embedding"]),
+                    "metadata": {
+                        **vec_data.get("metadata", {}),
+                        "category": category_value,
+                        "mastercategory": mastercategory,
+                        "namespace": namespace,
+                    },
+                }
+                for vec_data in vectors
+                if vec_data.get("id") and vec_data.get("embedding") is not None and len(vec_data["embedding"]) > 0
+            ]
+            
+            skipped_count = len(vectors) - len(pinecone_vectors)
+            if skipped_count:
+                logger.warning(
+                    f"Skipping {skipped_count} vectors with missing id or embedding",
+                    extra={"skipped_count": skipped_count, "file_name": filename}
+                )
             
             if not pinecone_vectors:
                 logger.warning("No valid vectors to insert after filtering")
                 return
             
-            # Insert vectors into namespace
-            # Pinecone upsert is synchronous, but we're in async context
+            # Insert vectors into namespace in size-capped batches (keeps each request under
+            # Pinecone's 2MB limit); batches go out in parallel on the index thread pool, at most
+            # pinecone_upsert_concurrency at a time so one large insert can't take the whole pool
+            batch_size = settings.pinecone_upsert_batch_size
+            max_in_flight = settings.pinecone_upsert_concurrency
+            
             def _upsert_vectors(idx, vecs, ns):
-                return idx.upsert(vectors=vecs, namespace=ns)
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                _upsert_vectors,
-                target_index,
-                pinecone_vectors,
-                namespace
-            )
+                in_flight = deque()
+                responses = []
+                for batch in _chunks(vecs, batch_size):
+                    if len(in_flight) >= max_in_flight:
+                        responses.append(_wait_result(in_flight.popleft()))
+                    in_flight.append(idx.upsert(vectors=batch, namespace=ns, async_req=True))
+                responses.extend(_wait_result(r) for r in in_flight)
+                return responses
+            
+            await _run_blocking(_upsert_vectors, target_index, pinecone_vectors, namespace)
+            
+            # New vectors can change query results
+            query_cache.clear()
+            
+            # A namespace seen for the first time makes the cached namespace list stale
+            cached_namespaces = _namespace_cache.get(index_name)
+            if cached_namespaces is not None and namespace not in cached_namespaces[1]:
+                self.invalidate_namespaces(index_name)
             
-            print(f"✅ [PINECONE DEBUG] Successfully inserted {len(pinecone_vectors)} vectors into index '{index_name}', namespace '{namespace}'")
             logger.info(
                 f"Successfully inserted {len(pinecone_vectors)} vectors into "
                 f"index '{index_name}', namespace '{namespace}'",
@@ -714,14 +857,23 @@ class PineconeAutomation:
                     "vector_count": len(vectors) if vectors else 0,
                     "index_name": index_name if 'index_name' in locals() else "unknown",
                     "namespace": namespace if 'namespace' in locals() else "unknown"
-                }
+                },
+                exc_info=True
             )
-            # Print to console for immediate visibility
-            print(f"❌ PINECONE INSERTION ERROR: {error_msg}")
-            import traceback
-            traceback.print_exc()
             raise RuntimeError(f"Vector insertion failed: {e}")
     
+    def invalidate_namespaces(self, index_name: Optional[str] = None) -> None:
+        """
+        Drop cached namespace lists so the next get_all_namespaces call refetches them.
+        
+        Args:
+            index_name: Index to invalidate (all indexes if None)
+        """
+        if index_name is None:
+            _namespace_cache.clear()
+        else:
+            _namespace_cache.pop(index_name, None)
+    
     async def get_all_namespaces(self, mastercategory: str) -> List[str]:
         """
         Get all namespaces from the specified index.
@@ -735,28 +887,21 @@ class PineconeAutomation:
         try:
             # Determine target index
             index_name = self._determine_index_name(mastercategory)
-            target_index = self.it_index if index_name == IT_INDEX_NAME else self.non_it_index
             
-            if not target_index:
-                # Initialize index connection if not already done
-                if index_name == IT_INDEX_NAME:
-                    self.it_index = self.pc.Index(IT_INDEX_NAME)
-                    target_index = self.it_index
-                else:
-                    self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
-                    target_index = self.non_it_index
+            # Namespaces change rarely; serve recent results without a describe_index_stats round-trip
+            cached = _namespace_cache.get(index_name)
+            if cached is not None and time.monotonic() - cached[0] < settings.pinecone_namespace_cache_ttl:
+                return list(cached[1])
+            
+            target_index = await self._get_index(index_name)
             
             # Get index stats which includes namespace information
-            loop = asyncio.get_event_loop()
-            stats = await loop.run_in_executor(None, lambda: target_index.describe_index_stats())
+            stats = await _run_blocking(target_index.describe_index_stats)
             
-            # Extract namespaces from stats
+            # Extract namespaces from stats, filtering out placeholder namespaces (they don't have real data)
             namespaces = []
             if stats and "namespaces" in stats:
-                namespaces = list(stats["namespaces"].keys())
-            
-            # Filter out placeholder namespaces (they don't have real data)
-            namespaces = [ns for ns in namespaces if not ns.startswith("_namespace_init_")]
+                namespaces = [ns for ns in stats["namespaces"] if not ns.startswith(_INIT_PREFIX)]
             
             # Also check if default namespace has data
             # Default namespace shows up as empty string "" or might be in total_vector_count
@@ -765,6 +910,8 @@ class PineconeAutomation:
                 # If there are vectors but no namespaces listed, they might be in default namespace
                 # But we'll rely on the namespaces dict which should include default if it has data
             
+            _namespace_cache[index_name] = (time.monotonic(), tuple(namespaces))
+            
             logger.info(
                 f"Found {len(namespaces)} namespaces in index '{index_name}'",
                 extra={"index_name": index_name, "namespace_count": len(namespaces), "namespaces": namespaces[:10]}  # Log first 10
@@ -782,7 +929,7 @@ class PineconeAutomation:
     
     async def query_vectors(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         mastercategory: str,
         namespace: Optional[str] = None,
         top_k: int = 10,
@@ -792,7 +939,7 @@ class PineconeAutomation:
         Query vectors from the correct Pinecone index and namespace.
         
         Args:
-            query_vector: Query embedding vector
+            query_vector: Query embedding vector (list or float32 ndarray)
             mastercategory: "IT" or "NON_IT" to determine index
             namespace: Optional namespace to query (if None, queries default namespace)
             top_k: Number of results to return
@@ -802,33 +949,41 @@ class PineconeAutomation:
             List of matching vectors with metadata
         """
         try:
+            # One float32 view of the query, shared by the cache lookup and the request
+            q = np.asarray(query_vector, dtype=np.float32)
+            
             # Determine target index
             index_name = self._determine_index_name(mastercategory)
-            target_index = self.it_index if index_name == IT_INDEX_NAME else self.non_it_index
-            
-            if not target_index:
-                # Initialize index connection if not already done
-                if index_name == IT_INDEX_NAME:
-                    self.it_index = self.pc.Index(IT_INDEX_NAME)
-                    target_index = self.it_index
-                else:
-                    self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
-                    target_index = self.non_it_index
+            target_index = await self._get_index(index_name)
             
             # Query specific namespace (or default namespace if None)
             query_namespace = namespace if namespace else ""
             
-            # Query Pinecone
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: target_index.query(
-                    vector=query_vector,
-                    top_k=top_k,
-                    include_metadata=True,
-                    namespace=query_namespace if query_namespace else None,
-                    filter=filter_dict
+            filter_key = _filter_key(filter_dict)
+            
+            # Near-duplicate queries with the same target, top_k and filter reuse earlier results
+            cache_key = (index_name, query_namespace, top_k, filter_key)
+            cached_matches = query_cache.get(cache_key, q)
+            if cached_matches is not None:
+                logger.info(
+                    f"Query served {len(cached_matches)} cached results for index '{index_name}', namespace '{query_namespace or 'default'}'",
+                    extra={
+                        "index_name": index_name,
+                        "namespace": query_namespace,
+                        "filter_key": filter_key,
+                        "result_count": len(cached_matches)
+                    }
                 )
+                return cached_matches
+            
+            # Query Pinecone
+            results = await _run_blocking(
+                target_index.query,
+                vector=as_float_list(q),  # pinecone-client 3.x validates a list of floats
+                top_k=top_k,
+                include_metadata=True,
+                namespace=query_namespace if query_namespace else None,
+                filter=filter_dict
             )
             
             matches = []
@@ -839,11 +994,14 @@ class PineconeAutomation:
                     "metadata": match.get("metadata", {})
                 })
             
+            query_cache.put(cache_key, q, matches)
+            
             logger.info(
                 f"Query returned {len(matches)} results from index '{index_name}', namespace '{query_namespace or 'default'}'",
                 extra={
                     "index_name": index_name,
                     "namespace": query_namespace,
+                    "filter_key": filter_key,
                     "result_count": len(matches)
                 }
             )
@@ -878,29 +1036,26 @@ class PineconeAutomation:
         try:
             # Determine target index
             index_name = self._determine_index_name(mastercategory)
-            target_index = self.it_index if index_name == IT_INDEX_NAME else self.non_it_index
-            
-            if not target_index:
-                # Initialize index connection if not already done
-                if index_name == IT_INDEX_NAME:
-                    self.it_index = self.pc.Index(IT_INDEX_NAME)
-                    target_index = self.it_index
-                else:
-                    self.non_it_index = self.pc.Index(NON_IT_INDEX_NAME)
-                    target_index = self.non_it_index
+            target_index = await self._get_index(index_name)
             
             # Use namespace if provided
             delete_namespace = namespace if namespace else ""
             
-            # Delete vectors
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: target_index.delete(
-                    ids=[str(vid) for vid in vector_ids],
+            # Ids are normally strings already; only convert when they aren't
+            ids = vector_ids if vector_ids and isinstance(vector_ids[0], str) else [str(vid) for vid in vector_ids]
+            
+            # Delete vectors in requests of at most DELETE_BATCH_SIZE ids, sent concurrently
+            await asyncio.gather(*(
+                _run_blocking(
+                    target_index.delete,
+                    ids=batch,
                     namespace=delete_namespace if delete_namespace else None
                 )
-            )
+                for batch in _chunks(ids, DELETE_BATCH_SIZE)
+            ))
+            
+            # Deleted vectors can change query results
+            query_cache.clear()
             
             logger.info(
                 f"Deleted {len(vector_ids)} vectors from index '{index_name}', namespace '{delete_namespace or 'default'}'",
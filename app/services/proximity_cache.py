@@ -0,0 +1,130 @@
+"""Similarity-keyed cache for vector query results (near-duplicate queries reuse results)."""
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProximityCache:
+    """
+    LRU cache of query results looked up by query-vector similarity.
+
+    Entries are grouped under a structural key (index, namespace, top_k, filter), since
+    results are only interchangeable when those match. A lookup returns the results of
+    the most similar cached query vector in the group if its cosine similarity is at
+    least `threshold`, so repeated and near-duplicate searches skip the vector DB.
+
+    Entries expire after `ttl_seconds`: an index write clears only the cache of the
+    process that made it, so other API workers rely on expiry to stop serving stale results.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.max_size = max_size or settings.query_cache_max_size
+        self.threshold = threshold if threshold is not None else settings.query_cache_threshold
+        self.ttl_seconds = ttl_seconds or settings.query_cache_ttl_seconds
+        # structural key -> {entry id: (unit query vector, results, stored at monotonic seconds)}
+        self._groups: Dict[Hashable, Dict[int, Tuple[np.ndarray, List[Dict[str, Any]], float]]] = {}
+        # entry id -> structural key; plain dict in LRU order (first key is least recently used)
+        self._order: Dict[int, Hashable] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _unit(query_vector: Any) -> Optional[np.ndarray]:
+        q = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return None
+        return q / norm
+
+    def get(self, key: Hashable, query_vector: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached results for a query close enough to query_vector, or None.
+
+        Args:
+            key: Structural key (index, namespace, top_k, filter)
+            query_vector: Query embedding
+
+        Returns:
+            Cached result list, or None on a miss
+        """
+        group = self._groups.get(key)
+        if group:
+            # Expired entries are misses; drop them before comparing vectors
+            self._expire(key, group)
+            group = self._groups.get(key)
+        q = self._unit(query_vector) if group else None
+        if q is None:
+            self.misses += 1
+            return None
+
+        entry_ids = list(group)
+        vectors = [group[entry_id][0] for entry_id in entry_ids]
+        if any(v.shape != q.shape for v in vectors):
+            self.misses += 1
+            return None
+
+        # Cached vectors are unit length, so a single matrix-vector product gives all cosines
+        similarities = np.stack(vectors) @ q
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        entry_id = entry_ids[best]
+        # Re-insert at the end (most recently used)
+        del self._order[entry_id]
+        self._order[entry_id] = key
+        self.hits += 1
+        return list(group[entry_id][1])
+
+    def _expire(self, key: Hashable, group: Dict[int, Tuple[np.ndarray, List[Dict[str, Any]], float]]) -> None:
+        """Remove the group's entries stored more than ttl_seconds ago."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        for entry_id in [entry_id for entry_id, entry in group.items() if entry[2] <= cutoff]:
+            del group[entry_id]
+            del self._order[entry_id]
+        if not group:
+            del self._groups[key]
+
+    def put(self, key: Hashable, query_vector: Any, results: List[Dict[str, Any]]) -> None:
+        """Store results for a query vector with LRU eviction if the cache is full."""
+        q = self._unit(query_vector)
+        if q is None:
+            return
+
+        while len(self._order) >= self.max_size:
+            # Remove least recently used (first item)
+            evicted_id = next(iter(self._order))
+            evicted_key = self._order.pop(evicted_id)
+            group = self._groups[evicted_key]
+            del group[evicted_id]
+            if not group:
+                del self._groups[evicted_key]
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._groups.setdefault(key, {})[entry_id] = (q, results, time.monotonic())
+        self._order[entry_id] = key
+
+    def clear(self) -> None:
+        """Remove all cached queries."""
+        self._groups.clear()
+        self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+# Global query cache instance (PineconeAutomation is created per request)
+query_cache = ProximityCache()
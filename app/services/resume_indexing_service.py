@@ -1,8 +1,13 @@
 """Service for indexing resumes to Pinecone with embeddings."""
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.services.embedding_service import EmbeddingService
+from app.services.embedding_cache import embedding_cache
 from app.services.pinecone_automation import PineconeAutomation
 from app.repositories.resume_repo import ResumeRepository
 from app.database.models import ResumeMetadata
@@ -12,6 +17,29 @@ from app.utils.cleaning import normalize_skill_list
 
 logger = get_logger(__name__)
 
+# Leading number in experience strings like "5.5 years"
+_EXP_YEARS_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+# blake2b digest of a skillset string -> its normalized skills. Re-index runs mostly see
+# unchanged skillsets, so their split + normalize work is done once per process.
+_SKILLS_CACHE_MAX_SIZE = 4096
+_skills_cache: Dict[str, List[str]] = {}
+
+
+def _normalized_skills(skillset: str) -> List[str]:
+    """Split a comma-separated skillset and normalize it, reusing earlier results."""
+    key = hashlib.blake2b(skillset.encode("utf-8"), digest_size=8).hexdigest()
+    skills = _skills_cache.pop(key, None)
+    if skills is None:
+        raw_skills = [s.strip() for s in skillset.split(",") if s.strip()]
+        skills = normalize_skill_list(raw_skills)
+        while len(_skills_cache) >= _SKILLS_CACHE_MAX_SIZE:
+            # Remove least recently used (first item)
+            del _skills_cache[next(iter(_skills_cache))]
+    # (Re-)insert at the end (most recently used)
+    _skills_cache[key] = skills
+    return list(skills)
+
 
 class ResumeIndexingService:
     """Service for indexing resumes to Pinecone with embeddings."""
@@ -27,6 +55,9 @@ class ResumeIndexingService:
         self.embedding_service = EmbeddingService()
         self.pinecone_automation = PineconeAutomation()
         self.resume_repo = ResumeRepository(session)
+        # AsyncSession is not safe for concurrent use; resumes are indexed in parallel
+        # but their status updates go through the session one at a time
+        self._db_lock = asyncio.Lock()
     
     async def initialize_pinecone(self) -> None:
         """Initialize Pinecone client and indexes."""
@@ -42,15 +73,21 @@ class ResumeIndexingService:
         self,
         limit: Optional[int] = None,
         resume_ids: Optional[List[int]] = None,
-        force: bool = False
+        force: bool = False,
+        concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Index pending resumes to Pinecone.
         
+        Resumes are indexed concurrently (embedding calls and Pinecone upserts overlap),
+        at most `concurrency` at a time, and resumes sharing a category are upserted
+        together (see index_resumes_batched).
+        
         Args:
             limit: Optional limit on number of resumes to process
             resume_ids: Optional list of specific resume IDs to process
             force: If True, re-index resumes even if already indexed
+            concurrency: Max resumes in flight (defaults to settings.index_concurrency)
         
         Returns:
             Dictionary with indexing results:
@@ -90,59 +127,21 @@ class ResumeIndexingService:
                 extra={"resume_count": len(pending_resumes)}
             )
             
-            indexed_count = 0
-            failed_count = 0
-            processed_ids = []
-            failed_ids = []
-            skipped_ids = []
+            cache_before = embedding_cache.stats()
+            outcomes = await self.index_resumes_batched(pending_resumes, concurrency=concurrency)
+            cache_after = embedding_cache.stats()
+            cache_hits = cache_after["hits"] - cache_before["hits"]
+            cache_misses = cache_after["misses"] - cache_before["misses"]
+            logger.info(
+                f"Embedding cache: {cache_hits} hits, {cache_misses} misses",
+                extra={"cache_hits": cache_hits, "cache_misses": cache_misses, "cache_size": cache_after["size"]}
+            )
             
-            # Process each resume
-            for resume in pending_resumes:
-                try:
-                    # Validate required fields
-                    if not resume.resume_text:
-                        logger.warning(
-                            f"Skipping resume {resume.id}: missing resume_text",
-                            extra={"resume_id": resume.id}
-                        )
-                        skipped_ids.append(resume.id)
-                        continue
-                    
-                    if not resume.mastercategory:
-                        logger.warning(
-                            f"Skipping resume {resume.id}: missing mastercategory",
-                            extra={"resume_id": resume.id}
-                        )
-                        skipped_ids.append(resume.id)
-                        continue
-                    
-                    # Index the resume
-                    success = await self._index_single_resume(resume)
-                    
-                    if success:
-                        indexed_count += 1
-                        processed_ids.append(resume.id)
-                        logger.info(
-                            f"Successfully indexed resume {resume.id} to Pinecone",
-                            extra={"resume_id": resume.id}
-                        )
-                    else:
-                        failed_count += 1
-                        failed_ids.append(resume.id)
-                        logger.error(
-                            f"Failed to index resume {resume.id} to Pinecone",
-                            extra={"resume_id": resume.id}
-                        )
-                
-                except Exception as e:
-                    failed_count += 1
-                    failed_ids.append(resume.id)
-                    logger.error(
-                        f"Error indexing resume {resume.id}: {e}",
-                        extra={"resume_id": resume.id, "error": str(e)},
-                        exc_info=True
-                    )
-                    # Continue with next resume even if this one failed
+            processed_ids = [rid for rid, outcome in outcomes if outcome == "indexed"]
+            failed_ids = [rid for rid, outcome in outcomes if outcome == "failed"]
+            skipped_ids = [rid for rid, outcome in outcomes if outcome == "skipped"]
+            indexed_count = len(processed_ids)
+            failed_count = len(failed_ids)
             
             result = {
                 "indexed_count": indexed_count,
@@ -171,99 +170,309 @@ class ResumeIndexingService:
             logger.error(f"Error in index_resumes: {e}", extra={"error": str(e)}, exc_info=True)
             raise
     
-    async def _index_single_resume(self, resume: ResumeMetadata) -> bool:
+    async def index_resumes_batched(
+        self,
+        resumes: List[ResumeMetadata],
+        flush_every: int = 50,
+        concurrency: Optional[int] = None
+    ) -> List[Tuple[int, str]]:
         """
-        Index a single resume to Pinecone.
+        Index resumes, combining the vectors of resumes that share a Pinecone target.
+        
+        Resumes are processed in windows of `flush_every`. Within a window, the chunks of all
+        resumes are embedded together in batched requests (generate_chunk_embeddings_bulk),
+        vectors are grouped by (mastercategory, category) and each
+        group is written with one insert_vectors call (one set of upsert round-trips instead
+        of one per resume). Resumes without a database category need per-resume category
+        extraction from their own text, so they go through _index_single_resume instead.
         
         Args:
-            resume: ResumeMetadata object to index
+            resumes: Resumes to index
+            flush_every: Max resumes whose vectors are accumulated before flushing
+            concurrency: Max resumes in flight (defaults to settings.index_concurrency)
         
         Returns:
-            True if indexing was successful, False otherwise
+            (resume_id, "indexed" | "failed" | "skipped") for each resume, in input order
         """
-        try:
-            # Generate chunked embeddings for resume text
+        sem = asyncio.Semaphore(concurrency or settings.index_concurrency)
+        outcomes: Dict[int, str] = {}
+        
+        def _record(resume: ResumeMetadata, success: bool) -> None:
+            if success:
+                outcomes[resume.id] = "indexed"
+                logger.info(
+                    f"Successfully indexed resume {resume.id} to Pinecone",
+                    extra={"resume_id": resume.id}
+                )
+            else:
+                outcomes[resume.id] = "failed"
+                logger.error(
+                    f"Failed to index resume {resume.id} to Pinecone",
+                    extra={"resume_id": resume.id}
+                )
+        
+        async def _prepare(resume: ResumeMetadata) -> Optional[ResumeMetadata]:
+            # Validate required fields
+            if not resume.resume_text:
+                logger.warning(
+                    f"Skipping resume {resume.id}: missing resume_text",
+                    extra={"resume_id": resume.id}
+                )
+                outcomes[resume.id] = "skipped"
+                return None
+            
+            if not resume.mastercategory:
+                logger.warning(
+                    f"Skipping resume {resume.id}: missing mastercategory",
+                    extra={"resume_id": resume.id}
+                )
+                outcomes[resume.id] = "skipped"
+                return None
+            
+            if not resume.category:
+                async with sem:
+                    _record(resume, await self._index_single_resume(resume))
+                return None
+            
+            return resume
+        
+        async def _embed(ready: List[ResumeMetadata]) -> List[Tuple[ResumeMetadata, List[Dict[str, Any]]]]:
+            # One bulk embedding pass over the chunks of every resume in the window
             logger.info(
-                f"Generating embeddings for resume {resume.id}",
-                extra={"resume_id": resume.id, "text_length": len(resume.resume_text)}
+                f"Generating embeddings for {len(ready)} resumes",
+                extra={"resume_ids": [r.id for r in ready]}
             )
+            try:
+                chunk_embeddings = await self.embedding_service.generate_chunk_embeddings_bulk(
+                    [(resume.id, resume.resume_text, self._base_metadata(resume)) for resume in ready]
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error generating embeddings for {len(ready)} resumes: {e}",
+                    extra={"resume_ids": [r.id for r in ready], "error": str(e)},
+                    exc_info=True
+                )
+                chunk_embeddings = {}
+            
+            embedded = []
+            for resume in ready:
+                resume_chunks = chunk_embeddings.get(resume.id) or []
+                # A partial resume would be marked indexed and never retried (and may lack
+                # chunk 0, the only chunk carrying resume_text), so it must be complete
+                expected = self.embedding_service.count_chunks(resume.resume_text)
+                if len(resume_chunks) != expected:
+                    if resume_chunks:
+                        logger.error(
+                            f"Resume {resume.id} got {len(resume_chunks)} of {expected} chunk embeddings",
+                            extra={"resume_id": resume.id, "chunk_count": len(resume_chunks), "expected": expected}
+                        )
+                    _record(resume, False)
+                    continue
+                vectors = self._format_vectors(resume, resume_chunks)
+                if vectors:
+                    embedded.append((resume, vectors))
+                else:
+                    _record(resume, False)
+            return embedded
+        
+        async def _flush(mastercategory: str, category: str, members: List[Tuple[ResumeMetadata, List[Dict[str, Any]]]]) -> None:
+            vectors = [vector for _, resume_vectors in members for vector in resume_vectors]
+            try:
+                async with sem:
+                    await self.pinecone_automation.insert_vectors(
+                        vectors=vectors,
+                        resume_text=members[0][0].resume_text,  # Unused: category is known
+                        mastercategory=mastercategory,
+                        filename=f"{len(members)} resumes",
+                        category=category
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Error indexing {len(members)} resumes for category '{category}': {e}",
+                    extra={"resume_ids": [r.id for r, _ in members], "category": category, "error": str(e)},
+                    exc_info=True
+                )
+                # Leave pinecone_status at 0 so every resume in the group can be retried
+                for resume, _ in members:
+                    _record(resume, False)
+                return
+            
+            for resume, resume_vectors in members:
+                _record(resume, await self._mark_indexed(resume, len(resume_vectors)))
+        
+        for window_start in range(0, len(resumes), flush_every):
+            window = resumes[window_start:window_start + flush_every]
+            prepared = await asyncio.gather(*(_prepare(resume) for resume in window))
+            ready = [resume for resume in prepared if resume is not None]
+            if not ready:
+                continue
             
-            # Parse skillset string to array for filtering
-            # Normalize skills to canonical forms (e.g., "react.js" → "react", "angularjs" → "angular")
-            skills_array = []
-            if resume.skillset:
-                raw_skills = [s.strip() for s in resume.skillset.split(",") if s.strip()]
-                skills_array = normalize_skill_list(raw_skills)
+            groups: Dict[Tuple[str, str], List[Tuple[ResumeMetadata, List[Dict[str, Any]]]]] = {}
+            for item in await _embed(ready):
+                resume = item[0]
+                groups.setdefault((resume.mastercategory, resume.category), []).append(item)
             
-            # Extract experience_years from experience string
-            experience_years = None
-            if resume.experience:
-                import re
-                match = re.search(r'(\d+(?:\.\d+)?)', resume.experience)
-                if match:
-                    experience_years = int(float(match.group(1)))
+            await asyncio.gather(*(
+                _flush(mastercategory, category, members)
+                for (mastercategory, category), members in groups.items()
+            ))
+        
+        return [(resume.id, outcomes[resume.id]) for resume in resumes]
+    
+    async def _build_resume_vectors(self, resume: ResumeMetadata) -> List[Dict[str, Any]]:
+        """
+        Generate chunk embeddings for a resume and format them as Pinecone vectors.
+        
+        Args:
+            resume: ResumeMetadata object to index
+        
+        Returns:
+            List of vector dicts ('id', 'embedding', 'metadata'); empty if no embeddings were generated
+        """
+        # Generate chunked embeddings for resume text
+        logger.info(
+            f"Generating embeddings for resume {resume.id}",
+            extra={"resume_id": resume.id, "text_length": len(resume.resume_text)}
+        )
+        
+        chunk_embeddings = await self.embedding_service.generate_chunk_embeddings(
+            resume.resume_text,
+            metadata=self._base_metadata(resume)
+        )
+        
+        return self._format_vectors(resume, chunk_embeddings)
+    
+    def _base_metadata(self, resume: ResumeMetadata) -> Dict[str, Any]:
+        """
+        Build the metadata shared by every chunk vector of a resume.
+        
+        Each value is stored under one field only: the name is "candidate_name" and the
+        skills are the normalized "skills" list (the raw skillset string lives in SQL).
+        """
+        # Parse skillset string to array for filtering
+        # Normalize skills to canonical forms (e.g., "react.js" → "react", "angularjs" → "angular")
+        skills_array = _normalized_skills(resume.skillset) if resume.skillset else []
+        
+        # Extract experience_years from experience string
+        experience_years = None
+        if resume.experience:
+            match = _EXP_YEARS_RE.search(resume.experience)
+            if match:
+                experience_years = int(float(match.group(1)))
+        
+        # Prepare base metadata with all resume fields
+        # Normalize designation and jobrole to lowercase for case-insensitive filtering
+        normalized_designation = (resume.designation or "").lower().strip()
+        normalized_jobrole = (resume.jobrole or "").lower().strip()
+        
+        base_metadata = {
+            "resume_id": resume.id,
+            "candidate_id": f"C{resume.id}",  # Generate candidate_id
+            "filename": resume.filename or "unknown",
+            "candidate_name": resume.candidatename or "",
+            "jobrole": normalized_jobrole,  # Lowercase for case-insensitive filtering
+            "designation": normalized_designation,  # Lowercase for case-insensitive filtering
+            "experience": resume.experience or "",
+            "experience_years": experience_years,  # Numeric for filtering
+            "domain": resume.domain or "",
+            "mobile": resume.mobile or "",
+            "email": resume.email or "",
+            "education": resume.education or "",
+            "skills": skills_array,  # Array for Pinecone filtering
+        }
+        
+        return base_metadata
+    
+    def _format_vectors(self, resume: ResumeMetadata, chunk_embeddings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Format chunk embeddings of a resume as Pinecone vectors.
+        
+        Args:
+            resume: ResumeMetadata object the chunks belong to
+            chunk_embeddings: Output of generate_chunk_embeddings for the resume
+        
+        Returns:
+            List of vector dicts ('id', 'embedding', 'metadata'); empty if there were no embeddings
+        """
+        if not chunk_embeddings:
+            logger.warning(
+                f"No embeddings generated for resume {resume.id}",
+                extra={"resume_id": resume.id}
+            )
+            return []
+        
+        # Include full resume_text in metadata (truncate if too large to avoid Pinecone limits)
+        # Pinecone metadata limit is ~40KB, so we'll limit resume_text to 30KB to be safe
+        full_resume_text = resume.resume_text or ""
+        if len(full_resume_text) > 30000:
+            full_resume_text = full_resume_text[:30000] + "...[truncated]"
+        
+        # Format vectors for Pinecone
+        vectors_to_store = []
+        for chunk_data in chunk_embeddings:
+            vector_id = f"resume_{resume.id}_chunk_{chunk_data['chunk_index']}"
             
-            # Prepare base metadata with all resume fields
-            # Normalize designation and jobrole to lowercase for case-insensitive filtering
-            normalized_designation = (resume.designation or "").lower().strip()
-            normalized_jobrole = (resume.jobrole or "").lower().strip()
+            # Get full chunk text (not just preview)
+            chunk_text = chunk_data["text"]
             
-            base_metadata = {
-                "resume_id": resume.id,
-                "candidate_id": f"C{resume.id}",  # Generate candidate_id
-                "filename": resume.filename or "unknown",
-                "candidate_name": resume.candidatename or "",
-                "name": resume.candidatename or "",  # Alias for compatibility
-                "jobrole": normalized_jobrole,  # Lowercase for case-insensitive filtering
-                "designation": normalized_designation,  # Lowercase for case-insensitive filtering
-                "experience": resume.experience or "",
-                "experience_years": experience_years,  # Numeric for filtering
-                "domain": resume.domain or "",
-                "mobile": resume.mobile or "",
-                "email": resume.email or "",
-                "education": resume.education or "",
-                "skillset": resume.skillset or "",  # Keep original string
-                "skills": skills_array,  # Array for Pinecone filtering
+            metadata = {
+                **chunk_data["metadata"],  # Includes all base_metadata fields (resume_id joins back to SQL)
+                "type": "resume",  # Mark as resume vector
+                "chunk_index": chunk_data["chunk_index"],
+                "chunk_text": chunk_text,  # Full chunk text (not just preview)
             }
+            # Full resume text is stored once, on the first chunk, rather than repeated on every chunk
+            if chunk_data["chunk_index"] == 0:
+                metadata["resume_text"] = full_resume_text  # Full resume text (truncated if too large)
             
-            chunk_embeddings = await self.embedding_service.generate_chunk_embeddings(
-                resume.resume_text,
-                metadata=base_metadata
+            vectors_to_store.append({
+                "id": vector_id,
+                "embedding": chunk_data["embedding"],
+                "metadata": metadata
+            })
+        
+        return vectors_to_store
+    
+    async def _mark_indexed(self, resume: ResumeMetadata, vector_count: int) -> bool:
+        """Set pinecone_status to 1 after the resume's vectors were stored."""
+        # Update pinecone_status to 1 (indexed) only after successful storage
+        async with self._db_lock:
+            success = await self.resume_repo.update_pinecone_status(resume.id, 1)
+        
+        if success:
+            logger.info(
+                f"Successfully indexed and updated status for resume {resume.id}",
+                extra={
+                    "resume_id": resume.id,
+                    "vector_count": vector_count,
+                    "mastercategory": resume.mastercategory,
+                    "category": resume.category
+                }
             )
-            
-            if not chunk_embeddings:
-                logger.warning(
-                    f"No embeddings generated for resume {resume.id}",
-                    extra={"resume_id": resume.id}
-                )
+            return True
+        else:
+            logger.warning(
+                f"Indexed resume {resume.id} to Pinecone but failed to update status",
+                extra={"resume_id": resume.id}
+            )
+            # Still return True since Pinecone storage succeeded
+            return True
+    
+    async def _index_single_resume(self, resume: ResumeMetadata) -> bool:
+        """
+        Index a single resume to Pinecone.
+        
+        Args:
+            resume: ResumeMetadata object to index
+        
+        Returns:
+            True if indexing was successful, False otherwise
+        """
+        try:
+            vectors_to_store = await self._build_resume_vectors(resume)
+            if not vectors_to_store:
                 return False
             
-            # Format vectors for Pinecone
-            vectors_to_store = []
-            for chunk_data in chunk_embeddings:
-                vector_id = f"resume_{resume.id}_chunk_{chunk_data['chunk_index']}"
-                
-                # Get full chunk text (not just preview)
-                chunk_text = chunk_data["text"]
-                
-                # Include full resume_text in metadata (truncate if too large to avoid Pinecone limits)
-                # Pinecone metadata limit is ~40KB, so we'll limit resume_text to 30KB to be safe
-                full_resume_text = resume.resume_text or ""
-                if len(full_resume_text) > 30000:
-                    full_resume_text = full_resume_text[:30000] + "...[truncated]"
-                
-                vectors_to_store.append({
-                    "id": vector_id,
-                    "embedding": chunk_data["embedding"],
-                    "metadata": {
-                        **chunk_data["metadata"],  # Includes all base_metadata fields
-                        "type": "resume",  # Mark as resume vector
-                        "chunk_index": chunk_data["chunk_index"],
-                        "chunk_text": chunk_text,  # Full chunk text (not just preview)
-                        "resume_text": full_resume_text,  # Full resume text (truncated if too large)
-                    }
-                })
-            
             # Store embeddings in Pinecone using PineconeAutomation
             # This handles routing to correct index (IT/Non-IT) and namespace (category)
             await self.pinecone_automation.insert_vectors(
@@ -274,27 +483,7 @@ class ResumeIndexingService:
                 category=resume.category  # Use category from database if available
             )
             
-            # Update pinecone_status to 1 (indexed) only after successful storage
-            success = await self.resume_repo.update_pinecone_status(resume.id, 1)
-            
-            if success:
-                logger.info(
-                    f"Successfully indexed and updated status for resume {resume.id}",
-                    extra={
-                        "resume_id": resume.id,
-                        "vector_count": len(vectors_to_store),
-                        "mastercategory": resume.mastercategory,
-                        "category": resume.category
-                    }
-                )
-                return True
-            else:
-                logger.warning(
-                    f"Indexed resume {resume.id} to Pinecone but failed to update status",
-                    extra={"resume_id": resume.id}
-                )
-                # Still return True since Pinecone storage succeeded
-                return True
+            return await self._mark_indexed(resume, len(vectors_to_store))
         
         except Exception as e:
             logger.error(
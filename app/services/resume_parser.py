@@ -1,16 +1,31 @@
 """Service for parsing resumes and extracting text from files."""
+import asyncio
+import atexit
+import hashlib
+import math
+import multiprocessing
 import os
 import re
 import html
 import subprocess
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from io import BytesIO
-from typing import Optional
+from typing import IO, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from docx import Document
 import PyPDF2
 
+from app.config import settings
+from app.services.extraction_cache import extraction_cache
+from app.services.fileconverter import UNOSERVER_AVAILABLE, convert_doc_to_docx_in_memory
+from app.services.ocr_kernels import NUMBA_AVAILABLE as OCR_KERNELS_JIT, gray_otsu_binarize
 from app.utils.logging import get_logger
 from app.utils.safe_logger import safe_extra
 from app.utils.cleaning import normalize_text
@@ -29,9 +44,18 @@ except ImportError:
     np = None
     logger.warning("OCR libraries (pytesseract, PIL, opencv) not available. Image-based resumes cannot be processed without OCR.")
 
+# Try to import tesserocr (in-process Tesseract API; pytesseract starts a tesseract
+# process and reloads the language model for every image)
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+    logger.debug("tesserocr not available. OCR will use pytesseract (one tesseract process per image).")
+
 # Try to import pdf2image for scanned PDF OCR
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
@@ -54,6 +78,24 @@ except ImportError:
     HTML_PARSING_AVAILABLE = False
     logger.warning("BeautifulSoup not available. HTML-based resumes cannot be processed without it.")
 
+# BeautifulSoup tree builder: lxml (C) is several times faster than the pure-Python html.parser
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+    BS4_PARSER = "lxml"
+except ImportError:
+    LXML_AVAILABLE = False
+    BS4_PARSER = "html.parser"
+    logger.debug("lxml not available. HTML will be parsed with the slower html.parser.")
+
+# Try to import selectolax for fast tag stripping in the HTML fallback path
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.debug("selectolax not available. HTML fallback extraction will strip tags with regex.")
+
 # Try to import Apache Tika for .doc file support (PRIMARY METHOD - Currently Working)
 try:
     from tika import parser as tika_parser
@@ -70,15 +112,730 @@ except ImportError:
     OLEFILE_AVAILABLE = False
     logger.debug("olefile not available. Will use Tika only for .doc files.")
 
-# Check for antiword command-line tool
-ANTIWORD_AVAILABLE = shutil.which("antiword") is not None
-if not ANTIWORD_AVAILABLE:
-    logger.debug("antiword command not found. Install it for better .doc extraction.")
 
-# Check for LibreOffice command-line tool
-LIBREOFFICE_AVAILABLE = shutil.which("soffice") is not None or shutil.which("libreoffice") is not None
-if not LIBREOFFICE_AVAILABLE:
-    logger.debug("LibreOffice not found. Install it for most reliable .doc conversion.")
+# Command-line tools (antiword, LibreOffice) are probed on the first .doc file, not at import,
+# and each PATH lookup is done once per process
+@lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    path = shutil.which(command)
+    if path is None:
+        logger.debug(f"{command} command not found.")
+    return path
+
+
+def _antiword_available() -> bool:
+    """Whether antiword is installed (better .doc extraction)."""
+    return _which("antiword") is not None
+
+
+def _libreoffice_cmd() -> Optional[str]:
+    """LibreOffice executable (most reliable .doc conversion), or None if not installed."""
+    return _which("soffice") or _which("libreoffice")
+
+
+# Forwarding headers removed by the HTML fallback extraction, as one alternation (single pass)
+_HTML_FALLBACK_FWD_RE = re.compile(
+    r'(?:Forwarded\s+By:.*?\n'
+    r'|To:\s*\[.*?\]\s*\n'
+    r'|From:.*?\n'
+    r'|Resume\s+Link:.*?\n'
+    r'|Comments:.*?\n'
+    r'|This\s+resume\s+has\s+been\s+forwarded.*?\n'
+    r'|This\s+email\s+was\s+sent.*?\n)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Forwarding sections removed by _extract_html_text; each runs up to the end of its line
+# or the start of the candidate's profile, whichever comes first
+_HTML_FWD_PATTERN = re.compile(
+    r'(?:Forwarded\s+By:'
+    r'|To:\s*\[.*?\]\s*\n'
+    r'|From:'
+    r'|Resume\s+Link:'
+    r'|Comments:'
+    r'|I\s+thought\s+you\s+might\s+be\s+interested'
+    r'|This\s+resume\s+has\s+been\s+forwarded'
+    r'|This\s+email\s+was\s+sent'
+    r'|Email\s+ID\s+[A-Z0-9]+'
+    r'|If\s+you\s+have\s+questions.*?CareerBuilder)'
+    r'.*?(?=\n|Personal\s+Profile|Name\s*:)',
+    re.IGNORECASE | re.DOTALL
+)
+_HTML_PROFILE_START_RE = re.compile(r'(?i)(Personal\s+Profile|Name\s*:|\bRESUME\b)')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+# Shared tesserocr API handle; TessBaseAPI is not thread-safe, so calls are serialized
+_tess_api = None
+_tess_lock = threading.Lock()
+
+
+def _get_tess_api():
+    """Return the process-wide tesserocr API, loading the English model on first use."""
+    global _tess_api
+    if _tess_api is None:
+        _tess_api = PyTessBaseAPI(lang="eng", psm=PSM.AUTO)
+        atexit.register(_tess_api.End)
+    return _tess_api
+
+
+def _ocr_image(image, psm: int = 3) -> str:
+    """
+    Run English OCR on a PIL image.
+    
+    Args:
+        image: PIL image to recognize
+        psm: Tesseract page segmentation mode (3 = automatic, Tesseract's default)
+    
+    Returns:
+        Recognized text
+    """
+    if TESSEROCR_AVAILABLE:
+        with _tess_lock:
+            api = _get_tess_api()
+            # PSM enum values are Tesseract's numeric page segmentation modes
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            return api.GetUTF8Text()
+    return pytesseract.image_to_string(image, lang='eng', config=f'--psm {psm}')
+
+
+def _ocr_image_scored(image, psm: int = 3) -> Tuple[str, float]:
+    """
+    Run English OCR on a PIL image and report Tesseract's mean word confidence.
+    
+    Args:
+        image: PIL image to recognize
+        psm: Tesseract page segmentation mode
+    
+    Returns:
+        (recognized text, mean word confidence 0-100; 0 if no words were found)
+    """
+    if TESSEROCR_AVAILABLE:
+        with _tess_lock:
+            api = _get_tess_api()
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+            return text, float(max(api.MeanTextConf(), 0))
+    
+    # One pass that yields both words and confidences; lines are rebuilt from the word boxes
+    data = pytesseract.image_to_data(image, lang='eng', config=f'--psm {psm}', output_type=pytesseract.Output.DICT)
+    lines = {}
+    confidences = []
+    for word, conf, block, par, line in zip(
+        data["text"], data["conf"], data["block_num"], data["par_num"], data["line_num"]
+    ):
+        conf = float(conf)
+        if conf < 0 or not word.strip():
+            continue
+        confidences.append(conf)
+        lines.setdefault((block, par, line), []).append(word)
+    text = "\n".join(" ".join(words) for words in lines.values())
+    return text, (sum(confidences) / len(confidences) if confidences else 0.0)
+
+
+def _ocr_image_psm_passes(
+    image, psm_modes: List[int], is_confident: Callable[[str, float], bool]
+) -> List[Tuple[int, str, float]]:
+    """
+    OCR one image under several page segmentation modes, stopping at the first confident pass.
+    
+    With tesserocr the image is handed to Tesseract once (SetImage copies and binarizes
+    it) and only the segmentation mode changes between passes.
+    
+    Args:
+        image: PIL image to recognize
+        psm_modes: Page segmentation modes to try, in order
+        is_confident: Called with (text, mean confidence); True stops further passes
+    
+    Returns:
+        (psm, text, mean confidence) for each pass that ran; failed passes are skipped
+    """
+    passes = []
+    if TESSEROCR_AVAILABLE:
+        with _tess_lock:
+            api = _get_tess_api()
+            api.SetImage(image)
+            width, height = image.size
+            for psm in psm_modes:
+                try:
+                    api.SetPageSegMode(psm)
+                    # Resetting the rectangle drops the previous pass's results but keeps the image
+                    api.SetRectangle(0, 0, width, height)
+                    text = api.GetUTF8Text()
+                    conf = float(max(api.MeanTextConf(), 0))
+                except Exception as pass_error:
+                    logger.debug(f"OCR pass with psm {psm} failed: {pass_error}")
+                    continue
+                passes.append((psm, text, conf))
+                if is_confident(text, conf):
+                    break
+        return passes
+    
+    for psm in psm_modes:
+        try:
+            text, conf = _ocr_image_scored(image, psm=psm)
+        except Exception as pass_error:
+            logger.debug(f"OCR pass with psm {psm} failed: {pass_error}")
+            continue
+        passes.append((psm, text, conf))
+        if is_confident(text, conf):
+            break
+    return passes
+
+
+def _preprocess_for_ocr(image):
+    """
+    Binarize an image for OCR: grayscale, then Otsu thresholding.
+    
+    Tesseract is faster and more accurate on clean binary input than on photos or
+    unevenly lit scans of embedded images.
+    
+    Args:
+        image: PIL image in any mode
+    
+    Returns:
+        Binarized PIL image
+    """
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    img_array = np.array(image)
+    if OCR_KERNELS_JIT:
+        # Fused Numba kernel: same result without the intermediate BGR and gray copies
+        return Image.fromarray(gray_otsu_binarize(img_array))
+    img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+    return Image.fromarray(thresh)
+
+
+# Raw page pixels passed to OCR workers: (PIL mode, width, height, samples)
+PageImage = Tuple[str, int, int, bytes]
+
+
+def _ocr_page(page_image: PageImage, page_idx: int, filename: str = "resume.pdf") -> Tuple[str, float]:
+    """
+    OCR one rendered PDF page, trying several thresholding methods and segmentation modes.
+    
+    Top-level (picklable) so pages can be recognized in worker processes.
+    
+    Args:
+        page_image: Raw page pixels as (PIL mode, width, height, samples)
+        page_idx: Zero-based page index (for logging)
+        filename: Name of the file (for logging)
+    
+    Returns:
+        (best text recognized on the page, its mean word confidence); ("", 0.0) if nothing was recognized
+    """
+    mode, width, height, samples = page_image
+    page = Image.frombytes(mode, (width, height), samples)
+    logger.debug(f"Processing PDF page {page_idx+1} with enhanced OCR")
+    
+    # Convert PIL image to OpenCV format for preprocessing
+    img_array = np.array(page)
+    original_size = page.size
+    
+    # Scale up if image is too small (better OCR accuracy)
+    if page.size[0] < 1200 or page.size[1] < 1200:
+        scale_factor = max(1200 / page.size[0], 1200 / page.size[1])
+        new_size = (int(page.size[0] * scale_factor), int(page.size[1] * scale_factor))
+        page = page.resize(new_size, Image.Resampling.LANCZOS)
+        img_array = np.array(page)
+        logger.debug(f"Scaled PDF page {page_idx+1} from {original_size} to {new_size} for better OCR")
+    
+    # Convert RGB to BGR for OpenCV
+    if len(img_array.shape) == 3:
+        img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        # Convert to grayscale
+        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img_array
+    
+    # Noise removal
+    denoised = cv2.medianBlur(gray, 3)
+    
+    # Try multiple preprocessing methods and OCR configurations
+    best_text = ""
+    best_length = 0
+    best_conf = 0.0
+    
+    # Method 1: OTSU thresholding
+    try:
+        thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+        processed_image = Image.fromarray(thresh)
+        page_text, conf = _ocr_image_scored(processed_image, psm=6)
+        if len(page_text.strip()) > best_length:
+            best_text, best_conf = page_text, conf
+            best_length = len(page_text.strip())
+    except:
+        pass
+    
+    # Method 2: Adaptive thresholding
+    try:
+        adaptive = cv2.adaptiveThreshold(denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+        processed_image = Image.fromarray(adaptive)
+        page_text, conf = _ocr_image_scored(processed_image, psm=6)
+        if len(page_text.strip()) > best_length:
+            best_text, best_conf = page_text, conf
+            best_length = len(page_text.strip())
+    except:
+        pass
+    
+    # Method 3: Try different PSM modes
+    psm_modes = [6, 11, 12, 3]
+    for psm in psm_modes:
+        try:
+            thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+            processed_image = Image.fromarray(thresh)
+            page_text, conf = _ocr_image_scored(processed_image, psm=psm)
+            if len(page_text.strip()) > best_length:
+                best_text, best_conf = page_text, conf
+                best_length = len(page_text.strip())
+        except:
+            continue
+    
+    # Use the best result
+    if best_text.strip():
+        logger.debug(f"Extracted {best_length} chars from page {page_idx+1} using best OCR method (confidence {best_conf:.0f})")
+        return best_text, best_conf
+    
+    # Last resort: try basic OCR without preprocessing
+    try:
+        return _ocr_image_scored(page)
+    except Exception as ocr_page_error:
+        logger.warning(
+            f"OCR failed for page {page_idx+1} of {filename}: {ocr_page_error}",
+            extra={"file_name": filename, "page": page_idx+1, "error": str(ocr_page_error)}
+        )
+        return "", 0.0
+
+
+def _init_ocr_worker() -> None:
+    """Preload the OCR worker's Tesseract handle (its OpenMP limit is set before it starts)."""
+    if TESSEROCR_AVAILABLE:
+        # Load the model while the parent renders the first pages, not on the first page
+        _get_tess_api()
+
+
+# Process pool for page-parallel OCR (created on first multi-page scan)
+_ocr_executor: Optional[ProcessPoolExecutor] = None
+_ocr_executor_lock = threading.Lock()
+
+# Pages rendered ahead of the OCR workers; bounds peak memory on very large scans
+OCR_RENDER_AHEAD = 2
+
+# Resubmissions of a page whose worker crashed (or whose pool was reset) before giving up
+OCR_PAGE_MAX_RETRIES = 2
+
+# Result of a page that timed out or whose worker kept failing; the negative confidence
+# (Tesseract's own scale is 0-100) keeps such pages out of DPI escalation
+OCR_PAGE_FAILED: Tuple[str, float] = ("", -1.0)
+
+# An image OCR pass at least this confident and long is accepted without trying the
+# remaining threshold/PSM combinations
+IMAGE_OCR_CONFIDENT_MIN_CONF = 80.0
+IMAGE_OCR_CONFIDENT_MIN_CHARS = 200
+
+# Long side (px) of the downscaled copy used to estimate the deskew angle
+DESKEW_ESTIMATE_MAX_SIDE = 800
+
+
+def _ocr_worker_count() -> int:
+    return settings.ocr_process_workers or max(1, (os.cpu_count() or 2) // 2)
+
+
+def _get_ocr_executor() -> ProcessPoolExecutor:
+    """Return the OCR process pool, creating it on first use (or after a reset)."""
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is None:
+            # libgomp reads OMP_THREAD_LIMIT once, when libtesseract loads at import, so it
+            # must be in the environment a worker starts with; setting it in the worker is too
+            # late. Workers may be started later (on demand or as replacements), so it stays set
+            # here. The parent's own OpenMP runtime is already initialized and is unaffected.
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            # Spawned (not forked) workers: the pool is created from request threads, and a
+            # fork would copy a process full of threads, locks and the parent's Tesseract handle
+            _ocr_executor = ProcessPoolExecutor(
+                max_workers=_ocr_worker_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_ocr_worker
+            )
+        return _ocr_executor
+
+
+def _reset_ocr_executor(executor: ProcessPoolExecutor) -> None:
+    """
+    Kill an OCR pool's workers and drop it, so the next _get_ocr_executor starts a fresh one.
+    
+    Future.cancel() cannot stop a page that is already running, so terminating the
+    worker processes is the only way to free a worker stuck on a pathological page.
+    Other documents' pages in the same pool fail with BrokenProcessPool and are resubmitted.
+    """
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is executor:
+            _ocr_executor = None
+    # ProcessPoolExecutor has no public API to stop running tasks
+    for process in list((executor._processes or {}).values()):
+        if process.is_alive():
+            process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_ocr_executor() -> None:
+    with _ocr_executor_lock:
+        executor = _ocr_executor
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _ocr_pages(pages: Iterable[PageImage], filename: str) -> List[Tuple[str, float]]:
+    """
+    OCR rendered PDF pages as they are produced, in parallel across processes.
+    
+    `pages` is consumed lazily: only the pages being recognized plus OCR_RENDER_AHEAD
+    rendered ones are held in memory, so the next page renders while earlier ones are OCRed.
+    At most one page per worker is submitted at a time, so each page starts running when
+    it is submitted and its settings.ocr_page_timeout_seconds budget counts from there.
+    
+    Args:
+        pages: Raw page images, in order (typically a generator that renders them)
+        filename: Name of the file (for logging)
+    
+    Returns:
+        (text, mean word confidence) of each page, in page order; OCR_PAGE_FAILED for
+        pages that timed out or could not be recognized
+    """
+    results: Dict[int, Tuple[str, float]] = {}
+    # (page index, page image, deadline, future, attempt, executor) for submitted pages
+    in_flight = deque()
+    # Rendered pages waiting for a free worker
+    pending = deque()
+    # (page index, page image, attempt) for pages whose worker crashed; each is rerun alone,
+    # since a broken pool fails every page in it and only an isolated rerun shows the culprit
+    retry = deque()
+    # Pools this document reset; a page lost in any other reset was not at fault
+    reset_pools = []
+    workers = _ocr_worker_count()
+    timeout = settings.ocr_page_timeout_seconds
+    # Pixel-identical pages (repeated scans, blank separators) are recognized once
+    first_page_by_digest: Dict[Tuple, int] = {}
+    duplicate_of: Dict[int, int] = {}
+    page_count = 0
+    
+    def reset(executor: ProcessPoolExecutor) -> None:
+        reset_pools.append(executor)
+        _reset_ocr_executor(executor)
+    
+    def submit(page_idx: int, page_image: PageImage, attempt: int = 0) -> None:
+        last_error = None
+        # A pool shut down or broken by another document's reset is replaced once
+        for _ in range(2):
+            executor = _get_ocr_executor()
+            try:
+                future = executor.submit(_ocr_page, page_image, page_idx, filename)
+            except Exception as pool_error:
+                last_error = pool_error
+                reset(executor)
+                continue
+            in_flight.append((page_idx, page_image, time.monotonic() + timeout, future, attempt, executor))
+            return
+        logger.error(
+            f"Could not submit page {page_idx+1} of {filename} for OCR: {last_error}",
+            extra={"file_name": filename, "page": page_idx+1, "error": str(last_error)}
+        )
+        results[page_idx] = OCR_PAGE_FAILED
+    
+    def fill_workers() -> None:
+        while len(in_flight) < workers:
+            if retry:
+                if in_flight:
+                    break
+                submit(*retry.popleft())
+            elif pending and not any(entry[4] for entry in in_flight):
+                submit(*pending.popleft(), 0)
+            else:
+                break
+    
+    def collect_next() -> None:
+        page_idx, page_image, deadline, future, attempt, executor = in_flight.popleft()
+        try:
+            results[page_idx] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            return
+        except FutureTimeoutError:
+            logger.warning(
+                f"OCR of page {page_idx+1} of {filename} exceeded {timeout}s, skipping it",
+                extra={"file_name": filename, "page": page_idx+1}
+            )
+            results[page_idx] = OCR_PAGE_FAILED
+            # Free the stuck worker by restarting the pool; the other pages were not at fault
+            reset(executor)
+            others = [(entry[0], entry[1], entry[4]) for entry in in_flight]
+            in_flight.clear()
+            for other in others:
+                submit(*other)
+            return
+        except Exception as pool_error:
+            if isinstance(pool_error, (BrokenProcessPool, CancelledError)):
+                with _ocr_executor_lock:
+                    reset_elsewhere = executor is not _ocr_executor and executor not in reset_pools
+                if reset_elsewhere:
+                    # Another document restarted the pool under this page; rerun it without
+                    # counting the attempt, keeping it isolated if it was already being retried
+                    if attempt:
+                        retry.appendleft((page_idx, page_image, attempt))
+                    else:
+                        pending.appendleft((page_idx, page_image))
+                    return
+                reset(executor)
+            if attempt >= OCR_PAGE_MAX_RETRIES:
+                logger.error(
+                    f"OCR failed for page {page_idx+1} of {filename} after {attempt + 1} attempts: {pool_error}",
+                    extra={"file_name": filename, "page": page_idx+1, "error": str(pool_error)}
+                )
+                results[page_idx] = OCR_PAGE_FAILED
+                return
+            logger.warning(
+                f"OCR worker failed for page {page_idx+1} of {filename}, resubmitting it: {pool_error}",
+                extra={"file_name": filename, "page": page_idx+1, "error": str(pool_error)}
+            )
+            retry.append((page_idx, page_image, attempt + 1))
+    
+    for page_idx, page_image in enumerate(pages):
+        page_count += 1
+        key = (page_image[:3], hashlib.blake2b(page_image[3], digest_size=16).digest())
+        if key in first_page_by_digest:
+            duplicate_of[page_idx] = first_page_by_digest[key]
+            continue
+        first_page_by_digest[key] = page_idx
+        
+        pending.append((page_idx, page_image))
+        fill_workers()
+        while len(pending) > OCR_RENDER_AHEAD:
+            collect_next()
+            fill_workers()
+    
+    while pending or retry or in_flight:
+        fill_workers()
+        if in_flight:
+            collect_next()
+    
+    if duplicate_of:
+        logger.debug(
+            f"Reused OCR results for {len(duplicate_of)} duplicate page(s) in {filename}",
+            extra={"file_name": filename, "duplicate_pages": len(duplicate_of)}
+        )
+    return [results[duplicate_of.get(page_idx, page_idx)] for page_idx in range(page_count)]
+
+
+# WordprocessingML element tags used by the DOCX fast path
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W_NS + "body"
+_W_HDR = _W_NS + "hdr"
+_W_FTR = _W_NS + "ftr"
+_W_P = _W_NS + "p"
+_W_TC = _W_NS + "tc"
+_W_TR = _W_NS + "tr"
+_W_TBL = _W_NS + "tbl"
+# Run content as python-docx renders it (w:t is handled separately; w:br depends on its type)
+_W_T = _W_NS + "t"
+_W_BR = _W_NS + "br"
+_W_R = _W_NS + "r"
+_W_HYPERLINK = _W_NS + "hyperlink"
+_W_BR_TYPE = _W_NS + "type"
+_W_RUN_CHARS = {_W_NS + "tab": "\t", _W_NS + "ptab": "\t", _W_NS + "cr": "\n", _W_NS + "noBreakHyphen": "-"}
+
+
+def _paragraph_text(p) -> str:
+    """Text of a w:p element, equivalent to python-docx's Paragraph.text."""
+    parts = []
+    for child in p:
+        # Runs directly in the paragraph or in a hyperlink; runs inside tracked changes are skipped
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterchildren(_W_R)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                if item.tag == _W_T:
+                    parts.append(item.text or "")
+                elif item.tag == _W_BR:
+                    # Page and column breaks render as nothing, line breaks as a newline
+                    if item.get(_W_BR_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif item.tag in _W_RUN_CHARS:
+                    parts.append(_W_RUN_CHARS[item.tag])
+    return "".join(parts)
+
+
+def _iter_docx_part(part, root_tag: str) -> Tuple[List[str], List[str]]:
+    """
+    Stream one DOCX XML part and collect its text.
+    
+    Args:
+        part: File-like object with the part XML (e.g. word/document.xml)
+        root_tag: Tag of the element whose direct paragraphs count (w:body, w:hdr or w:ftr)
+    
+    Returns:
+        (non-empty direct paragraphs, rows of direct tables with cells joined by " | ")
+    """
+    paragraphs = []
+    table_rows = []
+    cell_paragraphs = []
+    row_cells = []
+    
+    def is_top_level_table(tbl) -> bool:
+        return tbl is not None and tbl.getparent() is not None and tbl.getparent().tag == root_tag
+    
+    for _, el in lxml_etree.iterparse(part, events=("end",), tag=(_W_P, _W_TC, _W_TR)):
+        parent = el.getparent()
+        if el.tag == _W_P:
+            if parent is None:
+                continue
+            if parent.tag == root_tag:
+                text = _paragraph_text(el).strip()
+                if text:
+                    paragraphs.append(text)
+                el.clear()
+            elif parent.tag == _W_TC and is_top_level_table(parent.getparent().getparent()):
+                cell_paragraphs.append(_paragraph_text(el))
+                el.clear()
+        elif el.tag == _W_TC:
+            if is_top_level_table(parent.getparent()):
+                cell_text = "\n".join(cell_paragraphs).strip()
+                if cell_text:
+                    row_cells.append(cell_text)
+                cell_paragraphs = []
+        elif is_top_level_table(parent):
+            if row_cells:
+                table_rows.append(" | ".join(row_cells))
+            row_cells = []
+            el.clear()
+    
+    return paragraphs, table_rows
+
+
+def _ocr_embedded_image(image_data: Union[bytes, IO[bytes]]) -> str:
+    """
+    Binarize and OCR one embedded image (e.g. from word/media); "" if it can't be read.
+    
+    Top-level (picklable) so images can be recognized in worker processes. In-process
+    callers may pass a seekable stream instead of bytes, which PIL decodes lazily.
+    """
+    try:
+        source = BytesIO(image_data) if isinstance(image_data, bytes) else image_data
+        return _ocr_image(_preprocess_for_ocr(Image.open(source)))
+    except Exception as img_error:
+        logger.debug(f"Failed to extract text from embedded image: {img_error}")
+        return ""
+
+
+def _ocr_images(images: List[bytes], filename: str) -> List[str]:
+    """
+    OCR encoded images, in parallel across the OCR processes when there is more than one.
+    
+    Images still running when their time budget runs out, or lost twice to a broken pool,
+    come back as "" instead of being rerun in this process without a timeout.
+    """
+    if len(images) <= 1:
+        return [_ocr_embedded_image(image) for image in images]
+    texts: List[Optional[str]] = [None] * len(images)
+    last_error = None
+    # A pool broken or reset by another document is replaced once
+    for _ in range(2):
+        todo = [i for i, text in enumerate(texts) if text is None]
+        executor = _get_ocr_executor()
+        # Every worker gets settings.ocr_page_timeout_seconds per image queued on it
+        timeout = settings.ocr_page_timeout_seconds * -(-len(todo) // _ocr_worker_count())
+        try:
+            futures = {executor.submit(_ocr_embedded_image, images[i]): i for i in todo}
+        except Exception as pool_error:
+            last_error = pool_error
+            _reset_ocr_executor(executor)
+            continue
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            try:
+                texts[futures[future]] = future.result()
+            except Exception as pool_error:
+                last_error = pool_error
+        if not_done:
+            logger.warning(
+                f"OCR of {len(not_done)} image(s) in {filename} exceeded {timeout}s, skipping them",
+                extra={"file_name": filename, "images": len(not_done)}
+            )
+            # Free the stuck workers by restarting the pool
+            _reset_ocr_executor(executor)
+            break
+        if None not in texts:
+            break
+        _reset_ocr_executor(executor)
+    else:
+        logger.warning(
+            f"Image OCR failed for {filename}, skipping {texts.count(None)} image(s): {last_error}",
+            extra={"file_name": filename, "error": str(last_error)}
+        )
+    return [text or "" for text in texts]
+
+
+# Recently normalized texts keyed by a BLAKE2b digest of the input; plain dict in LRU
+# order (first key is least recently used). Guarded because extraction runs in threads.
+_NORMALIZE_CACHE_SIZE = 128
+_normalized_cache: Dict[bytes, Optional[str]] = {}
+_normalized_cache_lock = threading.Lock()
+
+
+def _normalize_cached(text: Optional[str]) -> Optional[str]:
+    """normalize_text, reusing the result for text that was normalized recently."""
+    if not text:
+        return normalize_text(text)
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _normalized_cache_lock:
+        if key in _normalized_cache:
+            # Re-insert at the end (most recently used)
+            normalized = _normalized_cache.pop(key)
+            _normalized_cache[key] = normalized
+            return normalized
+    normalized = normalize_text(text)
+    with _normalized_cache_lock:
+        if len(_normalized_cache) >= _NORMALIZE_CACHE_SIZE:
+            # Remove least recently used (first item)
+            _normalized_cache.pop(next(iter(_normalized_cache)), None)
+        _normalized_cache[key] = normalized
+    return normalized
+
+
+# Embedded image types OCRed from a DOCX word/media folder
+_DOCX_IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif')
+
+
+# Runs of printable ASCII (plus tab/LF/CR) in binary .doc data
+_PRINTABLE_ASCII_RUN_RE = re.compile(rb'[\t\n\r\x20-\x7e]+')
+
+
+def _printable_ascii_runs(data: bytes, min_length: int) -> List[str]:
+    """Decoded runs of printable ASCII in data that are at least min_length bytes long."""
+    return [
+        match.group().decode('ascii')
+        for match in _PRINTABLE_ASCII_RUN_RE.finditer(data)
+        if match.end() - match.start() >= min_length
+    ]
+
+
+def _pdf_page_limit(page_count: int, filename: str) -> int:
+    """Number of pages to process, capped at settings.pdf_max_pages."""
+    if page_count > settings.pdf_max_pages:
+        logger.warning(
+            f"{filename} has {page_count} pages, processing only the first {settings.pdf_max_pages}",
+            extra={"file_name": filename, "pages": page_count, "max_pages": settings.pdf_max_pages}
+        )
+        return settings.pdf_max_pages
+    return page_count
 
 
 class ResumeParser:
@@ -171,7 +928,7 @@ class ResumeParser:
             try:
                 if OCR_AVAILABLE and HTML_PARSING_AVAILABLE:
                     # Parse HTML and extract text, then create PDF from text
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = BeautifulSoup(html_content, BS4_PARSER)
                     text = soup.get_text(separator='\n', strip=True)
                     
                     # Create PDF with text
@@ -195,6 +952,8 @@ class ResumeParser:
         Extract text from uploaded file based on extension.
         Supports PDF, DOCX, DOC, TXT, images (JPG, PNG), and HTML files.
         
+        Results are cached by file content hash, so duplicate uploads skip extraction.
+        
         Args:
             file_content: The binary content of the file
             filename: Name of the file (used to determine file type)
@@ -205,6 +964,24 @@ class ResumeParser:
         Raises:
             ValueError: If file type is not supported or extraction fails
         """
+        cache_key = extraction_cache.make_key(file_content, filename)
+        cached_text = extraction_cache.get(cache_key)
+        if cached_text is not None:
+            logger.info(
+                f"Using cached text extraction for {filename}",
+                extra={"file_name": filename, "text_length": len(cached_text)}
+            )
+            return cached_text
+        
+        # Extraction is blocking (PDF parsing, OCR, subprocesses); keep it off the event loop
+        text = await asyncio.to_thread(self._extract_text, file_content, filename)
+        # Empty results are not cached so a later upload retries extraction
+        if text and text.strip():
+            extraction_cache.put(cache_key, text)
+        return text
+    
+    def _extract_text(self, file_content: bytes, filename: str) -> str:
+        """Extract text from a file by dispatching on its extension (uncached, see extract_text)."""
         try:
             filename_lower = filename.lower()
             
@@ -297,28 +1074,22 @@ class ResumeParser:
                     text = file_content.decode('utf-8', errors='ignore')
                     
                     # Remove forwarding headers (HTML-specific filtering)
-                    forwarding_patterns = [
-                        r'(?i)Forwarded\s+By:.*?\n',
-                        r'(?i)To:\s*\[.*?\]\s*\n',
-                        r'(?i)From:.*?\n',
-                        r'(?i)Resume\s+Link:.*?\n',
-                        r'(?i)Comments:.*?\n',
-                        r'(?i)This\s+resume\s+has\s+been\s+forwarded.*?\n',
-                        r'(?i)This\s+email\s+was\s+sent.*?\n',
-                    ]
-                    for pattern in forwarding_patterns:
-                        text = re.sub(pattern, '', text, flags=re.DOTALL)
+                    text = _HTML_FALLBACK_FWD_RE.sub('', text)
                     
-                    # Remove HTML tags with regex
-                    text = re.sub(r'<[^>]+>', ' ', text)
-                    # Decode HTML entities
-                    try:
-                        text = html.unescape(text)
-                    except:
-                        pass
+                    if SELECTOLAX_AVAILABLE:
+                        # Single C pass; also decodes HTML entities
+                        text = HTMLParser(text).text(separator=' ')
+                    else:
+                        # Remove HTML tags with regex
+                        text = _HTML_TAG_RE.sub(' ', text)
+                        # Decode HTML entities
+                        try:
+                            text = html.unescape(text)
+                        except:
+                            pass
                     text = ' '.join(text.split())
                     if text and len(text.strip()) > 20:
-                        normalized_text = normalize_text(text) or text
+                        normalized_text = _normalize_cached(text) or text
                         logger.info(f"✅ Fallback HTML extraction succeeded for {filename}")
                         return normalized_text
                 except Exception as fallback_error:
@@ -334,252 +1105,204 @@ class ResumeParser:
                 print(f"[CRITICAL] Original error: {error_msg}")
             raise ValueError(f"Failed to extract text from file: {e}")
     
+    def _read_pdf_pages_pymupdf(self, pdf_doc, filename: str) -> List[str]:
+        """Read the text layer of each page of an open PyMuPDF document (MuPDF, C)."""
+        page_texts = []
+        for page_num in range(_pdf_page_limit(len(pdf_doc), filename)):
+            try:
+                page_texts.append(pdf_doc[page_num].get_text("text"))
+            except Exception as page_error:
+                page_texts.append("")
+                logger.warning(
+                    f"Failed to extract text from page {page_num + 1} with PyMuPDF: {page_error}",
+                    extra={"file_name": filename, "page_num": page_num + 1}
+                )
+        return page_texts
+    
+    def _read_pdf_text_pypdf2(self, file_content: bytes, filename: str, pdf_path: Optional[str] = None) -> str:
+        """Read the text layer of a PDF with PyPDF2 (pure Python), from pdf_path if given."""
+        pdf_reader = PyPDF2.PdfReader(pdf_path or BytesIO(file_content))
+        text_parts = []
+        for page_num in range(_pdf_page_limit(len(pdf_reader.pages), filename)):
+            try:
+                page_text = pdf_reader.pages[page_num].extract_text()
+                if page_text:
+                    text_parts.append(page_text)
+            except Exception as page_error:
+                logger.warning(
+                    f"Failed to extract text from a page in {filename}: {page_error}",
+                    extra={"file_name": filename, "page_error": str(page_error)}
+                )
+                continue
+        return "\n".join(text_parts)
+    
     def _extract_pdf_text(self, file_content: bytes, filename: str = "resume.pdf") -> str:
         """
         Extract text from PDF file.
-        First tries regular text extraction, ALWAYS tries OCR for image-based PDFs.
+        Reads the text layer with PyMuPDF (PyPDF2 as fallback), and ALWAYS tries OCR for image-based PDFs.
         For image-based PDFs, OCR is the primary method.
         """
-        normalized_text = ""
-        text_length = 0
-        word_count = 0
+        # Large PDFs are spilled to a temp file that MuPDF and PyPDF2 read on demand,
+        # instead of each parser building its own in-memory view of the whole upload
+        pdf_path = None
+        if len(file_content) > settings.pdf_spill_threshold_mb * 1024 * 1024:
+            try:
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+                    temp_file.write(file_content)
+                    pdf_path = temp_file.name
+            except OSError as e:
+                logger.warning(f"Could not spill {filename} to disk, parsing it in memory: {e}")
         
+        # Parse the PDF with PyMuPDF once; the text layer and OCR passes share the document
+        pdf_doc = None
         try:
-            pdf_file = BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text_parts = []
-            for page in pdf_reader.pages:
+            if PYMUPDF_AVAILABLE:
                 try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                except Exception as page_error:
+                    pdf_doc = fitz.open(pdf_path) if pdf_path else fitz.open(stream=file_content, filetype="pdf")
+                except Exception as e:
                     logger.warning(
-                        f"Failed to extract text from a page in {filename}: {page_error}",
-                        extra={"file_name": filename, "page_error": str(page_error)}
+                        f"PyMuPDF could not open {filename}: {e}, trying PyPDF2 fallback",
+                        extra={"file_name": filename, "error": str(e)}
                     )
-                    continue
             
-            raw_text = "\n".join(text_parts)
-            # Normalize whitespace (remove extra spaces, normalize line breaks)
-            normalized_text = normalize_text(raw_text) or raw_text
-            
-            # Check if extracted text is minimal (likely a scanned PDF)
-            # For image-based PDFs, ALWAYS try OCR - it's the primary extraction method
-            text_length = len(normalized_text.strip())
-            word_count = len(re.findall(r'\b\w+\b', normalized_text)) if normalized_text else 0
-            
-            # Detect if PDF is image-based (scanned PDF):
-            # 1. Very little text extracted (< 100 chars)
-            # 2. Very few words (< 10 words)
-            # 3. Text is mostly whitespace or special characters
-            is_likely_image_based = (
-                text_length < 100 or 
-                word_count < 10 or
-                (text_length > 0 and word_count == 0)  # Has characters but no words
+            return self._extract_pdf_document_text(file_content, filename, pdf_doc, pdf_path)
+        finally:
+            if pdf_doc is not None:
+                pdf_doc.close()
+            if pdf_path and os.path.exists(pdf_path):
+                os.unlink(pdf_path)
+    
+    def _is_image_only_pdf(self, pdf_doc) -> bool:
+        """
+        Whether a PDF looks like a pure scan, judged from its first, middle and last pages.
+        
+        Every sampled page must contain an image and no text block with visible text.
+        """
+        page_count = len(pdf_doc)
+        if page_count == 0:
+            return False
+        
+        for page_num in sorted({0, page_count // 2, page_count - 1}):
+            page = pdf_doc[page_num]
+            if not page.get_image_info():
+                return False
+            # "blocks" entries are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text
+            if any(block[6] == 0 and block[4].strip() for block in page.get_text("blocks")):
+                return False
+        return True
+    
+    def _extract_pdf_document_text(
+        self, file_content: bytes, filename: str, pdf_doc=None, pdf_path: Optional[str] = None
+    ) -> str:
+        """Body of _extract_pdf_text; pdf_doc is the open PyMuPDF document and pdf_path the spilled file, if any."""
+        normalized_text = ""
+        layer_texts = None
+        
+        # Text layer: PyMuPDF first (an order of magnitude faster); PyPDF2 only if PyMuPDF
+        # is unavailable, fails, or finds almost nothing
+        if pdf_doc is not None:
+            try:
+                layer_texts = self._read_pdf_pages_pymupdf(pdf_doc, filename)
+                raw_text = "\n".join(text for text in layer_texts if text)
+                normalized_text = _normalize_cached(raw_text) or raw_text
+            except Exception as e:
+                logger.warning(
+                    f"PyMuPDF extraction failed for {filename}: {e}, trying PyPDF2 fallback",
+                    extra={"file_name": filename, "error": str(e)}
+                )
+        
+        # A scan has no text layer for PyPDF2 to find either; skip its slow pure-Python pass
+        image_only = False
+        if pdf_doc is not None and len(normalized_text.strip()) < 50:
+            try:
+                image_only = self._is_image_only_pdf(pdf_doc)
+            except Exception as e:
+                logger.debug(f"PDF page sampling failed for {filename}: {e}")
+            if image_only:
+                logger.info(
+                    f"Sampled pages of {filename} are images without text, skipping PyPDF2",
+                    extra={"file_name": filename}
+                )
+        
+        if len(normalized_text.strip()) < 50 and not image_only:
+            try:
+                raw_text = self._read_pdf_text_pypdf2(file_content, filename, pdf_path)
+                pypdf2_text = _normalize_cached(raw_text) or raw_text
+                if len(pypdf2_text.strip()) > len(normalized_text.strip()):
+                    normalized_text = pypdf2_text
+            except Exception as e:
+                logger.warning(
+                    f"PyPDF2 extraction failed for {filename}: {e}",
+                    extra={"file_name": filename, "error": str(e)}
+                )
+        
+        # Check if extracted text is minimal (likely a scanned PDF)
+        # For image-based PDFs, ALWAYS try OCR - it's the primary extraction method
+        text_length = len(normalized_text.strip())
+        word_count = len(re.findall(r'\b\w+\b', normalized_text)) if normalized_text else 0
+        
+        # Detect if PDF is image-based (scanned PDF):
+        # 1. Very little text extracted (< 100 chars)
+        # 2. Very few words (< 10 words)
+        # 3. Text is mostly whitespace or special characters
+        is_likely_image_based = (
+            text_length < 100 or 
+            word_count < 10 or
+            (text_length > 0 and word_count == 0)  # Has characters but no words
+        )
+        
+        # ALWAYS try OCR for image-based PDFs if available (OCR is the primary method for them)
+        if is_likely_image_based and OCR_AVAILABLE and (PDF2IMAGE_AVAILABLE or PYMUPDF_AVAILABLE):
+            logger.info(
+                f"📄 PDF text extraction: {text_length} chars, {word_count} words. "
+                f"Detected as image-based PDF. Attempting OCR: {filename}",
+                extra={
+                    "file_name": filename, 
+                    "text_length": text_length,
+                    "word_count": word_count,
+                    "is_image_based": is_likely_image_based
+                }
             )
             
-            # ALWAYS try OCR for PDFs if available (OCR is better for image-based PDFs)
-            # For image-based PDFs, OCR is the primary extraction method
-            # Always attempt OCR if text is minimal OR if we suspect it's image-based
-            if is_likely_image_based:  # More aggressive: try OCR for any suspicious PDF
-                # Try OCR first if available
-                if OCR_AVAILABLE and (PDF2IMAGE_AVAILABLE or PYMUPDF_AVAILABLE):
+            try:
+                ocr_text = self._extract_scanned_pdf_text(file_content, filename, pdf_doc, layer_texts)
+                if ocr_text and len(ocr_text.strip()) > 0:
+                    # OCR succeeded - use OCR text (it's better for image-based PDFs)
+                    ocr_length = len(ocr_text.strip())
+                    ocr_word_count = len(re.findall(r'\b\w+\b', ocr_text)) if ocr_text else 0
                     logger.info(
-                        f"📄 PDF text extraction: {text_length} chars, {word_count} words. "
-                        f"Detected as image-based PDF. Attempting OCR: {filename}",
+                        f"✅ OCR extraction SUCCESS for {filename}: "
+                        f"extracted {ocr_length} chars, {ocr_word_count} words "
+                        f"(vs {text_length} chars, {word_count} words from regular extraction)",
                         extra={
                             "file_name": filename, 
-                            "text_length": text_length,
-                            "word_count": word_count,
-                            "is_image_based": is_likely_image_based
+                            "ocr_text_length": ocr_length,
+                            "ocr_word_count": ocr_word_count,
+                            "regular_text_length": text_length,
+                            "regular_word_count": word_count
                         }
                     )
-                    
-                    try:
-                        ocr_text = self._extract_scanned_pdf_text(file_content, filename)
-                        if ocr_text and len(ocr_text.strip()) > 0:
-                            # OCR succeeded - use OCR text (it's better for image-based PDFs)
-                            ocr_length = len(ocr_text.strip())
-                            ocr_word_count = len(re.findall(r'\b\w+\b', ocr_text)) if ocr_text else 0
-                            
-                            # ALWAYS prefer OCR text if:
-                            # 1. Regular extraction was minimal (< 100 chars OR < 10 words)
-                            # 2. OCR got more text
-                            # 3. OCR got more words (even if same length)
-                            if (is_likely_image_based or 
-                                ocr_length > text_length or 
-                                (ocr_length >= text_length and ocr_word_count > word_count)):
-                                logger.info(
-                                    f"✅ OCR extraction SUCCESS for {filename}: "
-                                    f"extracted {ocr_length} chars, {ocr_word_count} words "
-                                    f"(vs {text_length} chars, {word_count} words from regular extraction)",
-                                    extra={
-                                        "file_name": filename, 
-                                        "ocr_text_length": ocr_length,
-                                        "ocr_word_count": ocr_word_count,
-                                        "regular_text_length": text_length,
-                                        "regular_word_count": word_count
-                                    }
-                                )
-                                return ocr_text
-                            else:
-                                # OCR got less text but regular extraction was good, use regular
-                                logger.info(
-                                    f"Using regular extraction for {filename} "
-                                    f"(OCR: {ocr_length} chars, Regular: {text_length} chars)",
-                                    extra={"file_name": filename, "ocr_text_length": ocr_length, "regular_text_length": text_length}
-                                )
-                        else:
-                            logger.warning(
-                                f"⚠️ OCR extraction returned empty text for PDF: {filename}",
-                                extra={"file_name": filename}
-                            )
-                            # If OCR returned empty and regular extraction was also minimal, return empty
-                            if is_likely_image_based:
-                                logger.warning(
-                                    f"Both OCR and regular extraction failed for image-based PDF: {filename}",
-                                    extra={"file_name": filename, "regular_text_length": text_length, "regular_word_count": word_count}
-                                )
-                                return ""
-                    except Exception as ocr_error:
-                        logger.error(
-                            f"❌ OCR extraction failed for PDF {filename}: {ocr_error}. "
-                            f"Please ensure Tesseract OCR and poppler are installed.",
-                            extra={"file_name": filename, "error": str(ocr_error)},
-                            exc_info=True
-                        )
-                        # If OCR fails and regular extraction was minimal, try PyMuPDF text extraction
-                        if PYMUPDF_AVAILABLE:
-                            logger.info(
-                                f"OCR failed, trying PyMuPDF built-in text extraction for {filename}",
-                                extra={"file_name": filename}
-                            )
-                            try:
-                                pymupdf_doc = fitz.open(stream=file_content, filetype="pdf")
-                                pymupdf_text_parts = []
-                                for page_num in range(len(pymupdf_doc)):
-                                    page = pymupdf_doc[page_num]
-                                    page_text = page.get_text()
-                                    if page_text:
-                                        pymupdf_text_parts.append(page_text)
-                                pymupdf_doc.close()
-                                
-                                if pymupdf_text_parts:
-                                    pymupdf_text = "\n".join(pymupdf_text_parts)
-                                    pymupdf_length = len(pymupdf_text.strip())
-                                    if pymupdf_length > text_length:
-                                        logger.info(
-                                            f"✅ PyMuPDF text extraction SUCCESS for {filename}: "
-                                            f"extracted {pymupdf_length} chars",
-                                            extra={"file_name": filename, "pymupdf_text_length": pymupdf_length}
-                                        )
-                                        return normalize_text(pymupdf_text) or pymupdf_text
-                            except Exception as pymupdf_error:
-                                logger.warning(
-                                    f"PyMuPDF text extraction also failed: {pymupdf_error}",
-                                    extra={"file_name": filename, "error": str(pymupdf_error)}
-                                )
-                elif not OCR_AVAILABLE and PYMUPDF_AVAILABLE:
-                    # OCR not available, but try PyMuPDF text extraction
-                    logger.info(
-                        f"OCR not available, trying PyMuPDF built-in text extraction for {filename}",
-                        extra={"file_name": filename}
-                    )
-                    try:
-                        pdf_file.seek(0)  # Reset file pointer
-                        pymupdf_doc = fitz.open(stream=file_content, filetype="pdf")
-                        pymupdf_text_parts = []
-                        for page_num in range(len(pymupdf_doc)):
-                            page = pymupdf_doc[page_num]
-                            page_text = page.get_text()
-                            if page_text:
-                                pymupdf_text_parts.append(page_text)
-                        pymupdf_doc.close()
-                        
-                        if pymupdf_text_parts:
-                            pymupdf_text = "\n".join(pymupdf_text_parts)
-                            pymupdf_length = len(pymupdf_text.strip())
-                            if pymupdf_length > text_length:
-                                logger.info(
-                                    f"✅ PyMuPDF text extraction SUCCESS for {filename}: "
-                                    f"extracted {pymupdf_length} chars (vs {text_length} from regular extraction)",
-                                    extra={"file_name": filename, "pymupdf_text_length": pymupdf_length, "regular_text_length": text_length}
-                                )
-                                return normalize_text(pymupdf_text) or pymupdf_text
-                    except Exception as pymupdf_error:
-                        logger.warning(
-                            f"PyMuPDF text extraction failed: {pymupdf_error}",
-                            extra={"file_name": filename, "error": str(pymupdf_error)}
-                        )
-            
-            # Return the best text we have (either OCR, PyMuPDF, or regular extraction)
-            if normalized_text and text_length >= 50:
-                return normalized_text
-            elif normalized_text:
+                    return ocr_text
+                
+                # OCR returned empty and regular extraction was also minimal
                 logger.warning(
-                    f"PyPDF2 extracted only {text_length} chars from {filename}, trying PyMuPDF fallback",
-                    extra={"file_name": filename, "text_length": text_length}
-                )
-        except Exception as e:
-            logger.warning(
-                f"PyPDF2 extraction failed for {filename}: {e}, trying PyMuPDF fallback",
-                extra={"file_name": filename, "error": str(e)}
-            )
-        
-        # If PyPDF2 failed or returned insufficient text, try PyMuPDF as fallback
-        if PYMUPDF_AVAILABLE:
-            try:
-                logger.info(
-                    f"Attempting PyMuPDF text extraction for {filename}",
+                    f"⚠️ OCR extraction returned empty text for PDF: {filename}",
                     extra={"file_name": filename}
                 )
-                pymupdf_doc = fitz.open(stream=file_content, filetype="pdf")
-                pymupdf_text_parts = []
-                for page_num in range(len(pymupdf_doc)):
-                    try:
-                        page = pymupdf_doc[page_num]
-                        page_text = page.get_text()
-                        if page_text:
-                            pymupdf_text_parts.append(page_text)
-                    except Exception as page_error:
-                        logger.warning(
-                            f"Failed to extract text from page {page_num + 1} with PyMuPDF: {page_error}",
-                            extra={"file_name": filename, "page_num": page_num + 1}
-                        )
-                        continue
-                pymupdf_doc.close()
-                
-                if pymupdf_text_parts:
-                    pymupdf_text = "\n".join(pymupdf_text_parts)
-                    pymupdf_normalized = normalize_text(pymupdf_text) or pymupdf_text
-                    pymupdf_length = len(pymupdf_normalized.strip())
-                    pymupdf_word_count = len(re.findall(r'\b\w+\b', pymupdf_normalized)) if pymupdf_normalized else 0
-                    
-                    if pymupdf_length > text_length or (pymupdf_length >= 50 and text_length < 50):
-                        logger.info(
-                            f"✅ PyMuPDF text extraction SUCCESS for {filename}: "
-                            f"extracted {pymupdf_length} chars, {pymupdf_word_count} words",
-                            extra={
-                                "file_name": filename,
-                                "pymupdf_text_length": pymupdf_length,
-                                "pymupdf_word_count": pymupdf_word_count,
-                                "regular_text_length": text_length
-                            }
-                        )
-                        return pymupdf_normalized
-                    else:
-                        logger.debug(
-                            f"PyMuPDF extracted {pymupdf_length} chars (not better than PyPDF2's {text_length})",
-                            extra={"file_name": filename, "pymupdf_length": pymupdf_length, "text_length": text_length}
-                        )
-            except Exception as pymupdf_error:
                 logger.warning(
-                    f"PyMuPDF text extraction also failed for {filename}: {pymupdf_error}",
-                    extra={"file_name": filename, "error": str(pymupdf_error)}
+                    f"Both OCR and regular extraction failed for image-based PDF: {filename}",
+                    extra={"file_name": filename, "regular_text_length": text_length, "regular_word_count": word_count}
+                )
+                return ""
+            except Exception as ocr_error:
+                logger.error(
+                    f"❌ OCR extraction failed for PDF {filename}: {ocr_error}. "
+                    f"Please ensure Tesseract OCR and poppler are installed.",
+                    extra={"file_name": filename, "error": str(ocr_error)},
+                    exc_info=True
                 )
         
-        # If we have any text from PyPDF2, return it (even if minimal)
+        # Return the best text layer we have (even if minimal)
         if normalized_text:
             return normalized_text
         
@@ -590,97 +1313,131 @@ class ResumeParser:
         )
         raise ValueError(f"Failed to extract text from PDF: All extraction methods failed")
     
+    def _read_docx_text_fast(self, docx_zip: zipfile.ZipFile, filename: str) -> List[str]:
+        """
+        Read DOCX text by streaming the part XML with lxml iterparse.
+        
+        Produces the same parts as _read_docx_text_python_docx: body paragraphs, then
+        top-level table rows (cells joined with " | "), then header and footer paragraphs.
+        Each paragraph is cleared once read, so memory stays flat on large documents.
+        """
+        names = docx_zip.namelist()
+        with docx_zip.open('word/document.xml') as part:
+            paragraphs, table_rows = _iter_docx_part(part, _W_BODY)
+        
+        hf_parts = []
+        for prefix in ('word/header', 'word/footer'):
+            for name in sorted(n for n in names if n.startswith(prefix) and n.endswith('.xml')):
+                with docx_zip.open(name) as part:
+                    hf_parts.extend(_iter_docx_part(part, _W_HDR if prefix == 'word/header' else _W_FTR)[0])
+        
+        if table_rows:
+            logger.debug(f"Extracted {len(table_rows)} table rows in {filename}")
+        return paragraphs + table_rows + hf_parts
+    
+    def _read_docx_text_python_docx(self, file_content: bytes, filename: str) -> List[str]:
+        """Read DOCX text through python-docx's object model."""
+        doc_file = BytesIO(file_content)
+        doc = Document(doc_file)
+        text_parts = []
+        
+        # Extract from paragraphs (paragraph.text already joins all runs, whatever their formatting)
+        for paragraph in doc.paragraphs:
+            para_text = paragraph.text.strip()
+            if para_text:
+                text_parts.append(para_text)
+        
+        # Extract from tables (contact info is often in tables)
+        # Tables are critical for resumes - contact info is often in header tables
+        for table_idx, table in enumerate(doc.tables):
+            table_text_parts = []
+            # row.cells repeats a merged cell once per grid column/row it spans; read each cell once
+            seen_cells = set()
+            for row in table.rows:
+                row_text_parts = []
+                for cell in row.cells:
+                    if cell._tc in seen_cells:
+                        continue
+                    seen_cells.add(cell._tc)
+                    cell_text = cell.text.strip()
+                    # cell.text already joins the cell's paragraphs
+                    if cell_text:
+                        row_text_parts.append(cell_text)
+                if row_text_parts:
+                    # Join row cells with separator for better readability
+                    table_text_parts.append(' | '.join(row_text_parts))
+            if table_text_parts:
+                text_parts.extend(table_text_parts)
+                logger.debug(f"Extracted {len(table_text_parts)} rows from table {table_idx+1} in {filename}")
+        
+        # Extract from headers and footers (contact info is often in headers)
+        # Headers are VERY important for contact information
+        for section_idx, section in enumerate(doc.sections):
+            # Header (a header linked to the previous section repeats that section's text)
+            if section.header and not section.header.is_linked_to_previous:
+                header_parts = []
+                for paragraph in section.header.paragraphs:
+                    header_text = paragraph.text.strip()
+                    if header_text:
+                        header_parts.append(header_text)
+                if header_parts:
+                    text_parts.extend(header_parts)
+                    logger.debug(f"Extracted {len(header_parts)} header parts from section {section_idx+1} in {filename}")
+            
+            # Footer
+            if section.footer and not section.footer.is_linked_to_previous:
+                footer_parts = []
+                for paragraph in section.footer.paragraphs:
+                    footer_text = paragraph.text.strip()
+                    if footer_text:
+                        footer_parts.append(footer_text)
+                if footer_parts:
+                    text_parts.extend(footer_parts)
+                    logger.debug(f"Extracted {len(footer_parts)} footer parts from section {section_idx+1} in {filename}")
+        
+        return text_parts
+    
     def _extract_docx_text(self, file_content: bytes, filename: str = "resume.docx") -> str:
         """
         Extract text from DOCX file.
         Also extracts text from embedded images using OCR if available.
         Enhanced to handle more edge cases and better text extraction.
         """
+        docx_zip = None
         try:
-            doc_file = BytesIO(file_content)
-            doc = Document(doc_file)
-            text_parts = []
-            
-            # Extract from paragraphs (including runs with different formatting)
-            for paragraph in doc.paragraphs:
-                para_text = paragraph.text.strip()
-                if para_text:
-                    text_parts.append(para_text)
-                # Also check individual runs (sometimes text is split across runs)
-                for run in paragraph.runs:
-                    run_text = run.text.strip()
-                    if run_text and run_text not in para_text:
-                        text_parts.append(run_text)
-            
-            # Extract from tables (contact info is often in tables)
-            # Tables are critical for resumes - contact info is often in header tables
-            for table_idx, table in enumerate(doc.tables):
-                table_text_parts = []
-                for row in table.rows:
-                    row_text_parts = []
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
-                        if cell_text:
-                            row_text_parts.append(cell_text)
-                            # Also check cell paragraphs individually
-                            for para in cell.paragraphs:
-                                para_text = para.text.strip()
-                                if para_text and para_text not in cell_text:
-                                    row_text_parts.append(para_text)
-                    if row_text_parts:
-                        # Join row cells with separator for better readability
-                        table_text_parts.append(' | '.join(row_text_parts))
-                if table_text_parts:
-                    text_parts.extend(table_text_parts)
-                    logger.debug(f"Extracted {len(table_text_parts)} rows from table {table_idx+1} in {filename}")
-            
-            # Extract from headers and footers (contact info is often in headers)
-            # Headers are VERY important for contact information
-            for section_idx, section in enumerate(doc.sections):
-                # Header
-                if section.header:
-                    header_parts = []
-                    for paragraph in section.header.paragraphs:
-                        header_text = paragraph.text.strip()
-                        if header_text:
-                            header_parts.append(header_text)
-                        # Also check runs in header
-                        for run in paragraph.runs:
-                            run_text = run.text.strip()
-                            if run_text and run_text not in header_text:
-                                header_parts.append(run_text)
-                    if header_parts:
-                        text_parts.extend(header_parts)
-                        logger.debug(f"Extracted {len(header_parts)} header parts from section {section_idx+1} in {filename}")
-                
-                # Footer
-                if section.footer:
-                    footer_parts = []
-                    for paragraph in section.footer.paragraphs:
-                        footer_text = paragraph.text.strip()
-                        if footer_text:
-                            footer_parts.append(footer_text)
-                        # Also check runs in footer
-                        for run in paragraph.runs:
-                            run_text = run.text.strip()
-                            if run_text and run_text not in footer_text:
-                                footer_parts.append(run_text)
-                    if footer_parts:
-                        text_parts.extend(footer_parts)
-                        logger.debug(f"Extracted {len(footer_parts)} footer parts from section {section_idx+1} in {filename}")
+            # Open the package once; the fast parse, image OCR and XML fallback all read from it
+            try:
+                docx_zip = zipfile.ZipFile(BytesIO(file_content))
+            except zipfile.BadZipFile as zip_error:
+                logger.debug(f"{filename} is not a ZIP package, using python-docx only: {zip_error}")
+            
+            # Fast path: read the WordprocessingML parts directly with lxml; python-docx builds
+            # a full object model and is only needed if the fast parse fails or finds (almost) nothing
+            text_parts = None
+            if LXML_AVAILABLE and docx_zip is not None:
+                try:
+                    text_parts = self._read_docx_text_fast(docx_zip, filename)
+                except Exception as fast_error:
+                    logger.debug(f"Fast DOCX parse failed for {filename}, using python-docx: {fast_error}")
+            if text_parts is not None and sum(len(part) for part in text_parts) < 10:
+                logger.debug(f"Fast DOCX parse found minimal text in {filename}, retrying with python-docx")
+                try:
+                    fallback_parts = self._read_docx_text_python_docx(file_content, filename)
+                    if sum(len(part) for part in fallback_parts) > sum(len(part) for part in text_parts):
+                        text_parts = fallback_parts
+                except Exception as docx_error:
+                    logger.debug(f"python-docx parse failed for {filename}: {docx_error}")
+            if text_parts is None:
+                text_parts = self._read_docx_text_python_docx(file_content, filename)
             
             # Extract text from embedded images using OCR (if available)
             # This is important for resumes where contact info might be in images
-            if OCR_AVAILABLE:
+            if OCR_AVAILABLE and docx_zip is not None:
                 try:
                     # DOCX files are ZIP archives containing XML and media files
-                    # Create a new BytesIO from the original content since doc_file position may have changed
-                    doc_file_for_zip = BytesIO(file_content)
-                    docx_zip = zipfile.ZipFile(doc_file_for_zip)
-                    
                     # Look for images in the media folder
                     image_files = [f for f in docx_zip.namelist() if f.startswith('word/media/') and 
-                                  f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'))]
+                                  f.lower().endswith(_DOCX_IMAGE_EXTS)]
                     
                     if image_files:
                         logger.info(
@@ -688,36 +1445,20 @@ class ResumeParser:
                             extra={"image_count": len(image_files)}
                         )
                         
-                        for image_path in image_files:
-                            try:
-                                # Extract image from DOCX
-                                image_data = docx_zip.read(image_path)
-                                
-                                # Load image and perform OCR
-                                image = Image.open(BytesIO(image_data))
-                                
-                                # Convert to RGB if necessary
-                                if image.mode != 'RGB':
-                                    image = image.convert('RGB')
-                                
-                                # Pre-process image for better OCR
-                                img_array = np.array(image)
-                                img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-                                gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-                                thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-                                processed_image = Image.fromarray(thresh)
-                                
-                                # Perform OCR
-                                ocr_text = pytesseract.image_to_string(processed_image, lang='eng')
-                                if ocr_text and ocr_text.strip():
-                                    text_parts.append(ocr_text.strip())
-                                    logger.debug(
-                                        f"Extracted {len(ocr_text.strip())} characters from embedded image: {image_path}",
-                                        extra={"image_path": image_path, "ocr_text_length": len(ocr_text.strip())}
-                                    )
-                            except Exception as img_error:
-                                logger.debug(f"Failed to extract text from embedded image {image_path}: {img_error}")
-                                continue
+                        if len(image_files) == 1:
+                            # A single image is OCRed in-process, so PIL decodes it straight from the zip stream
+                            with docx_zip.open(image_files[0]) as image_stream:
+                                ocr_results = [_ocr_embedded_image(image_stream)]
+                        else:
+                            # Worker processes need the encoded bytes of each image
+                            ocr_results = _ocr_images([docx_zip.read(image_path) for image_path in image_files], filename)
+                        for image_path, ocr_text in zip(image_files, ocr_results):
+                            if ocr_text and ocr_text.strip():
+                                text_parts.append(ocr_text.strip())
+                                logger.debug(
+                                    f"Extracted {len(ocr_text.strip())} characters from embedded image: {image_path}",
+                                    extra={"image_path": image_path, "ocr_text_length": len(ocr_text.strip())}
+                                )
                 except Exception as ocr_error:
                     logger.debug(f"Failed to extract images from DOCX for OCR: {ocr_error}")
             
@@ -733,20 +1474,26 @@ class ResumeParser:
                 
                 # Try extracting from XML directly as fallback
                 try:
-                    doc_file_for_xml = BytesIO(file_content)
-                    docx_zip = zipfile.ZipFile(doc_file_for_xml)
-                    
                     # Read main document XML
-                    if 'word/document.xml' in docx_zip.namelist():
-                        import xml.etree.ElementTree as ET
-                        xml_content = docx_zip.read('word/document.xml')
-                        root = ET.fromstring(xml_content)
-                        
-                        # Extract text from all text nodes
+                    if docx_zip is not None and 'word/document.xml' in docx_zip.namelist():
                         xml_text_parts = []
-                        for elem in root.iter():
-                            if elem.text and elem.text.strip():
-                                xml_text_parts.append(elem.text.strip())
+                        if LXML_AVAILABLE:
+                            # Stream the XML and keep only <w:t> text, freeing parsed nodes as we go
+                            with docx_zip.open('word/document.xml') as xml_stream:
+                                for _, elem in lxml_etree.iterparse(xml_stream, events=('end',), huge_tree=True):
+                                    if elem.tag == _W_T and elem.text and elem.text.strip():
+                                        xml_text_parts.append(elem.text.strip())
+                                    elem.clear()
+                                    while elem.getprevious() is not None:
+                                        del elem.getparent()[0]
+                        else:
+                            import xml.etree.ElementTree as ET
+                            root = ET.fromstring(docx_zip.read('word/document.xml'))
+                            
+                            # Extract text from all text nodes
+                            for elem in root.iter():
+                                if elem.text and elem.text.strip():
+                                    xml_text_parts.append(elem.text.strip())
                         
                         if xml_text_parts:
                             xml_text = ' '.join(xml_text_parts)
@@ -757,7 +1504,7 @@ class ResumeParser:
                     logger.debug(f"XML extraction fallback failed: {xml_error}")
             
             # Normalize whitespace (remove extra spaces, normalize line breaks)
-            normalized_text = normalize_text(raw_text) or raw_text
+            normalized_text = _normalize_cached(raw_text) or raw_text
             
             if normalized_text and len(normalized_text.strip()) > 10:
                 logger.info(
@@ -774,6 +1521,9 @@ class ResumeParser:
         except Exception as e:
             logger.error(f"Error extracting DOCX text from {filename}: {e}", extra={"error": str(e), "file_name": filename})
             raise ValueError(f"Failed to extract text from DOCX: {e}")
+        finally:
+            if docx_zip is not None:
+                docx_zip.close()
     
     def _extract_doc_text(self, file_content: bytes) -> str:
         """
@@ -794,107 +1544,42 @@ class ResumeParser:
             # Method 1: Apache Tika (PRIMARY METHOD - Currently Working)
             if TIKA_AVAILABLE:
                 try:
-                    tika_msg = (
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$$$  USING APACHE TIKA  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$  Extracting text from .doc file using Apache Tika\n"
-                        "$$$  This is the PRIMARY method for processing .doc files\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                    )
-                    print(tika_msg)
-                    logger.info(tika_msg)
+                    logger.debug("Extracting text from .doc file using Apache Tika (primary method)")
                     parsed = tika_parser.from_file(temp_doc_path)
                     if parsed and 'content' in parsed and parsed['content']:
                         text = parsed['content'].strip()
                         if text:
                             # Normalize whitespace (remove extra spaces, normalize line breaks)
-                            normalized_text = normalize_text(text) or text
-                            success_msg = (
-                                "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                                "$$$$$$$$$$$$$$$$$$$$$$  APACHE TIKA SUCCESS  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                                f"$$$  Successfully extracted {len(normalized_text)} characters using Apache Tika\n"
-                                "$$$  METHOD USED: Apache Tika (tika-python library)\n"
-                                "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                            )
-                            print(success_msg)
+                            normalized_text = _normalize_cached(text) or text
                             logger.info(
-                                success_msg,
+                                f"Extracted {len(normalized_text)} characters from .doc file using Apache Tika",
                                 extra={"extraction_method": "apache_tika", "text_length": len(normalized_text)}
                             )
                             return normalized_text
                 except Exception as tika_error:
-                    error_msg = f"Apache Tika extraction failed: {tika_error}"
-                    print(f"[WARNING] {error_msg}")
-                    logger.warning(error_msg)
+                    logger.warning(f"Apache Tika extraction failed: {tika_error}")
             
-            # Method 2: LibreOffice headless conversion (if available)
-            if LIBREOFFICE_AVAILABLE:
+            # Method 2: LibreOffice conversion (if available); goes through the persistent
+            # unoserver daemon when installed, otherwise a one-shot soffice --headless
+            if UNOSERVER_AVAILABLE or _libreoffice_cmd():
                 try:
-                    lo_msg = (
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$  USING LIBREOFFICE  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$  Converting .doc to .docx using LibreOffice headless\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                    )
-                    print(lo_msg)
-                    logger.info(lo_msg)
-                    # Create temp directory for output
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        # Use LibreOffice to convert .doc to .docx
-                        libreoffice_cmd = shutil.which("soffice") or shutil.which("libreoffice")
-                        cmd = [
-                            libreoffice_cmd,
-                            "--headless",
-                            "--convert-to", "docx",
-                            "--outdir", temp_dir,
-                            temp_doc_path
-                        ]
-                        
-                        result = subprocess.run(
-                            cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=30
-                        )
-                        
-                        if result.returncode == 0:
-                            # Find the converted .docx file
-                            converted_docx = os.path.join(temp_dir, os.path.basename(temp_doc_path).replace('.doc', '.docx'))
-                            if os.path.exists(converted_docx):
-                                # Read the converted .docx and extract text
-                                with open(converted_docx, 'rb') as f:
-                                    docx_content = f.read()
-                                text = self._extract_docx_text(docx_content)
-                                if text.strip():
-                                    success_msg = (
-                                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                                        "$$$$$$$$$$$$$$$$$$$$$$  LIBREOFFICE SUCCESS  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                                        f"$$$  Successfully extracted {len(text)} characters using LibreOffice\n"
-                                        "$$$  METHOD USED: LibreOffice (converted .doc to .docx, then extracted)\n"
-                                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                                    )
-                                    print(success_msg)
-                                    logger.info(
-                                        success_msg,
-                                        extra={"extraction_method": "libreoffice", "text_length": len(text)}
-                                    )
-                                    return text
-                except subprocess.TimeoutExpired:
-                    logger.warning("LibreOffice conversion timed out")
+                    logger.debug("Converting .doc to .docx using LibreOffice")
+                    docx_content = convert_doc_to_docx_in_memory(file_content)
+                    if docx_content:
+                        text = self._extract_docx_text(docx_content)
+                        if text.strip():
+                            logger.info(
+                                f"Extracted {len(text)} characters from .doc file using LibreOffice (converted to .docx)",
+                                extra={"extraction_method": "libreoffice", "text_length": len(text)}
+                            )
+                            return text
                 except Exception as lo_error:
                     logger.debug(f"LibreOffice conversion failed: {lo_error}")
             
             # Method 3: antiword (if available)
-            if ANTIWORD_AVAILABLE:
+            if _antiword_available():
                 try:
-                    antiword_msg = (
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$$$  USING ANTIWORD  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                        "$$$  Extracting text from .doc file using antiword\n"
-                        "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                    )
-                    print(antiword_msg)
-                    logger.info(antiword_msg)
+                    logger.debug("Extracting text from .doc file using antiword")
                     result = subprocess.run(
                         ["antiword", temp_doc_path],
                         capture_output=True,
@@ -903,17 +1588,9 @@ class ResumeParser:
                     )
                     if result.returncode == 0 and result.stdout.strip():
                         # Normalize whitespace (remove extra spaces, normalize line breaks)
-                        normalized_text = normalize_text(result.stdout) or result.stdout
-                        success_msg = (
-                            "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                            "$$$$$$$$$$$$$$$$$$$$$$  ANTIWORD SUCCESS  $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$\n"
-                            f"$$$  Successfully extracted {len(normalized_text)} characters using antiword\n"
-                            "$$$  METHOD USED: antiword (command-line tool)\n"
-                            "$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$"
-                        )
-                        print(success_msg)
+                        normalized_text = _normalize_cached(result.stdout) or result.stdout
                         logger.info(
-                            success_msg,
+                            f"Extracted {len(normalized_text)} characters from .doc file using antiword",
                             extra={"extraction_method": "antiword", "text_length": len(normalized_text)}
                         )
                         return normalized_text
@@ -941,7 +1618,7 @@ class ResumeParser:
                 extracted_text = "\n".join(text_parts)
                 if extracted_text.strip():
                     # Normalize whitespace (remove extra spaces, normalize line breaks)
-                    normalized_text = normalize_text(extracted_text) or extracted_text
+                    normalized_text = _normalize_cached(extracted_text) or extracted_text
                     logger.info("Successfully extracted .doc file using python-docx fallback")
                     return normalized_text
             except Exception as fallback_error:
@@ -960,28 +1637,12 @@ class ResumeParser:
                         data = stream.read()
                         # Simple text extraction from binary data
                         # This is a basic approach - look for readable text
-                        text_chunks = []
-                        current_chunk = b""
-                        for byte in data:
-                            if 32 <= byte <= 126 or byte in [9, 10, 13]:  # Printable ASCII
-                                current_chunk += bytes([byte])
-                            else:
-                                if len(current_chunk) > 3:
-                                    try:
-                                        text_chunks.append(current_chunk.decode('ascii', errors='ignore'))
-                                    except:
-                                        pass
-                                current_chunk = b""
-                        if current_chunk:
-                            try:
-                                text_chunks.append(current_chunk.decode('ascii', errors='ignore'))
-                            except:
-                                pass
+                        text_chunks = _printable_ascii_runs(data, min_length=4)
                         ole.close()
                         extracted_text = "\n".join(text_chunks)
                         if extracted_text.strip():
                             # Normalize whitespace (remove extra spaces, normalize line breaks)
-                            normalized_text = normalize_text(extracted_text) or extracted_text
+                            normalized_text = _normalize_cached(extracted_text) or extracted_text
                             logger.info("Successfully extracted .doc file using olefile")
                             return normalized_text
                     ole.close()
@@ -992,34 +1653,13 @@ class ResumeParser:
             try:
                 logger.debug("Attempting basic text extraction from .doc file as last resort")
                 # Try to extract readable text from binary data
-                text_chunks = []
-                # Look for readable ASCII text sequences
-                current_chunk = b""
-                for byte in file_content:
-                    if 32 <= byte <= 126 or byte in [9, 10, 13]:  # Printable ASCII
-                        current_chunk += bytes([byte])
-                    else:
-                        if len(current_chunk) > 10:  # Only keep meaningful chunks
-                            try:
-                                decoded = current_chunk.decode('ascii', errors='ignore')
-                                if decoded.strip():
-                                    text_chunks.append(decoded.strip())
-                            except:
-                                pass
-                        current_chunk = b""
-                
-                # Add last chunk
-                if len(current_chunk) > 10:
-                    try:
-                        decoded = current_chunk.decode('ascii', errors='ignore')
-                        if decoded.strip():
-                            text_chunks.append(decoded.strip())
-                    except:
-                        pass
+                # Look for readable ASCII text sequences (only meaningful chunks)
+                text_chunks = [chunk.strip() for chunk in _printable_ascii_runs(file_content, min_length=11)]
+                text_chunks = [chunk for chunk in text_chunks if chunk]
                 
                 if text_chunks:
                     extracted_text = "\n".join(text_chunks)
-                    normalized_text = normalize_text(extracted_text) or extracted_text
+                    normalized_text = _normalize_cached(extracted_text) or extracted_text
                     if normalized_text and len(normalized_text.strip()) > 20:
                         logger.info(
                             f"✅ Successfully extracted .doc file using basic binary extraction (extracted {len(normalized_text.strip())} chars)",
@@ -1078,33 +1718,38 @@ class ResumeParser:
             image = Image.open(BytesIO(file_content))
             original_size = image.size
             
-            # Convert to RGB if necessary (some images are RGBA or other formats)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Convert straight to grayscale (OCR never needs color; this also handles RGBA and other formats)
+            if image.mode != 'L':
+                image = image.convert('L')
             
             # Increase DPI/Resolution for better OCR (300 DPI recommended)
-            # Scale up image if it's too small
+            # Scale up image if it's too small, by a whole factor so source pixels map onto
+            # the output grid evenly; bicubic reads as well as Lanczos for OCR at a fraction of the cost
             if image.size[0] < 1200 or image.size[1] < 1200:
-                scale_factor = max(1200 / image.size[0], 1200 / image.size[1])
-                new_size = (int(image.size[0] * scale_factor), int(image.size[1] * scale_factor))
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
+                scale_factor = math.ceil(max(1200 / image.size[0], 1200 / image.size[1]))
+                new_size = (image.size[0] * scale_factor, image.size[1] * scale_factor)
+                image = image.resize(new_size, Image.Resampling.BICUBIC)
                 logger.debug(f"Scaled image from {original_size} to {new_size} for better OCR")
             
             # Pre-process image for better OCR accuracy
-            # Convert PIL image to OpenCV format (numpy array)
-            img_array = np.array(image)
-            img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+            # View the grayscale PIL image as a numpy array for OpenCV
+            gray = np.asarray(image)
             
             # Noise removal using median blur (removes salt and pepper noise)
             denoised = cv2.medianBlur(gray, 3)
             
             # Deskew image (correct rotation)
             try:
-                # Find angle using Hough transform
-                coords = np.column_stack(np.where(denoised > 0))
+                # Estimate the angle on a copy downscaled to ~DESKEW_ESTIMATE_MAX_SIDE px;
+                # the minAreaRect angle does not depend on scale
+                (h, w) = denoised.shape[:2]
+                estimate = denoised
+                if max(h, w) > DESKEW_ESTIMATE_MAX_SIDE:
+                    ratio = DESKEW_ESTIMATE_MAX_SIDE / max(h, w)
+                    estimate = cv2.resize(denoised, (max(1, int(w * ratio)), max(1, int(h * ratio))), interpolation=cv2.INTER_AREA)
+                points = cv2.findNonZero(estimate)
+                # findNonZero yields (x, y) int32 points; flip to (row, col) to keep the angle convention below
+                coords = np.ascontiguousarray(points[:, 0, ::-1]) if points is not None else ()
                 if len(coords) > 0:
                     angle = cv2.minAreaRect(coords)[-1]
                     if angle < -45:
@@ -1113,7 +1758,6 @@ class ResumeParser:
                         angle = -angle
                     # Only apply if angle is significant (> 0.5 degrees)
                     if abs(angle) > 0.5:
-                        (h, w) = denoised.shape[:2]
                         center = (w // 2, h // 2)
                         M = cv2.getRotationMatrix2D(center, angle, 1.0)
                         denoised = cv2.warpAffine(denoised, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
@@ -1123,48 +1767,66 @@ class ResumeParser:
                 # Continue without deskew
             
             # Apply thresholding to get binary image (improves OCR accuracy)
-            # Try multiple thresholding methods and use the best result
+            # Try multiple thresholding methods and use the best result; thresholds are
+            # computed lazily since a confident first pass skips the remaining methods
+            # With OpenCL available, upload the gray image once as a UMat so all three thresholds
+            # run on the device; each result is only downloaded when its method is reached
+            if cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL():
+                source = cv2.UMat(denoised)
+                to_array = cv2.UMat.get
+            else:
+                source = denoised
+                to_array = np.asarray
             methods = [
-                ("OTSU", cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]),
-                ("ADAPTIVE", cv2.adaptiveThreshold(denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)),
-                ("SIMPLE", cv2.threshold(denoised, 150, 255, cv2.THRESH_BINARY)[1]),
+                ("OTSU", lambda: to_array(cv2.threshold(source, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1])),
+                ("ADAPTIVE", lambda: to_array(cv2.adaptiveThreshold(source, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2))),
+                ("SIMPLE", lambda: to_array(cv2.threshold(source, 150, 255, cv2.THRESH_BINARY)[1])),
+            ]
+            
+            # Perform OCR with different page segmentation modes
+            psm_modes = [
+                6,  # Assume uniform block of text
+                11,  # Sparse text
+                12,  # Sparse text with OSD
             ]
             
+            def is_confident(text: str, confidence: float) -> bool:
+                return confidence >= IMAGE_OCR_CONFIDENT_MIN_CONF and len(text.strip()) >= IMAGE_OCR_CONFIDENT_MIN_CHARS
+            
             best_text = ""
             best_length = 0
+            confident = False
             
-            for method_name, thresh in methods:
+            for method_name, make_thresh in methods:
                 try:
-                    # Convert back to PIL Image for pytesseract
-                    processed_image = Image.fromarray(thresh)
+                    # Convert back to PIL Image for OCR
+                    processed_image = Image.fromarray(make_thresh())
                     
-                    # Perform OCR with different configurations
-                    configs = [
-                        '--psm 6',  # Assume uniform block of text
-                        '--psm 11',  # Sparse text
-                        '--psm 12',  # Sparse text with OSD
-                    ]
-                    
-                    for config in configs:
-                        try:
-                            text = pytesseract.image_to_string(processed_image, lang='eng', config=config)
-                            if len(text.strip()) > best_length:
-                                best_text = text
-                                best_length = len(text.strip())
-                        except:
-                            continue
+                    for psm, text, confidence in _ocr_image_psm_passes(processed_image, psm_modes, is_confident):
+                        length = len(text.strip())
+                        if length > best_length:
+                            best_text = text
+                            best_length = length
+                        if is_confident(text, confidence):
+                            logger.debug(
+                                f"Confident OCR result from {method_name}/psm {psm} "
+                                f"(confidence {confidence:.1f}); skipping remaining passes"
+                            )
+                            confident = True
                 except Exception as e:
                     logger.debug(f"OCR method {method_name} failed: {e}")
                     continue
+                if confident:
+                    break
             
             # If no text found with advanced methods, try basic method
             if not best_text or best_length < 10:
                 thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
                 processed_image = Image.fromarray(thresh)
-                best_text = pytesseract.image_to_string(processed_image, lang='eng')
+                best_text = _ocr_image(processed_image)
             
             # Normalize whitespace
-            normalized_text = normalize_text(best_text) or best_text
+            normalized_text = _normalize_cached(best_text) or best_text
             
             if not normalized_text or len(normalized_text.strip()) < 10:
                 logger.warning(
@@ -1186,7 +1848,13 @@ class ResumeParser:
             )
             raise ValueError(f"Failed to extract text from image using OCR: {e}")
     
-    def _extract_scanned_pdf_text(self, file_content: bytes, filename: str = "resume.pdf") -> str:
+    def _extract_scanned_pdf_text(
+        self,
+        file_content: bytes,
+        filename: str = "resume.pdf",
+        pdf_doc=None,
+        layer_texts: Optional[List[str]] = None
+    ) -> str:
         """
         Extract text from scanned PDF using OCR.
         Converts PDF pages to images and then performs OCR on each page.
@@ -1194,6 +1862,8 @@ class ResumeParser:
         Args:
             file_content: The binary content of the PDF file
             filename: Name of the file (for logging)
+            pdf_doc: Already-open PyMuPDF document for file_content (opened here if None)
+            layer_texts: Text layer of each page of pdf_doc, if already read
         
         Returns:
             Extracted text content as string
@@ -1224,170 +1894,44 @@ class ResumeParser:
             )
         
         try:
-            # Create temporary file for PDF content
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(file_content)
-                temp_pdf_path = temp_file.name
+            logger.info(
+                f"Converting PDF pages to images for OCR: {filename}",
+                extra={"file_name": filename}
+            )
             
-            try:
+            # PyMuPDF can inspect each page before rendering it, so it is preferred;
+            # pdf2image (poppler) renders every page and is used when PyMuPDF is missing
+            if pdf_doc is not None:
+                page_texts = self._ocr_pdf_pages_pymupdf(pdf_doc, filename, layer_texts)
+            elif PYMUPDF_AVAILABLE:
+                with fitz.open(stream=file_content, filetype="pdf") as pdf_doc:
+                    page_texts = self._ocr_pdf_pages_pymupdf(pdf_doc, filename)
+            else:
+                page_texts = self._ocr_pdf_pages_pdf2image(file_content, filename)
+            
+            if not page_texts:
+                logger.warning(f"No pages extracted from PDF for OCR: {filename}")
+                return ""
+            
+            text_parts = [text for text in page_texts if text.strip()]
+            
+            # Combine all pages
+            raw_text = "\n".join(text_parts)
+            normalized_text = _normalize_cached(raw_text) or raw_text
+            
+            if not normalized_text or len(normalized_text.strip()) == 0:
+                logger.warning(
+                    f"⚠️ OCR extraction returned empty text for scanned PDF: {filename}",
+                    extra={"file_name": filename, "pages": len(page_texts)}
+                )
+            else:
                 logger.info(
-                    f"Converting PDF pages to images for OCR: {filename}",
-                    extra={"file_name": filename}
+                    f"✅ OCR extraction completed for scanned PDF: {filename} "
+                    f"(extracted {len(normalized_text.strip())} chars from {len(page_texts)} page(s))",
+                    extra={"file_name": filename, "pages": len(page_texts), "text_length": len(normalized_text.strip())}
                 )
-                
-                # Convert PDF pages to images (300 DPI for better OCR accuracy)
-                # Try pdf2image first, fallback to PyMuPDF if poppler is not available
-                pages = None
-                try:
-                    pages = convert_from_path(temp_pdf_path, dpi=300)
-                except Exception as convert_error:
-                    # If poppler is not available, try PyMuPDF as fallback
-                    if PYMUPDF_AVAILABLE:
-                        logger.info(
-                            f"pdf2image failed (poppler not available), trying PyMuPDF fallback: {filename}",
-                            extra={"file_name": filename, "error": str(convert_error)}
-                        )
-                        try:
-                            pdf_doc = fitz.open(temp_pdf_path)
-                            pages = []
-                            for page_num in range(len(pdf_doc)):
-                                page = pdf_doc[page_num]
-                                # Render page to image at 300 DPI
-                                mat = fitz.Matrix(300/72, 300/72)  # 300 DPI
-                                pix = page.get_pixmap(matrix=mat)
-                                # Convert to PIL Image
-                                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                                pages.append(img)
-                            pdf_doc.close()
-                            logger.info(
-                                f"✅ Successfully extracted {len(pages)} pages using PyMuPDF fallback: {filename}",
-                                extra={"file_name": filename, "pages": len(pages)}
-                            )
-                        except Exception as pymupdf_error:
-                            logger.error(
-                                f"PyMuPDF fallback also failed: {pymupdf_error}",
-                                extra={"file_name": filename, "error": str(pymupdf_error)}
-                            )
-                            raise ValueError(f"Failed to convert PDF to images for OCR. Poppler not available and PyMuPDF fallback failed: {pymupdf_error}")
-                    else:
-                        logger.error(
-                            f"Failed to convert PDF to images: {convert_error}. "
-                            f"Poppler is not installed and PyMuPDF is not available. "
-                            f"Install poppler or install PyMuPDF: pip install PyMuPDF",
-                            extra={"file_name": filename, "error": str(convert_error)}
-                        )
-                        raise ValueError(f"Failed to convert PDF to images for OCR: {convert_error}")
-                
-                if not pages or len(pages) == 0:
-                    logger.warning(f"No pages extracted from PDF for OCR: {filename}")
-                    return ""
-                
-                text_parts = []
-                for i, page in enumerate(pages):
-                    logger.debug(f"Processing PDF page {i+1}/{len(pages)} with enhanced OCR")
-                    
-                    # Convert PIL image to OpenCV format for preprocessing
-                    img_array = np.array(page)
-                    original_size = page.size
-                    
-                    # Scale up if image is too small (better OCR accuracy)
-                    if page.size[0] < 1200 or page.size[1] < 1200:
-                        scale_factor = max(1200 / page.size[0], 1200 / page.size[1])
-                        new_size = (int(page.size[0] * scale_factor), int(page.size[1] * scale_factor))
-                        page = page.resize(new_size, Image.Resampling.LANCZOS)
-                        img_array = np.array(page)
-                        logger.debug(f"Scaled PDF page {i+1} from {original_size} to {new_size} for better OCR")
-                    
-                    # Convert RGB to BGR for OpenCV
-                    if len(img_array.shape) == 3:
-                        img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-                        # Convert to grayscale
-                        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-                    else:
-                        gray = img_array
-                    
-                    # Noise removal
-                    denoised = cv2.medianBlur(gray, 3)
-                    
-                    # Try multiple preprocessing methods and OCR configurations
-                    best_text = ""
-                    best_length = 0
-                    
-                    # Method 1: OTSU thresholding
-                    try:
-                        thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-                        processed_image = Image.fromarray(thresh)
-                        page_text = pytesseract.image_to_string(processed_image, lang='eng', config='--psm 6')
-                        if len(page_text.strip()) > best_length:
-                            best_text = page_text
-                            best_length = len(page_text.strip())
-                    except:
-                        pass
-                    
-                    # Method 2: Adaptive thresholding
-                    try:
-                        adaptive = cv2.adaptiveThreshold(denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
-                        processed_image = Image.fromarray(adaptive)
-                        page_text = pytesseract.image_to_string(processed_image, lang='eng', config='--psm 6')
-                        if len(page_text.strip()) > best_length:
-                            best_text = page_text
-                            best_length = len(page_text.strip())
-                    except:
-                        pass
-                    
-                    # Method 3: Try different PSM modes
-                    psm_modes = ['--psm 6', '--psm 11', '--psm 12', '--psm 3']
-                    for psm in psm_modes:
-                        try:
-                            thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-                            processed_image = Image.fromarray(thresh)
-                            page_text = pytesseract.image_to_string(processed_image, lang='eng', config=psm)
-                            if len(page_text.strip()) > best_length:
-                                best_text = page_text
-                                best_length = len(page_text.strip())
-                        except:
-                            continue
-                    
-                    # Use the best result
-                    if best_text.strip():
-                        text_parts.append(best_text)
-                        logger.debug(f"Extracted {best_length} chars from page {i+1} using best OCR method")
-                    else:
-                        # Last resort: try basic OCR without preprocessing
-                        try:
-                            page_text = pytesseract.image_to_string(page, lang='eng')
-                            if page_text.strip():
-                                text_parts.append(page_text)
-                        except Exception as ocr_page_error:
-                            logger.warning(
-                                f"OCR failed for page {i+1} of {filename}: {ocr_page_error}",
-                                extra={"file_name": filename, "page": i+1, "error": str(ocr_page_error)}
-                            )
-                            # Continue with other pages
-                            continue
-                
-                # Combine all pages
-                raw_text = "\n".join(text_parts)
-                normalized_text = normalize_text(raw_text) or raw_text
-                
-                if not normalized_text or len(normalized_text.strip()) == 0:
-                    logger.warning(
-                        f"⚠️ OCR extraction returned empty text for scanned PDF: {filename}",
-                        extra={"file_name": filename, "pages": len(pages)}
-                    )
-                else:
-                    logger.info(
-                        f"✅ OCR extraction completed for scanned PDF: {filename} "
-                        f"(extracted {len(normalized_text.strip())} chars from {len(pages)} page(s))",
-                        extra={"file_name": filename, "pages": len(pages), "text_length": len(normalized_text.strip())}
-                    )
-                
-                return normalized_text
-                
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_pdf_path):
-                    os.unlink(temp_pdf_path)
+            
+            return normalized_text
                     
         except Exception as e:
             logger.error(
@@ -1396,6 +1940,121 @@ class ResumeParser:
             )
             raise ValueError(f"Failed to extract text from scanned PDF using OCR: {e}")
     
+    def _ocr_pdf_pages_pymupdf(self, pdf_doc, filename: str, layer_texts: Optional[List[str]] = None) -> List[str]:
+        """
+        Render and OCR the pages of an open PyMuPDF document, skipping pages that don't need OCR.
+        
+        Pages whose text layer already has at least 50 characters use that text, and blank
+        pages (no text, images or drawings) are skipped; only the rest are rasterized.
+        
+        Args:
+            pdf_doc: Open PyMuPDF document
+            filename: Name of the file (for logging)
+            layer_texts: Text layer of each page, if already read (otherwise read here)
+        
+        Returns:
+            Text of each page, in page order
+        """
+        page_texts = [""] * _pdf_page_limit(len(pdf_doc), filename)
+        ocr_indices = []
+        skipped_blank = 0
+        
+        def render(page, dpi: int) -> PageImage:
+            # Grayscale (OCR preprocessing is grayscale anyway); the samples are handed to OCR
+            # as-is, without a PNG encode/decode round trip, and the pixmap is released here
+            pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72), colorspace=fitz.csGRAY, alpha=False)
+            return ("L", pix.width, pix.height, pix.samples)
+        
+        def render_pages():
+            nonlocal skipped_blank
+            for page_num in range(len(page_texts)):
+                page = pdf_doc[page_num]
+                layer_text = layer_texts[page_num] if layer_texts is not None else page.get_text("text")
+                if len(layer_text.strip()) >= 50:
+                    # Mixed PDF: this page has a usable text layer
+                    page_texts[page_num] = layer_text
+                    continue
+                if not layer_text.strip() and not page.get_images() and not page.get_drawings():
+                    # Nothing drawn on the page (e.g. blank back matter)
+                    skipped_blank += 1
+                    continue
+                
+                ocr_indices.append(page_num)
+                yield render(page, settings.ocr_dpi)
+        
+        # Pages are rendered on demand while earlier pages are being OCRed
+        ocr_results = _ocr_pages(render_pages(), filename)
+        
+        # Pixel count grows with DPI squared, so pages are first read at ocr_dpi and only
+        # re-rendered at ocr_escalation_dpi when Tesseract was unsure of the result. Pages that
+        # timed out or failed are not retried: 4x the pixels would only hit the budget again.
+        escalated = [
+            (page_num, conf) for page_num, (_, conf) in zip(ocr_indices, ocr_results)
+            if 0 <= conf < settings.ocr_min_confidence
+        ]
+        if escalated and settings.ocr_escalation_dpi > settings.ocr_dpi:
+            retry_results = _ocr_pages(
+                (render(pdf_doc[page_num], settings.ocr_escalation_dpi) for page_num, _ in escalated),
+                filename
+            )
+            results_by_page = dict(zip(ocr_indices, ocr_results))
+            for (page_num, conf), (text, retry_conf) in zip(escalated, retry_results):
+                if retry_conf > conf:
+                    results_by_page[page_num] = (text, retry_conf)
+            ocr_results = [results_by_page[page_num] for page_num in ocr_indices]
+            logger.info(
+                f"Re-ran OCR at {settings.ocr_escalation_dpi} DPI on {len(escalated)} low-confidence page(s): {filename}",
+                extra={"file_name": filename, "escalated_pages": [page_num + 1 for page_num, _ in escalated]}
+            )
+        
+        for page_num, (text, _) in zip(ocr_indices, ocr_results):
+            page_texts[page_num] = text
+        
+        logger.info(
+            f"OCR on {len(ocr_indices)} of {len(page_texts)} pages "
+            f"({len(page_texts) - len(ocr_indices) - skipped_blank} with text layer, {skipped_blank} blank): {filename}",
+            extra={"file_name": filename, "pages": len(page_texts), "ocr_pages": len(ocr_indices), "blank_pages": skipped_blank}
+        )
+        return page_texts
+    
+    def _ocr_pdf_pages_pdf2image(self, file_content: bytes, filename: str) -> List[str]:
+        """
+        Render every PDF page with pdf2image (requires poppler) and OCR it.
+        
+        Returns:
+            Text of each page, in page order
+        """
+        # Create temporary file for PDF content
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+            temp_file.write(file_content)
+            temp_pdf_path = temp_file.name
+        
+        try:
+            try:
+                page_count = _pdf_page_limit(pdfinfo_from_path(temp_pdf_path)["Pages"], filename)
+            except Exception as convert_error:
+                logger.error(
+                    f"Failed to convert PDF to images: {convert_error}. "
+                    f"Poppler is not installed and PyMuPDF is not available. "
+                    f"Install poppler or install PyMuPDF: pip install PyMuPDF",
+                    extra={"file_name": filename, "error": str(convert_error)}
+                )
+                raise ValueError(f"Failed to convert PDF to images for OCR: {convert_error}")
+            
+            def render_pages():
+                # Convert one page at a time (300 DPI for better OCR accuracy) so a long scan
+                # is never fully materialized
+                for page_num in range(1, page_count + 1):
+                    page = convert_from_path(temp_pdf_path, dpi=300, first_page=page_num, last_page=page_num)[0]
+                    page = page.convert("L")
+                    yield ("L", page.width, page.height, page.tobytes())
+            
+            return [text for text, _ in _ocr_pages(render_pages(), filename)]
+        finally:
+            # Clean up temp file
+            if os.path.exists(temp_pdf_path):
+                os.unlink(temp_pdf_path)
+    
     def _extract_html_text(self, file_content: bytes, filename: str = "resume.html") -> str:
         """
         Extract text from HTML file by parsing DOM with enhanced extraction.
@@ -1435,28 +2094,14 @@ class ResumeParser:
             if filename.lower().endswith(('.html', '.htm')):
                 # Strategy 1: Remove everything before "Personal Profile" or "Name:" (forwarding section)
                 # Find where the actual resume content starts
-                personal_profile_marker = re.search(r'(?i)(Personal\s+Profile|Name\s*:|\bRESUME\b)', html_content_cleaned)
+                personal_profile_marker = _HTML_PROFILE_START_RE.search(html_content_cleaned)
                 if personal_profile_marker:
                     # Keep only content from "Personal Profile" onwards
                     html_content_cleaned = html_content_cleaned[personal_profile_marker.start():]
                     logger.debug(f"Removed forwarding section before 'Personal Profile' in {filename}")
                 
                 # Strategy 2: Remove forwarding sections that contain non-candidate contact info
-                forwarding_patterns = [
-                    r'(?i)Forwarded\s+By:.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)To:\s*\[.*?\]\s*\n.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)From:.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)Resume\s+Link:.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)Comments:.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)I\s+thought\s+you\s+might\s+be\s+interested.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)This\s+resume\s+has\s+been\s+forwarded.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)This\s+email\s+was\s+sent.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)Email\s+ID\s+[A-Z0-9]+.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                    r'(?i)If\s+you\s+have\s+questions.*?CareerBuilder.*?(?=\n|Personal\s+Profile|Name\s*:)',
-                ]
-                
-                for pattern in forwarding_patterns:
-                    html_content_cleaned = re.sub(pattern, '', html_content_cleaned, flags=re.DOTALL)
+                html_content_cleaned = _HTML_FWD_PATTERN.sub('', html_content_cleaned)
                 
                 # Strategy 3: Remove lines that contain forwarding metadata
                 lines = html_content_cleaned.split('\n')
@@ -1496,9 +2141,9 @@ class ResumeParser:
             # If HTML parsing is available, use BeautifulSoup
             if HTML_PARSING_AVAILABLE:
                 try:
-                    # Try parsing with lxml first (faster)
+                    # Try parsing with lxml first (faster) when installed
                     try:
-                        soup = BeautifulSoup(html_content_cleaned, 'lxml')
+                        soup = BeautifulSoup(html_content_cleaned, BS4_PARSER)
                     except:
                         # Fallback to html.parser if lxml fails
                         soup = BeautifulSoup(html_content_cleaned, 'html.parser')
@@ -1569,16 +2214,8 @@ class ResumeParser:
                                             import base64
                                             image_data = base64.b64decode(encoded)
                                             # Perform OCR on the image
-                                            image = Image.open(BytesIO(image_data))
-                                            if image.mode != 'RGB':
-                                                image = image.convert('RGB')
-                                            # Pre-process for OCR
-                                            img_array = np.array(image)
-                                            img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-                                            gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-                                            thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-                                            processed_image = Image.fromarray(thresh)
-                                            ocr_text = pytesseract.image_to_string(processed_image, lang='eng')
+                                            processed_image = _preprocess_for_ocr(Image.open(BytesIO(image_data)))
+                                            ocr_text = _ocr_image(processed_image)
                                             if ocr_text and ocr_text.strip():
                                                 text_parts.append(ocr_text.strip())
                                                 logger.debug(f"Extracted {len(ocr_text.strip())} chars from embedded image in HTML")
@@ -1591,7 +2228,7 @@ class ResumeParser:
                     combined_text = ' '.join(text_parts) if text_parts else all_text
                     
                     # Normalize whitespace
-                    normalized_text = normalize_text(combined_text) if combined_text else ""
+                    normalized_text = _normalize_cached(combined_text) if combined_text else ""
                     
                     if normalized_text and len(normalized_text.strip()) > 10:
                         logger.info(
@@ -1608,7 +2245,7 @@ class ResumeParser:
             
             # Fallback: Extract text directly using regex (for simple HTML or when BeautifulSoup fails)
             # Use cleaned content (with forwarding headers removed)
-            text = re.sub(r'<[^>]+>', ' ', html_content_cleaned)
+            text = _HTML_TAG_RE.sub(' ', html_content_cleaned)
             # Decode HTML entities
             try:
                 text = html.unescape(text)
@@ -1618,7 +2255,7 @@ class ResumeParser:
             text = ' '.join(text.split())
             
             if text and len(text.strip()) > 10:
-                normalized_text = normalize_text(text) or text
+                normalized_text = _normalize_cached(text) or text
                 logger.info(
                     f"✅ HTML text extraction completed using fallback method for {filename} (extracted {len(normalized_text.strip())} chars)",
                     extra={"file_name": filename, "text_length": len(normalized_text.strip()), "method": "regex_fallback"}
@@ -1627,7 +2264,7 @@ class ResumeParser:
             
             # Last resort: return decoded content as-is (use cleaned content)
             if html_content_cleaned and len(html_content_cleaned.strip()) > 10:
-                normalized_text = normalize_text(html_content_cleaned) or html_content_cleaned
+                normalized_text = _normalize_cached(html_content_cleaned) or html_content_cleaned
                 logger.info(
                     f"✅ HTML text extraction completed using raw decode for {filename} (extracted {len(normalized_text.strip())} chars)",
                     extra={"file_name": filename, "text_length": len(normalized_text.strip()), "method": "raw_decode"}
@@ -1661,11 +2298,50 @@ class ResumeParser:
                 text = file_content.decode('utf-8', errors='ignore')
                 if text and len(text.strip()) > 10:
                     logger.warning(f"Using raw UTF-8 decode as last resort for {filename}")
-                    return normalize_text(text) or text
+                    return _normalize_cached(text) or text
             except:
                 pass
             raise ValueError(f"Failed to extract text from HTML: {e}")
     
+    def _ocr_html_embedded_images(self, file_content: bytes, filename: str) -> str:
+        """
+        OCR the base64 data: URI images embedded in an HTML file.
+        
+        Args:
+            file_content: The binary content of the HTML file
+            filename: Name of the file (for logging)
+        
+        Returns:
+            Text of the images joined by spaces, or "" if none could be read
+        """
+        if not HTML_PARSING_AVAILABLE:
+            return ""
+        # Decode HTML to find embedded images
+        html_content = file_content.decode('utf-8', errors='ignore')
+        soup = BeautifulSoup(html_content, BS4_PARSER)
+        ocr_text_parts = []
+        
+        for img in soup.find_all('img'):
+            src = img.get('src', '')
+            if src and src.startswith('data:image'):
+                try:
+                    # Extract base64 image data
+                    header, encoded = src.split(',', 1)
+                    import base64
+                    image_data = base64.b64decode(encoded)
+                    # Perform OCR
+                    processed_image = _preprocess_for_ocr(Image.open(BytesIO(image_data)))
+                    ocr_text = _ocr_image(processed_image)
+                    if ocr_text and ocr_text.strip():
+                        ocr_text_parts.append(ocr_text.strip())
+                except Exception as img_ocr_error:
+                    logger.debug(
+                        f"Failed to OCR embedded image in HTML {filename}: {img_ocr_error}",
+                        extra={"file_name": filename, "error": str(img_ocr_error)}
+                    )
+        
+        return ' '.join(ocr_text_parts)
+    
     async def extract_text_with_fallback(self, file_content: bytes, filename: str, original_text: str = None) -> str:
         """
         Extract text with enhanced fallback methods for image/HTML/DOCX/PDF files.
@@ -1688,7 +2364,7 @@ class ResumeParser:
                 extra={"file_name": filename, "fallback_type": "enhanced_ocr"}
             )
             try:
-                enhanced_text = self._extract_image_text(file_content, filename)
+                enhanced_text = await asyncio.to_thread(self._extract_image_text, file_content, filename)
                 if enhanced_text and len(enhanced_text.strip()) > len(original_text.strip() if original_text else ""):
                     logger.info(
                         f"✅ FALLBACK SUCCESS: Enhanced OCR extracted {len(enhanced_text.strip())} chars from {filename}",
@@ -1706,50 +2382,19 @@ class ResumeParser:
             )
             try:
                 # First try enhanced HTML parsing
-                enhanced_text = self._extract_html_text(file_content, filename)
+                enhanced_text = await asyncio.to_thread(self._extract_html_text, file_content, filename)
                 
                 # If HTML parsing didn't help much, try OCR on embedded images
                 if (not enhanced_text or len(enhanced_text.strip()) < 100) and OCR_AVAILABLE:
                     try:
-                        # Decode HTML to find embedded images
-                        html_content = file_content.decode('utf-8', errors='ignore')
-                        if HTML_PARSING_AVAILABLE:
-                            soup = BeautifulSoup(html_content, 'html.parser')
-                            img_tags = soup.find_all('img')
-                            ocr_text_parts = []
-                            
-                            for img in img_tags:
-                                src = img.get('src', '')
-                                if src and src.startswith('data:image'):
-                                    try:
-                                        # Extract base64 image data
-                                        header, encoded = src.split(',', 1)
-                                        import base64
-                                        image_data = base64.b64decode(encoded)
-                                        # Perform OCR
-                                        image = Image.open(BytesIO(image_data))
-                                        if image.mode != 'RGB':
-                                            image = image.convert('RGB')
-                                        # Pre-process for OCR
-                                        img_array = np.array(image)
-                                        img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-                                        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-                                        thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-                                        processed_image = Image.fromarray(thresh)
-                                        ocr_text = pytesseract.image_to_string(processed_image, lang='eng')
-                                        if ocr_text and ocr_text.strip():
-                                            ocr_text_parts.append(ocr_text.strip())
-                                    except Exception as img_ocr_error:
-                                        logger.debug(f"Failed to OCR embedded image in HTML: {img_ocr_error}")
-                            
-                            if ocr_text_parts:
-                                ocr_combined = ' '.join(ocr_text_parts)
-                                if len(ocr_combined.strip()) > len(enhanced_text.strip() if enhanced_text else ""):
-                                    enhanced_text = ocr_combined
-                                    logger.info(
-                                        f"✅ OCR on HTML embedded images extracted {len(enhanced_text.strip())} chars",
-                                        extra={"file_name": filename, "text_length": len(enhanced_text.strip())}
-                                    )
+                        # Parsing, base64 decoding and OCR are CPU-bound; keep them off the event loop
+                        ocr_combined = await asyncio.to_thread(self._ocr_html_embedded_images, file_content, filename)
+                        if ocr_combined and len(ocr_combined.strip()) > len(enhanced_text.strip() if enhanced_text else ""):
+                            enhanced_text = ocr_combined
+                            logger.info(
+                                f"✅ OCR on HTML embedded images extracted {len(enhanced_text.strip())} chars",
+                                extra={"file_name": filename, "text_length": len(enhanced_text.strip())}
+                            )
                     except Exception as html_ocr_error:
                         logger.debug(f"HTML OCR fallback failed: {html_ocr_error}")
                 
@@ -1769,7 +2414,7 @@ class ResumeParser:
                 extra={"file_name": filename, "fallback_type": "enhanced_docx"}
             )
             try:
-                enhanced_text = self._extract_docx_text(file_content, filename)
+                enhanced_text = await asyncio.to_thread(self._extract_docx_text, file_content, filename)
                 if enhanced_text and len(enhanced_text.strip()) > len(original_text.strip() if original_text else ""):
                     logger.info(
                         f"✅ FALLBACK SUCCESS: Enhanced DOCX extraction extracted {len(enhanced_text.strip())} chars from {filename}",
@@ -1787,7 +2432,7 @@ class ResumeParser:
             )
             try:
                 if OCR_AVAILABLE and PDF2IMAGE_AVAILABLE:
-                    enhanced_text = self._extract_scanned_pdf_text(file_content, filename)
+                    enhanced_text = await asyncio.to_thread(self._extract_scanned_pdf_text, file_content, filename)
                     if enhanced_text and len(enhanced_text.strip()) > len(original_text.strip() if original_text else ""):
                         logger.info(
                             f"✅ FALLBACK SUCCESS: OCR extracted {len(enhanced_text.strip())} chars from scanned PDF {filename}",
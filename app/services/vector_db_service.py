@@ -1,4 +1,5 @@
 """Vector database service with Pinecone and FAISS fallback."""
+import asyncio
 import os
 import pickle
 from abc import ABC, abstractmethod
@@ -6,6 +7,7 @@ from typing import List, Dict, Optional, Any
 import numpy as np
 
 from app.config import settings
+from app.utils.http_json import as_float_list
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -115,18 +117,18 @@ class PineconeVectorDB(VectorDBService):
                 embedding = vec_data.get("embedding")
                 metadata = vec_data.get("metadata", {})
                 
-                if not vector_id or not embedding:
+                if not vector_id or embedding is None or len(embedding) == 0:
                     continue
                 
                 pinecone_vectors.append({
                     "id": str(vector_id),
-                    "values": embedding,
+                    "values": as_float_list(embedding),
                     "metadata": metadata
                 })
             
             if pinecone_vectors:
-                # Pinecone upsert is synchronous, but we're in async context
-                self.index.upsert(vectors=pinecone_vectors)
+                # Pinecone upsert is synchronous, run in thread pool to keep the event loop free
+                await asyncio.to_thread(self.index.upsert, vectors=pinecone_vectors)
                 logger.info(f"Upserted {len(pinecone_vectors)} vectors to Pinecone")
         
         except Exception as e:
@@ -145,16 +147,12 @@ class PineconeVectorDB(VectorDBService):
         
         try:
             # Pinecone query is synchronous, run in thread pool for async compatibility
-            import asyncio
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.index.query(
-                    vector=query_vector,
-                    top_k=top_k,
-                    include_metadata=True,
-                    filter=filter_dict
-                )
+            results = await asyncio.to_thread(
+                self.index.query,
+                vector=as_float_list(query_vector),
+                top_k=top_k,
+                include_metadata=True,
+                filter=filter_dict
             )
             
             matches = []
@@ -177,9 +175,7 @@ class PineconeVectorDB(VectorDBService):
             raise RuntimeError("Pinecone index not initialized")
         
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.index.delete, [str(id) for id in ids])
+            await asyncio.to_thread(self.index.delete, [str(id) for id in ids])
             logger.info(f"Deleted {len(ids)} vectors from Pinecone")
         except Exception as e:
             logger.error(f"Failed to delete vectors from Pinecone: {e}", extra={"error": str(e)})
@@ -249,9 +245,6 @@ class FAISSVectorDB(VectorDBService):
         
         try:
             # FAISS operations are CPU-bound, run in thread pool
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
             def _upsert():
                 vectors_to_add = []
                 ids_to_add = []
@@ -261,7 +254,7 @@ class FAISSVectorDB(VectorDBService):
                     embedding = vec_data.get("embedding")
                     metadata = vec_data.get("metadata", {})
                     
-                    if not vector_id or not embedding:
+                    if not vector_id or embedding is None or len(embedding) == 0:
                         continue
                     
                     # Convert to numpy array and normalize
@@ -296,7 +289,7 @@ class FAISSVectorDB(VectorDBService):
                     return len(vectors_to_add)
                 return 0
             
-            count = await loop.run_in_executor(None, _upsert)
+            count = await asyncio.to_thread(_upsert)
             if count > 0:
                 logger.info(f"Upserted {count} vectors to FAISS")
         
@@ -316,9 +309,6 @@ class FAISSVectorDB(VectorDBService):
         
         try:
             # FAISS operations are CPU-bound, run in thread pool
-            import asyncio
-            loop = asyncio.get_event_loop()
-            
             def _query():
                 # Normalize query vector
                 query_array = np.array(query_vector, dtype=np.float32).reshape(1, -1)
@@ -363,7 +353,7 @@ class FAISSVectorDB(VectorDBService):
                 matches.sort(key=lambda x: x["score"], reverse=True)
                 return matches[:top_k]
             
-            return await loop.run_in_executor(None, _query)
+            return await asyncio.to_thread(_query)
         
         except Exception as e:
             logger.error(f"Failed to query FAISS: {e}", extra={"error": str(e)})
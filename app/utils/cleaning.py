@@ -1,5 +1,6 @@
 """Utility functions for data cleaning and normalization."""
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 
@@ -86,8 +87,13 @@ def normalize_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Already clean (single spaces only, no edge whitespace): skip rebuilding the string.
+    # Any whitespace other than a plain space is non-printable, so this is exact.
+    if text.isprintable() and "  " not in text and text[0] != " " and text[-1] != " ":
+        return text
+    
+    # Remove extra whitespace (str.split() uses the same whitespace set as the regex \s)
+    text = " ".join(text.split())
     
     return text if text else None
 
@@ -330,6 +336,12 @@ SKILL_ALIAS_MAP = {
 }
 
 
+# Position of each alias in SKILL_ALIAS_MAP; when several aliases prefix a skill,
+# the one listed first wins (same as scanning the map in order)
+_SKILL_ALIAS_RANK = {alias: rank for rank, alias in enumerate(SKILL_ALIAS_MAP)}
+
+
+@lru_cache(maxsize=4096)
 def normalize_skill(skill: str) -> str:
     """
     Normalize a skill name to its canonical form using alias mapping.
@@ -349,27 +361,26 @@ def normalize_skill(skill: str) -> str:
     if not skill:
         return ""
     
-    # Normalize to lowercase and strip whitespace
-    skill_lower = skill.lower().strip()
-    
-    # Remove extra whitespace
-    skill_lower = re.sub(r'\s+', ' ', skill_lower)
+    # Normalize to lowercase, strip and collapse whitespace
+    skill_lower = " ".join(skill.lower().split())
     
     # Check if skill has a direct alias mapping
-    if skill_lower in SKILL_ALIAS_MAP:
-        return SKILL_ALIAS_MAP[skill_lower]
-    
-    # Try to match partial patterns (e.g., "react.js" should match "react.js" key)
-    # This handles cases where the skill might have extra characters
-    for alias, canonical in SKILL_ALIAS_MAP.items():
-        # Exact match (already handled above)
-        if skill_lower == alias:
-            return canonical
-        
-        # Check if skill contains the alias as a word boundary
-        # e.g., "react.js" should match "react.js" key
-        if skill_lower == alias or skill_lower.startswith(alias + ".") or skill_lower.startswith(alias + " "):
-            return canonical
+    canonical = SKILL_ALIAS_MAP.get(skill_lower)
+    if canonical is not None:
+        return canonical
+    
+    # Match aliases followed by "." or " " (e.g. "java 8" → "java") by looking up each
+    # prefix that ends at a separator instead of scanning every alias
+    best_alias = None
+    for i, ch in enumerate(skill_lower):
+        if ch == "." or ch == " ":
+            prefix = skill_lower[:i]
+            if prefix in _SKILL_ALIAS_RANK and (
+                best_alias is None or _SKILL_ALIAS_RANK[prefix] < _SKILL_ALIAS_RANK[best_alias]
+            ):
+                best_alias = prefix
+    if best_alias is not None:
+        return SKILL_ALIAS_MAP[best_alias]
     
     # If no alias found, return normalized skill as-is
     return skill_lower
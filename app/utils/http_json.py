@@ -0,0 +1,51 @@
+"""Streaming JSON POST helper for OLLAMA HTTP calls."""
+from typing import Any, Dict, List, Sequence, Union
+import httpx
+import numpy as np
+import orjson
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def as_float_list(values: Union[np.ndarray, Sequence[float]]) -> List[float]:
+    """
+    Convert an embedding to a plain list for clients that serialize payloads themselves.
+    
+    Embeddings stay float32 ndarrays inside the app; this is only called at the
+    SDK boundary (e.g. Pinecone), where a list is required.
+    """
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return values
+
+
+async def post_json(client: httpx.AsyncClient, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    POST a JSON payload and decode the JSON response.
+    
+    The body is streamed into a single buffer and parsed with orjson, so the raw
+    bytes are not kept on the response object alongside the decoded result.
+    
+    Args:
+        client: Shared or per-request AsyncClient
+        url: Target URL
+        payload: JSON-serializable request body (ndarrays are serialized natively)
+    
+    Returns:
+        Decoded JSON response
+    
+    Raises:
+        httpx.HTTPStatusError: For 4xx/5xx responses (body is read so callers can inspect it)
+    """
+    async with client.stream("POST", url, content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), headers=JSON_HEADERS) as response:
+        if response.is_error:
+            await response.aread()
+            response.raise_for_status()
+        
+        body = bytearray()
+        async for part in response.aiter_bytes():
+            body.extend(part)
+    
+    result = orjson.loads(body)
+    del body
+    return result
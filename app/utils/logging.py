@@ -1,15 +1,18 @@
 """Structured logging configuration."""
-import json
 import logging
 import sys
 from typing import Any, Dict
 from datetime import datetime
+import orjson
 
 from app.config import settings
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for structured logging."""
+    """JSON formatter for structured logging (serialized with orjson)."""
+    
+    # numpy values (e.g. scores, embeddings) serialize natively; anything else falls back to str()
+    ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
     
     # Reserved LogRecord attributes that cannot be overwritten
     RESERVED_ATTRS = {
@@ -42,7 +45,7 @@ class JSONFormatter(logging.Formatter):
             if key not in self.RESERVED_ATTRS:
                 log_data[key] = value
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=self.ORJSON_OPTIONS).decode()
 
 
 def setup_logging() -> None: